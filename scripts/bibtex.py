@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Streaming BibTeX reader and the normalization rules the bib skills use.
+
+iter_blocks() reads a .bib file chunk by chunk and yields one Block per
+@entry (plus @string/@preamble/@comment and the text between entries),
+keeping each block's original text so files can be rewritten without
+touching the encoding or formatting of entries that did not change.
+
+Normalization follows skills/clean-bib/SKILL.md: titles are lowercased with
+braces stripped and whitespace collapsed; authors reduce to lowercase last
+names; LaTeX accents ({\\"o}, \\'{e}, ...) are folded for comparison only.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+ENTRY_START_RE = re.compile(r"@[ \t]*([A-Za-z]+)[ \t\r\n]*([{(])")
+# An entry that has not closed by the next @type{ at the start of a line is
+# broken; like BibTeX, report it and resume parsing at that @
+NEXT_ENTRY_RE = re.compile(r"^[ \t]*@[ \t]*[A-Za-z]+[ \t\r\n]*[{(]", re.MULTILINE)
+NON_ENTRY_TYPES = {"string", "preamble", "comment"}
+FIELD_NAME_RE = re.compile(r"\s*([A-Za-z][\w:.+/-]*)\s*=\s*")
+BARE_VALUE_RE = re.compile(r"[\w:.+/-]+")
+# Accent commands that only decorate the next letter: \"o, \'{e}, \c{c}, ...
+LATEX_ACCENT_RE = re.compile(r"""\\(?:["'`^~=.]|[cvHuurdbtk](?![A-Za-z]))\s*\{?\s*([A-Za-z])\s*\}?""")
+LATEX_LETTERS = {
+    "ss": "ss", "o": "o", "O": "O", "aa": "a", "AA": "A", "ae": "ae", "AE": "AE",
+    "oe": "oe", "OE": "OE", "l": "l", "L": "L", "i": "i", "j": "j",
+}
+LATEX_LETTER_RE = re.compile(r"\\(" + "|".join(sorted(LATEX_LETTERS, key=len, reverse=True)) + r")(?![A-Za-z])")
+LATEX_COMMAND_RE = re.compile(r"\\[A-Za-z]+\s*|\\.")
+BRACE_RE = re.compile(r"[{}]")
+# \" is an accent (M\"uller), not the end of a quoted value
+PAREN_ENTRY_RE = re.compile(r'[{})]|(?<!\\)"')
+
+
+@dataclass
+class Block:
+    """One top-level piece of a .bib file.
+
+    kind is "entry", "string", "preamble", "comment" or "text" (whatever
+    sits between entries). For entries, fields maps lowercase field names
+    to their values without the outer delimiters, and spans maps them to
+    the (start, end) offsets of the value (delimiters included) in raw.
+    """
+
+    kind: str
+    raw: str
+    line: int
+    entry_type: str = ""
+    key: str = ""
+    fields: dict[str, str] = field(default_factory=dict)
+    spans: dict[str, tuple[int, int]] = field(default_factory=dict)
+    error: str | None = None
+
+    def replace_field(self, name: str, value: str) -> str:
+        """raw with one field's value replaced (braced), leaving the rest untouched."""
+        start, end = self.spans[name]
+        return f"{self.raw[:start]}{{{value}}}{self.raw[end:]}"
+
+    def with_field(self, name: str, value: str) -> str:
+        """raw with a field appended as the last one, indented like the others."""
+        body, closer = self.raw[:-1].rstrip(), self.raw[-1]
+        m = re.search(r"\n([ \t]+)[A-Za-z]", self.raw)
+        indent = m.group(1) if m else "  "
+        sep = "" if body.endswith(",") else ","
+        return f"{body}{sep}\n{indent}{name} = {{{value}}}\n{closer}"
+
+
+def _match_close(text: str, pos: int, opener: str, endpos: int | None = None) -> int | None:
+    """Index just past the delimiter closing an entry opened before pos, or
+    None if text (or text[:endpos]) ends first. Braces must balance (BibTeX
+    itself requires it, even inside quoted values); in (...) entries a ")"
+    inside a quoted value does not close the entry."""
+    depth = 0
+    if endpos is None:
+        endpos = len(text)
+    if opener == "{":
+        for m in BRACE_RE.finditer(text, pos, endpos):
+            if m.group() == "{":
+                depth += 1
+            elif depth == 0:
+                return m.end()
+            else:
+                depth -= 1
+        return None
+    in_quote = False
+    for m in PAREN_ENTRY_RE.finditer(text, pos, endpos):
+        ch = m.group()
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            if ch == '"':
+                in_quote = not in_quote
+            elif not in_quote:
+                return m.end()
+    return None
+
+
+def _parse_value(body: str, pos: int) -> tuple[str, int]:
+    """Parse one field value (pieces joined by #) starting at pos.
+
+    Returns (value without outer delimiters, end offset).
+    """
+    parts = []
+    n = len(body)
+    while True:
+        while pos < n and body[pos].isspace():
+            pos += 1
+        if pos >= n:
+            break
+        ch = body[pos]
+        if ch == "{":
+            end = _match_close(body, pos + 1, "{")
+            if end is None:
+                raise ValueError("unbalanced braces in field value")
+            parts.append(body[pos + 1:end - 1])
+            pos = end
+        elif ch == '"':
+            depth = 0
+            i = pos + 1
+            while i < n:
+                c = body[i]
+                if c == "{":
+                    depth += 1
+                elif c == "}":
+                    depth -= 1
+                elif c == '"' and depth == 0 and body[i - 1] != "\\":
+                    break
+                i += 1
+            if i >= n:
+                raise ValueError("unterminated quoted field value")
+            parts.append(body[pos + 1:i])
+            pos = i + 1
+        else:
+            m = BARE_VALUE_RE.match(body, pos)
+            if not m:
+                raise ValueError(f"unexpected {ch!r} in field value")
+            parts.append(m.group())
+            pos = m.end()
+        while pos < n and body[pos].isspace():
+            pos += 1
+        if pos < n and body[pos] == "#":
+            pos += 1
+            continue
+        break
+    return "".join(parts), pos
+
+
+def parse_entry(raw: str, line: int) -> Block:
+    """Parse the text of one @type{key, field = value, ...} block."""
+    m = ENTRY_START_RE.match(raw)
+    entry_type = m.group(1).lower()
+    if entry_type in NON_ENTRY_TYPES:
+        return Block(kind=entry_type, raw=raw, line=line, entry_type=entry_type)
+
+    block = Block(kind="entry", raw=raw, line=line, entry_type=entry_type)
+    body_end = len(raw) - 1  # the closing delimiter
+    pos = m.end()
+    comma = raw.find(",", pos, body_end)
+    if comma == -1:
+        block.key = raw[pos:body_end].strip()
+        return block
+    block.key = raw[pos:comma].strip()
+    pos = comma + 1
+    try:
+        while pos < body_end:
+            fm = FIELD_NAME_RE.match(raw, pos)
+            if not fm:
+                if raw[pos:body_end].strip(" \t\r\n,"):
+                    raise ValueError(f"cannot parse field near {raw[pos:pos + 30]!r}")
+                break
+            name = fm.group(1).lower()
+            start = fm.end()
+            value, end = _parse_value(raw[:body_end], start)
+            block.fields[name] = value
+            block.spans[name] = (start, len(raw[:end].rstrip()))
+            pos = end
+            if pos < body_end and raw[pos] == ",":
+                pos += 1
+    except ValueError as e:
+        block.error = f"{block.key or '?'} (line {line}): {e}"
+    return block
+
+
+def iter_blocks(fp, chunk_size: int = 1 << 20):
+    """Yield the Blocks of a .bib file object in order, reading it in chunks."""
+    buf = ""
+    pos = 0  # start of the unconsumed part of buf
+    line = 1
+    eof = False
+    while True:
+        m = ENTRY_START_RE.search(buf, pos)
+        nxt = NEXT_ENTRY_RE.search(buf, m.end()) if m else None
+        end = _match_close(buf, m.end(), m.group(2), nxt.start() if nxt else None) if m else None
+        if end is None and nxt is None and not eof:
+            chunk = fp.read(chunk_size)
+            if chunk:
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            eof = True
+            continue
+        if m is None:
+            if buf[pos:]:
+                yield Block(kind="text", raw=buf[pos:], line=line)
+            return
+        if m.start() > pos:
+            yield Block(kind="text", raw=buf[pos:m.start()], line=line)
+            line += buf.count("\n", pos, m.start())
+        if end is None:
+            # Not closed before the next entry (or the end of the file)
+            stop = nxt.start() if nxt else len(buf)
+            block = Block(kind="entry", raw=buf[m.start():stop], line=line)
+            block.key = buf[m.end():stop].split(",", 1)[0].strip()
+            block.error = f"{block.key or '?'} (line {line}): entry is not closed"
+            yield block
+            if nxt is None:
+                return
+            line += block.raw.count("\n")
+            pos = stop
+            continue
+        raw = buf[m.start():end]
+        yield parse_entry(raw, line)
+        line += raw.count("\n")
+        pos = end
+
+
+def fold_latex(text: str) -> str:
+    """Plain-ASCII approximation of a LaTeX string, for comparisons only."""
+    text = LATEX_ACCENT_RE.sub(r"\1", text)
+    text = LATEX_LETTER_RE.sub(lambda m: LATEX_LETTERS[m.group(1)], text)
+    text = LATEX_COMMAND_RE.sub(" ", text)
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, braces and accents stripped, punctuation dropped, whitespace collapsed."""
+    text = fold_latex(title).replace("{", "").replace("}", "").lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def split_authors(authors: str) -> list[str]:
+    """Split an author field on 'and' outside braces."""
+    names, depth, start = [], 0, 0
+    for m in re.finditer(r"[{}]|\s+and\s+", authors, re.IGNORECASE):
+        tok = m.group()
+        if tok == "{":
+            depth += 1
+        elif tok == "}":
+            depth -= 1
+        elif depth == 0:
+            names.append(authors[start:m.start()])
+            start = m.end()
+    names.append(authors[start:])
+    return [n.strip() for n in names if n.strip()]
+
+
+def last_name(author: str) -> str:
+    """Normalized last name of one author ('Last, First' or 'First Last');
+    a fully braced corporate name is kept whole."""
+    author = author.strip()
+    if author.startswith("{") and author.endswith("}"):
+        name = author[1:-1]
+    elif "," in author:
+        name = author.split(",", 1)[0]
+    else:
+        name = author.split()[-1] if author.split() else ""
+    return normalize_title(name)
+
+
+def author_last_names(authors: str) -> list[str]:
+    return [n for n in (last_name(a) for a in split_authors(authors)) if n]
+
+
+def year_of(block: Block) -> int | None:
+    m = re.search(r"\d{4}", block.fields.get("year", ""))
+    return int(m.group()) if m else None
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Deduplicate a .bib file locally and report what the clean-bib skill needs to review.
+
+Applies the clean-bib rules without an agent reading the whole file:
+
+- exact duplicates: same normalized first-author last name and title, found
+  with a hash index in one pass; the latest year wins, then the entry with
+  the most filled fields, then the first one
+- journal names: a leading "The " is stripped
+- upgrade candidates: working papers, forthcoming entries and incomplete
+  old articles, for the online lookup phase
+- with --near, titles that differ slightly (MinHash/LSH over character
+  trigrams, checked with exact Jaccard) and share an author; these are only
+  reported, since they need a human decision
+
+Usage:
+    python clean_bib.py refs.bib [--output refs.dedup.bib] [--report refs.report.json] [--near]
+
+The input file is never modified. The deduped .bib keeps every surviving
+entry byte for byte apart from journal fixes.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from bibtex import author_last_names, iter_blocks, normalize_title, year_of
+
+UPGRADE_TYPES = {"unpublished", "techreport", "misc"}
+UPGRADE_WORDS_RE = re.compile(r"forthcoming|accepted|in press|working paper", re.IGNORECASE)
+SERIES_RE = re.compile(r"NBER Working Paper|CEPR Discussion Paper|Discussion Paper|Working Paper Series", re.IGNORECASE)
+LEADING_THE_RE = re.compile(r"^(\s*\{?)the\s+", re.IGNORECASE)
+MINHASH_PERMUTATIONS = 32
+LSH_BANDS = 8  # 8 bands x 4 rows: pairs above ~0.6 Jaccard almost always collide
+MERSENNE = (1 << 61) - 1
+
+
+def _completeness(fields: dict[str, str]) -> int:
+    return sum(1 for v in fields.values() if v.strip())
+
+
+def upgrade_reasons(entry, this_year: int) -> list[str]:
+    reasons = []
+    if entry.entry_type in UPGRADE_TYPES:
+        reasons.append(f"type @{entry.entry_type}")
+    for name, value in entry.fields.items():
+        if name != "abstract" and UPGRADE_WORDS_RE.search(value):
+            reasons.append(f"{name} mentions {UPGRADE_WORDS_RE.search(value).group().lower()!r}")
+            break
+    year = year_of(entry)
+    if (
+        entry.entry_type == "article"
+        and not (entry.fields.get("volume") and entry.fields.get("pages"))
+        and year is not None
+        and this_year - year >= 2
+    ):
+        reasons.append("article without volume/pages, 2+ years old")
+    for name in ("note", "series"):
+        if SERIES_RE.search(entry.fields.get(name, "")):
+            reasons.append(f"{name} is a working paper series")
+            break
+    return reasons
+
+
+def _shingles(title: str) -> set[str]:
+    padded = f" {title} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MinHasher:
+    """MinHash signatures with per-shingle hash vectors cached, since the
+    same trigrams recur across most titles."""
+
+    def __init__(self, permutations: int = MINHASH_PERMUTATIONS, seed: int = 1):
+        rng = hashlib.sha256(str(seed).encode()).digest()
+        coeffs = []
+        while len(coeffs) < 2 * permutations:
+            rng = hashlib.sha256(rng).digest()
+            coeffs.extend(int.from_bytes(rng[i:i + 8], "little") % MERSENNE for i in range(0, 32, 8))
+        self.a = coeffs[:permutations]
+        self.b = coeffs[permutations:2 * permutations]
+        self._cache: dict[str, tuple[int, ...]] = {}
+
+    def _vector(self, shingle: str) -> tuple[int, ...]:
+        vec = self._cache.get(shingle)
+        if vec is None:
+            x = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+            vec = tuple((a * x + b) % MERSENNE for a, b in zip(self.a, self.b))
+            self._cache[shingle] = vec
+        return vec
+
+    def signature(self, shingles: set[str]) -> tuple[int, ...]:
+        return tuple(map(min, zip(*(self._vector(s) for s in shingles))))
+
+
+def near_duplicates(records: list[dict], threshold: float, exclude: set[int]) -> list[dict]:
+    """Pairs of entries whose titles have Jaccard similarity >= threshold
+    (on character trigrams) and that share at least one author last name."""
+    hasher = MinHasher()
+    rows = MINHASH_PERMUTATIONS // LSH_BANDS
+    buckets: dict[tuple, list[int]] = {}
+    shingles = {}
+    for i, rec in enumerate(records):
+        if i in exclude or not rec["title"]:
+            continue
+        shingles[i] = _shingles(rec["title"])
+        sig = hasher.signature(shingles[i])
+        for band in range(LSH_BANDS):
+            buckets.setdefault((band, sig[band * rows:(band + 1) * rows]), []).append(i)
+
+    seen = set()
+    pairs = []
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, j = members[x], members[y]
+                if (i, j) in seen:
+                    continue
+                seen.add((i, j))
+                a, b = records[i], records[j]
+                if a["title"] == b["title"] and a["first_author"] == b["first_author"]:
+                    continue  # exact duplicates are handled elsewhere
+                if not set(a["authors"]) & set(b["authors"]):
+                    continue
+                sim = len(shingles[i] & shingles[j]) / len(shingles[i] | shingles[j])
+                if sim >= threshold:
+                    pairs.append({
+                        "a": a["key"], "b": b["key"], "similarity": round(sim, 3),
+                        "title_a": a["raw_title"], "title_b": b["raw_title"],
+                        "year_a": a["year"], "year_b": b["year"],
+                    })
+    pairs.sort(key=lambda p: -p["similarity"])
+    return pairs
+
+
+def analyze(bib_path: Path, near: bool = False, near_threshold: float = 0.8) -> dict:
+    """First pass: index every entry and decide what to drop and fix."""
+    this_year = date.today().year
+    records = []
+    by_identity: dict[tuple[str, str], list[int]] = {}
+    by_key: dict[str, list[int]] = {}
+    parse_errors = []
+    journals = []
+    upgrades = []
+
+    with open(bib_path, encoding="utf-8", errors="surrogateescape") as fp:
+        for block in iter_blocks(fp):
+            if block.error:
+                parse_errors.append(block.error)
+            if block.kind != "entry" or block.error:
+                continue
+            authors = author_last_names(block.fields.get("author", "") or block.fields.get("editor", ""))
+            rec = {
+                "key": block.key,
+                "type": block.entry_type,
+                "raw_title": block.fields.get("title", ""),
+                "title": normalize_title(block.fields.get("title", "")),
+                "authors": authors,
+                "first_author": authors[0] if authors else "",
+                "year": year_of(block),
+                "completeness": _completeness(block.fields),
+                "line": block.line,
+            }
+            idx = len(records)
+            records.append(rec)
+            by_key.setdefault(block.key, []).append(idx)
+            if rec["title"]:
+                by_identity.setdefault((rec["first_author"], rec["title"]), []).append(idx)
+
+            journal = block.fields.get("journal", "")
+            if LEADING_THE_RE.match(journal):
+                journals.append((idx, {"key": block.key, "old": journal, "new": LEADING_THE_RE.sub(r"\1", journal, count=1)}))
+            reasons = upgrade_reasons(block, this_year)
+            if reasons:
+                upgrades.append((idx, {"key": block.key, "type": block.entry_type, "reasons": reasons}))
+
+    duplicates = []
+    removed: set[int] = set()
+    for group in by_identity.values():
+        if len(group) < 2:
+            continue
+        # Latest year, then most complete, then earliest in the file
+        keep = max(group, key=lambda i: (records[i]["year"] or 0, records[i]["completeness"], -i))
+        for i in group:
+            if i == keep:
+                continue
+            removed.add(i)
+            newer = (records[keep]["year"] or 0) > (records[i]["year"] or 0)
+            duplicates.append({
+                "removed": records[i]["key"],
+                "kept": records[keep]["key"],
+                "title": records[i]["raw_title"][:80],
+                "reason": "Same paper, newer year" if newer else "Same paper, more complete metadata",
+            })
+
+    return {
+        "file": str(bib_path),
+        "entries": len(records),
+        "duplicates": duplicates,
+        "near_duplicates": near_duplicates(records, near_threshold, removed) if near else [],
+        "duplicate_keys": sorted(k for k, idx in by_key.items() if len(idx) > 1),
+        # Only entries that survive dedup are cleaned or worth upgrading
+        "journal_names_cleaned": [j for i, j in journals if i not in removed],
+        "upgrade_candidates": [u for i, u in upgrades if i not in removed],
+        "parse_errors": parse_errors,
+        "_removed": removed,
+    }
+
+
+def write_clean(bib_path: Path, output: Path, removed: set[int]) -> None:
+    """Second pass: stream the file again, dropping removed entries and
+    stripping a leading "The " from journal names."""
+    idx = -1
+    tmp = output.with_name(output.name + ".tmp")
+    with open(bib_path, encoding="utf-8", errors="surrogateescape") as fp, \
+            open(tmp, "w", encoding="utf-8", errors="surrogateescape") as out:
+        skip_gap = False
+        for block in iter_blocks(fp):
+            if block.kind != "entry" or block.error:
+                # Drop the blank lines that separated a removed entry
+                out.write(block.raw.lstrip("\r\n") if skip_gap and block.kind == "text" else block.raw)
+                skip_gap = False
+                continue
+            idx += 1
+            if idx in removed:
+                skip_gap = True
+                continue
+            skip_gap = False
+            journal = block.fields.get("journal", "")
+            if LEADING_THE_RE.match(journal):
+                out.write(block.replace_field("journal", LEADING_THE_RE.sub(r"\1", journal, count=1)))
+            else:
+                out.write(block.raw)
+    tmp.replace(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deduplicate a BibTeX file and report entries needing review")
+    parser.add_argument("bib", type=Path, help="Input .bib file (not modified)")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Deduped .bib (default: <name>.dedup.bib)")
+    parser.add_argument("--report", type=Path, default=None, help="JSON report (default: <name>.report.json)")
+    parser.add_argument("--near", action="store_true", help="Also report near-duplicate titles (MinHash/LSH)")
+    parser.add_argument("--near-threshold", type=float, default=0.8, help="Title trigram Jaccard for --near (default: 0.8)")
+    args = parser.parse_args()
+
+    if not args.bib.is_file():
+        print(f"ERROR: File not found: {args.bib}", file=sys.stderr)
+        sys.exit(1)
+    output = args.output or args.bib.with_suffix(".dedup.bib")
+    report_path = args.report or args.bib.with_suffix(".report.json")
+
+    report = analyze(args.bib, args.near, args.near_threshold)
+    write_clean(args.bib, output, report.pop("_removed"))
+    report["output"] = str(output)
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+
+    print(
+        f"{report['entries']} entries, {len(report['duplicates'])} duplicates removed, "
+        f"{len(report['journal_names_cleaned'])} journal names cleaned, "
+        f"{len(report['upgrade_candidates'])} upgrade candidates, "
+        f"{len(report['near_duplicates'])} near-duplicates to review, "
+        f"{len(report['parse_errors'])} parse errors",
+        file=sys.stderr,
+    )
+    print(report_path)
+
+
+if __name__ == "__main__":
+    main()
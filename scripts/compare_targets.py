@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""Compare replication outputs against the gold-standard numbers in targets/.
+
+Target files are the CSVs written in Phase 1 of a replication
+(rules/replication-guidelines.md): Demographic and Characteristic label
+columns followed by numeric columns such as Share_2018. Outputs can be:
+
+- CSV or tab-delimited text (Stata export delimited / outsheet / esttab,
+  including esttab's ="..." quoting)
+- LaTeX tables (the tabular body; \\multirow, \\multicolumn and section
+  rows that set the Demographic for the rows below are understood)
+
+Rows are aligned on the normalized (Demographic, Characteristic) key, or on
+Characteristic alone when the output has no Demographic labels and the name
+is unique. Columns are aligned by name, then by the years in the name, then
+by position. Every aligned cell of every table is checked in one vectorized
+pass (numpy when installed, plain Python otherwise).
+
+A cell matches when |output - target| <= max(abs-tol, rel-tol * |target|,
+half a unit of the target's last printed digit), so 12.3 matches a
+published 12 unless --no-rounding is given.
+
+Usage:
+    python compare_targets.py output/ [--targets targets/] [--abs-tol 0.5] [--report report.json]
+    python compare_targets.py output/table2.tex --target targets/table2_targets.csv
+
+The JSON report goes to stdout (or --report), a one-line summary per table
+to stderr. Exits 1 if any target cell is missing or out of tolerance.
+"""
+
+import argparse
+import csv
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+OUTPUT_SUFFIXES = {".csv", ".tsv", ".txt", ".out", ".tab", ".tex"}
+TABLE_ID_RE = re.compile(r"(table|tab|figure|fig)[ _-]?(\d+[a-z]?)", re.IGNORECASE)
+YEAR_RE = re.compile(r"(?:19|20)\d\d")
+NUMBER_RE = re.compile(r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+MISSING_VALUES = {"", ".", "-", "--", "---", "na", "n/a", "nan"}
+
+TABULAR_RE = re.compile(r"\\begin\{(tabular\*?|tabularx|longtable)\}(.*?)\\end\{\1\}", re.DOTALL)
+TEX_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+TEX_RULE_RE = re.compile(
+    r"\\(?:hline|toprule|midrule|bottomrule|endhead|endfirsthead|endfoot|endlastfoot|addlinespace(?:\[[^\]]*\])?)"
+    r"|\\(?:cmidrule|cline)(?:\([^)]*\))?\{[^}]*\}"
+)
+TEX_ROW_END_RE = re.compile(r"\\\\(?:\s*\[[^\]]*\])?")
+TEX_CELL_SPLIT_RE = re.compile(r"(?<!\\)&")
+MULTICOLUMN_RE = re.compile(r"^\s*\\multicolumn\{(\d+)\}\{[^}]*\}\{(.*)\}\s*$", re.DOTALL)
+MULTIROW_RE = re.compile(r"\\multirow(?:\[[^\]]*\])?\{[^}]*\}(?:\[[^\]]*\])?\{[^}]*\}(?:\[[^\]]*\])?")
+TEX_COMMAND_RE = re.compile(r"\\[A-Za-z]+\*?(?:\[[^\]]*\])?")
+
+
+@dataclass
+class Table:
+    """Numeric cells keyed by normalized (demographic, characteristic).
+
+    labels keeps the original text of each key for reporting; decimals
+    holds the printed precision of each value (used for target rounding).
+    """
+
+    path: str
+    columns: list[str]
+    values: dict[tuple[str, str], list[float | None]] = field(default_factory=dict)
+    decimals: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+    labels: dict[tuple[str, str], tuple[str, str]] = field(default_factory=dict)
+
+
+def norm_label(text: str) -> str:
+    """Comparison form of a row or column label: "Asian \\& P.I." -> "asianandpi"."""
+    text = text.lower().replace("&", " and ")
+    return re.sub(r"[^a-z0-9]+", "", text)
+
+
+def clean_tex_cell(cell: str) -> str:
+    """Visible text of one LaTeX cell."""
+    cell = MULTIROW_RE.sub("", cell)
+    cell = cell.replace("\\&", "&").replace("\\%", "%").replace("$", "").replace("~", " ")
+    cell = cell.replace("--", "-").replace("\\textendash", "-")
+    cell = TEX_COMMAND_RE.sub("", cell)
+    cell = cell.replace("{", "").replace("}", "")
+    return " ".join(cell.split())
+
+
+def parse_number(text: str) -> tuple[float, int] | None:
+    """(value, decimals) for a numeric cell, or None if it is not a number.
+
+    Tolerates significance stars, %, thousands separators, a unicode minus
+    and esttab's ="..." quoting.
+    """
+    text = text.strip()
+    if text.startswith('="') and text.endswith('"'):
+        text = text[2:-1]
+    text = text.replace("\u2212", "-").replace(",", "").rstrip("*%").strip()
+    if not NUMBER_RE.match(text):
+        return None
+    decimals = len(text.split(".", 1)[1].split("e")[0].split("E")[0]) if "." in text else 0
+    return float(text), decimals
+
+
+def _is_missing(text: str) -> bool:
+    return text.strip().strip('="').lower() in MISSING_VALUES
+
+
+def _is_secondary(text: str) -> bool:
+    """Standard errors / t-stats printed under an estimate: (0.12), [2.3]."""
+    text = text.strip().strip('="')
+    return len(text) > 2 and text[0] in "([" and text[-1] in ")]"
+
+
+def read_delimited(path: Path) -> list[list[str]]:
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        text = f.read()
+    head = text[:4096]
+    delimiter = "\t" if head.count("\t") > head.count(",") else ","
+    rows = []
+    for row in csv.reader(text.splitlines(), delimiter=delimiter):
+        rows.append([c[2:-1] if c.startswith('="') and c.endswith('"') else c for c in row])
+    return rows
+
+
+def read_tex(path: Path) -> list[list[str]]:
+    text = path.read_text(encoding="utf-8", errors="replace")
+    text = TEX_COMMENT_RE.sub("", text)
+    m = TABULAR_RE.search(text)
+    if m:
+        body = m.group(2)
+        # Drop the column spec: {lcc} or {\linewidth}{lcc}
+        for _ in range(2 if m.group(1) in ("tabular*", "tabularx") else 1):
+            body = re.sub(r"^\s*\{(?:[^{}]|\{[^{}]*\})*\}", "", body, count=1)
+    else:
+        body = text  # a fragment (esttab ... fragment, or a bare \input body)
+    body = TEX_RULE_RE.sub("", body)
+    rows = []
+    for line in TEX_ROW_END_RE.split(body):
+        if not line.strip():
+            continue
+        cells = []
+        for cell in TEX_CELL_SPLIT_RE.split(line):
+            m = MULTICOLUMN_RE.match(cell)
+            if m:
+                cells.append(clean_tex_cell(m.group(2)))
+                cells.extend([""] * (int(m.group(1)) - 1))
+            else:
+                cells.append(clean_tex_cell(cell))
+        rows.append(cells)
+    return rows
+
+
+def read_rows(path: Path) -> list[list[str]]:
+    return read_tex(path) if path.suffix.lower() == ".tex" else read_delimited(path)
+
+
+def _label_count(row: list[str]) -> int:
+    """Number of leading label cells: everything before the first number,
+    missing-value marker or bracketed statistic. Blank cells count, since a
+    \\multirow leaves the Demographic cell empty."""
+    n = 0
+    while n < len(row):
+        cell = row[n]
+        if cell.strip() and (parse_number(cell) is not None or _is_missing(cell) or _is_secondary(cell)):
+            break
+        n += 1
+    # Labels may be followed by blank cells before the numbers
+    while n > 1 and not row[n - 1].strip():
+        n -= 1
+    return n
+
+
+def rows_to_table(rows: list[list[str]], path: str) -> Table:
+    """Turn raw cell rows into a Table.
+
+    Leading rows without numbers are headers (the last one names the
+    columns). In the body, the leading non-numeric cells of a row are its
+    labels: two labels are (Demographic, Characteristic), one is the
+    Characteristic under the current Demographic, which is set by rows
+    holding a single label and no numbers (section rows) and carried down
+    past blank first cells (\\multirow). Values are read by position,
+    starting at the label count most rows share.
+    """
+    header: list[str] = []
+    section = ""
+    data = []  # (demographic, characteristic, row, label count)
+    for row in rows:
+        nlabels = _label_count(row)
+        cells = row[nlabels:]
+        labels = row[:nlabels]
+        if not any(parse_number(c) is not None for c in cells):
+            filled = [c for c in row if c.strip()]
+            if not data:
+                if filled:
+                    header = row
+            elif len(filled) == 1 and row[0].strip():
+                section = row[0].strip()
+            continue
+        if all(_is_secondary(c) or _is_missing(c) for c in cells):
+            continue
+        if not data and not any(c.strip() for c in labels):
+            header = row  # unlabeled header of years: " & 1996 & 2007 & 2018"
+            continue
+        if len(labels) >= 2:
+            if labels[0].strip():
+                section = labels[0].strip()
+            char = labels[1].strip()
+        else:
+            char = labels[0].strip() if labels else ""
+        if char:
+            data.append((section, char, row, nlabels))
+
+    table = Table(path=path, columns=[])
+    if not data:
+        return table
+    counts: dict[int, int] = {}
+    for *_, nlabels in data:
+        counts[nlabels] = counts.get(nlabels, 0) + 1
+    start = max(counts, key=lambda n: (counts[n], -n))
+    width = max(len(row) for _, _, row, _ in data) - start
+    names = [h.strip() for h in header]
+    names = names if len(names) == width else names[start:start + width]
+    table.columns = names + [f"col{i + 1}" for i in range(len(names), width)]
+
+    for demographic, char, row, _ in data:
+        values, decimals = [], []
+        for cell in row[start:start + width] + [""] * (start + width - len(row)):
+            parsed = parse_number(cell)
+            values.append(parsed[0] if parsed else None)
+            decimals.append(parsed[1] if parsed else 0)
+        key = (norm_label(demographic), norm_label(char))
+        table.values[key] = values
+        table.decimals[key] = decimals
+        table.labels[key] = (demographic, char)
+    return table
+
+
+def load_table(path: Path) -> Table:
+    return rows_to_table(read_rows(path), str(path))
+
+
+def align_columns(target: list[str], output: list[str]) -> dict[int, int]:
+    """{target column index: output column index}."""
+    out_norm = [norm_label(c) for c in output]
+    out_years = [tuple(YEAR_RE.findall(c)) for c in output]
+    mapping: dict[int, int] = {}
+    used: set[int] = set()
+
+    def unique(candidates):
+        free = [j for j in candidates if j not in used]
+        return free[0] if len(free) == 1 else None
+
+    for i, name in enumerate(target):
+        n = norm_label(name)
+        j = unique([k for k, o in enumerate(out_norm) if o == n])
+        if j is None:
+            years = tuple(YEAR_RE.findall(name))
+            if years:
+                j = unique([k for k, y in enumerate(out_years) if y == years])
+        if j is None and n:
+            j = unique([k for k, o in enumerate(out_norm) if o and (n.startswith(o) or o.startswith(n))])
+        if j is not None:
+            mapping[i] = j
+            used.add(j)
+    if len(mapping) < len(target) and len(target) == len(output):
+        # Positional fallback for unlabeled or renamed columns
+        for i in range(len(target)):
+            if i not in mapping and i not in used:
+                mapping[i] = i
+                used.add(i)
+    return mapping
+
+
+def align_rows(target: Table, output: Table) -> dict[tuple[str, str], tuple[str, str]]:
+    """{target key: output key}, by full key or by a unique characteristic."""
+    by_char: dict[str, list[tuple[str, str]]] = {}
+    for key in output.values:
+        by_char.setdefault(key[1], []).append(key)
+    mapping = {}
+    for key in target.values:
+        if key in output.values:
+            mapping[key] = key
+        elif len(by_char.get(key[1], [])) == 1:
+            mapping[key] = by_char[key[1]][0]
+    return mapping
+
+
+def deviations(targets: list[float], outputs: list[float], tolerances: list[float]):
+    """(abs diffs, rel diffs, out-of-tolerance flags) for flat cell arrays.
+
+    Missing outputs are NaN and always flagged.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        abs_diff = [abs(o - t) for o, t in zip(outputs, targets)]
+        rel_diff = [d / abs(t) if t else (0.0 if d == 0 else math.inf) for d, t in zip(abs_diff, targets)]
+        bad = [not d <= tol for d, tol in zip(abs_diff, tolerances)]
+        return abs_diff, rel_diff, bad
+    t = np.asarray(targets, dtype=float)
+    o = np.asarray(outputs, dtype=float)
+    abs_diff = np.abs(o - t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel_diff = np.where(t != 0, abs_diff / np.abs(t), np.where(abs_diff == 0, 0.0, np.inf))
+    bad = ~(abs_diff <= np.asarray(tolerances, dtype=float))
+    return abs_diff.tolist(), rel_diff.tolist(), bad.tolist()
+
+
+def _json_number(x: float) -> float | None:
+    return None if x is None or math.isnan(x) or math.isinf(x) else round(x, 6)
+
+
+def compare(pairs: list[tuple[Table, Table]], abs_tol: float, rel_tol: float, rounding: bool = True,
+            scale: float = 1.0) -> list[dict]:
+    """Compare each (output, target) pair; all cells go through one deviations() call."""
+    results = []
+    cells = []  # (result index, target key, column name)
+    targets, outputs, tolerances = [], [], []
+    for output, target in pairs:
+        col_map = align_columns(target.columns, output.columns)
+        row_map = align_rows(target, output)
+        result = {
+            "output": output.path,
+            "target": target.path,
+            "cells": 0,
+            "mismatches": [],
+            "missing_rows": [" / ".join(target.labels[k]) for k in target.values if k not in row_map],
+            "missing_columns": [c for i, c in enumerate(target.columns) if i not in col_map],
+            "extra_rows": [" / ".join(output.labels[k]) for k in output.values if k not in set(row_map.values())],
+        }
+        for key, out_key in row_map.items():
+            out_row = output.values[out_key]
+            for i, j in col_map.items():
+                t = target.values[key][i] if i < len(target.values[key]) else None
+                if t is None:
+                    continue
+                o = out_row[j] if j < len(out_row) else None
+                half_unit = 0.5 * 10 ** -target.decimals[key][i] if rounding else 0.0
+                cells.append((len(results), key, target.columns[i]))
+                targets.append(t)
+                outputs.append(math.nan if o is None else o * scale)
+                # Slack for binary float error at the rounding boundary
+                tolerances.append(max(abs_tol, rel_tol * abs(t), half_unit) * (1 + 1e-9))
+        results.append(result)
+
+    abs_diff, rel_diff, bad = deviations(targets, outputs, tolerances)
+    max_diff = [0.0] * len(results)
+    for n, (r, key, column) in enumerate(cells):
+        result = results[r]
+        result["cells"] += 1
+        if not math.isnan(abs_diff[n]):
+            max_diff[r] = max(max_diff[r], abs_diff[n])
+        if bad[n]:
+            demographic, characteristic = pairs[r][1].labels[key]
+            result["mismatches"].append({
+                "demographic": demographic,
+                "characteristic": characteristic,
+                "column": column,
+                "target": targets[n],
+                "output": _json_number(outputs[n]),
+                "abs_diff": _json_number(abs_diff[n]),
+                "rel_diff": _json_number(rel_diff[n]),
+            })
+    for result, m in zip(results, max_diff):
+        result["max_abs_diff"] = round(m, 6)
+        result["ok"] = not (result["mismatches"] or result["missing_rows"] or result["missing_columns"])
+    return results
+
+
+def find_targets_dir(path: Path) -> Path | None:
+    """The nearest targets/ directory at or above path's directory."""
+    for parent in path.resolve().parents:
+        if (parent / "targets").is_dir():
+            return parent / "targets"
+    return None
+
+
+def target_for(output: Path, targets_dir: Path | None) -> Path | None:
+    """targets/table2_targets.csv for output/table2*.{csv,tex,...}."""
+    m = TABLE_ID_RE.search(output.stem)
+    targets_dir = targets_dir or find_targets_dir(output)
+    if not m or targets_dir is None:
+        return None
+    kind = "table" if m.group(1).lower().startswith("tab") else "figure"
+    candidate = targets_dir / f"{kind}{m.group(2).lower()}_targets.csv"
+    return candidate if candidate.is_file() else None
+
+
+def collect_outputs(paths: list[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(
+                p for p in path.rglob("*")
+                if p.suffix.lower() in OUTPUT_SUFFIXES and not p.stem.endswith("_targets") and p.is_file()
+            ))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare replication outputs against targets/*.csv")
+    parser.add_argument("outputs", nargs="+", type=Path, help="Output tables (CSV, tab-delimited, LaTeX) or directories")
+    parser.add_argument("--target", type=Path, default=None, help="Compare every output against this target file")
+    parser.add_argument("--targets", type=Path, default=None, help="Targets directory (default: nearest targets/ above each output)")
+    parser.add_argument("--abs-tol", type=float, default=0.0, help="Absolute tolerance (default: 0)")
+    parser.add_argument("--rel-tol", type=float, default=0.0, help="Relative tolerance, e.g. 0.01 for 1%% (default: 0)")
+    parser.add_argument("--no-rounding", action="store_true", help="Don't allow for the target's printed precision")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply outputs by this first (e.g. 100 for shares as fractions)")
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.target is not None and not args.target.is_file():
+        print(f"ERROR: Target not found: {args.target}", file=sys.stderr)
+        sys.exit(1)
+    missing = [str(p) for p in args.outputs if not p.exists()]
+    if missing:
+        print(f"ERROR: Not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    target_cache: dict[Path, Table] = {}
+    pairs = []
+    unmatched = []
+    for output in collect_outputs(args.outputs):
+        target_path = args.target or target_for(output, args.targets)
+        if target_path is None:
+            unmatched.append(str(output))
+            continue
+        if target_path not in target_cache:
+            target_cache[target_path] = load_table(target_path)
+        pairs.append((load_table(output), target_cache[target_path]))
+    for path in unmatched:
+        print(f"WARNING: No target for {path}", file=sys.stderr)
+
+    results = compare(pairs, args.abs_tol, args.rel_tol, not args.no_rounding, args.scale)
+    for r in results:
+        problems = []
+        if r["mismatches"]:
+            problems.append(f"{len(r['mismatches'])} out of tolerance")
+        if r["missing_rows"]:
+            problems.append(f"{len(r['missing_rows'])} rows missing")
+        if r["missing_columns"]:
+            problems.append(f"columns missing: {', '.join(r['missing_columns'])}")
+        status = "OK" if r["ok"] else "FAIL"
+        detail = f" ({'; '.join(problems)})" if problems else ""
+        print(f"{status} {r['output']}: {r['cells']} cells, max |diff| {r['max_abs_diff']:g}{detail}", file=sys.stderr)
+
+    failed = sum(1 for r in results if not r["ok"])
+    report = {
+        "summary": {
+            "tables": len(results),
+            "failed": failed,
+            "cells": sum(r["cells"] for r in results),
+            "mismatches": sum(len(r["mismatches"]) for r in results),
+            "abs_tol": args.abs_tol,
+            "rel_tol": args.rel_tol,
+            "rounding": not args.no_rounding,
+            "unmatched_outputs": unmatched,
+        },
+        "tables": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+    if args.report:
+        args.report.write_text(text)
+    else:
+        sys.stdout.write(text)
+    print(f"{len(results) - failed}/{len(results)} tables match their targets", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Link claude-core's shared agents, rules and skills into projects.
+
+Computes the set of symlinks every project should have once, then compares
+it with each project's .claude/ tree and only creates, repoints or removes
+what differs. Links that point into claude-core but whose source no longer
+exists are removed; local (non-symlink) files are never touched.
+
+Usage:
+    python link_projects.py <project> [<project> ...] [--dry-run] [--quiet]
+
+Example:
+    python link_projects.py ~/claude-workflows/paper-review ~/claude-workflows/empirical-research
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+CORE = Path(__file__).resolve().parent.parent
+
+# (directory under claude-core, directory under <project>/.claude), in
+# order; on a name clash the later source wins, as with ln -sf
+SOURCES = [
+    ("agents", "agents"),
+    ("rules", "rules"),
+    ("skills", "skills"),
+    ("beamer/agents/producer", "agents"),
+    ("beamer/agents/critic", "agents"),
+    ("beamer/agents/orchestrator", "agents"),
+    ("beamer/rules", "rules"),
+    ("beamer/skills", "skills"),
+]
+
+
+def desired_links(core: Path = CORE) -> dict[str, dict[str, str]]:
+    """{project subdir: {file name: absolute source path}} for every shared .md file."""
+    links: dict[str, dict[str, str]] = {}
+    for source_dir, target_dir in SOURCES:
+        wanted = links.setdefault(target_dir, {})
+        try:
+            entries = sorted(os.scandir(core / source_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            # Like the shell glob *.md, which skipped dotfiles
+            if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file():
+                if entry.name in wanted:
+                    print(f"WARNING: {entry.path} shadows {wanted[entry.name]}", file=sys.stderr)
+                wanted[entry.name] = entry.path
+    return links
+
+
+def plan_project(project: Path, links: dict[str, dict[str, str]], core: Path = CORE) -> list[tuple[str, Path, str | None]]:
+    """The changes one project needs, as (action, link path, source) tuples.
+
+    action is "create", "update" (symlink pointing elsewhere), "remove"
+    (stale link into claude-core) or "skip" (a local file is in the way).
+    """
+    core_prefix = str(core) + os.sep
+    plan = []
+    for subdir, wanted in links.items():
+        target_dir = project / ".claude" / subdir
+        existing: dict[str, os.DirEntry] = {}
+        try:
+            with os.scandir(target_dir) as it:
+                for entry in it:
+                    existing[entry.name] = entry
+        except FileNotFoundError:
+            pass
+
+        for name, source in wanted.items():
+            entry = existing.get(name)
+            path = target_dir / name
+            if entry is None:
+                plan.append(("create", path, source))
+            elif not entry.is_symlink():
+                plan.append(("skip", path, source))
+            elif os.readlink(entry.path) != source:
+                plan.append(("update", path, source))
+
+        for name, entry in existing.items():
+            if name in wanted or not entry.is_symlink():
+                continue
+            target = os.readlink(entry.path)
+            if not os.path.isabs(target):
+                target = os.path.normpath(os.path.join(target_dir, target))
+            if target.startswith(core_prefix) and not os.path.exists(target):
+                plan.append(("remove", target_dir / name, None))
+    return plan
+
+
+def apply_plan(plan: list[tuple[str, Path, str | None]]) -> None:
+    for action, path, source in plan:
+        if action == "create":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(source, path)
+        elif action == "update":
+            # Swap the link in atomically so the project never sees it missing
+            tmp = path.with_name(f".{path.name}.link-tmp")
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            os.symlink(source, tmp)
+            os.replace(tmp, path)
+        elif action == "remove":
+            os.unlink(path)
+
+
+LABELS = {"create": "LINKED", "update": "RELINKED", "remove": "REMOVED", "skip": "SKIP (local file)"}
+DRY_RUN_LABELS = {"create": "WOULD LINK", "update": "WOULD RELINK", "remove": "WOULD REMOVE", "skip": "SKIP (local file)"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Link claude-core shared files into one or more projects")
+    parser.add_argument("projects", nargs="+", help="Project directories (each gets a .claude/ tree)")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="Print the plan without changing anything")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Only print the per-project summary")
+    args = parser.parse_args()
+
+    links = desired_links()
+    failed = False
+    for project in args.projects:
+        project = Path(project).expanduser().resolve()
+        # A new project path is created, as link-to-project.sh did with mkdir -p
+        if project.exists() and not project.is_dir():
+            print(f"ERROR: Project is not a directory: {project}", file=sys.stderr)
+            failed = True
+            continue
+        plan = plan_project(project, links)
+        if not args.dry_run:
+            apply_plan(plan)
+        if not args.quiet:
+            labels = DRY_RUN_LABELS if args.dry_run else LABELS
+            for action, path, _ in plan:
+                print(f"{labels[action]}: {path}")
+        counts = {a: sum(1 for p in plan if p[0] == a) for a in LABELS}
+        print(
+            f"{project}: {counts['create']} linked, {counts['update']} relinked, "
+            f"{counts['remove']} removed, {counts['skip']} local"
+            f"{' (dry run)' if args.dry_run else ''}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Tokenized view of Stata do-files, shared by the Stata code scripts.
+
+iter_commands() turns a do-file into one Command per Stata command:
+comments (/* */ nested, //, ///, leading *) removed, /// continuations and
+#delimit ; blocks joined, prefixes (capture, quietly, by ...:) peeled off
+and the command name unabbreviated. Each command knows the loops and the
+program it sits in, so callers can reason about structure without
+re-parsing.
+
+This is a static approximation: anything built at run time (a command
+name stored in a macro, code generated by a loop over strings) is taken
+literally.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+
+# Comment and string boundaries; /// must come before //
+LEX_RE = re.compile(r'/\*|\*/|///|//|`"|"\'|"|\n|;')
+DELIMIT_RE = re.compile(r"#d(?:e(?:l(?:i(?:m(?:i(?:t)?)?)?)?)?)?\s*(;|cr)(?!\w)", re.IGNORECASE)
+WORD_RE = re.compile(r"[A-Za-z_][\w]*")
+LOCAL_REF_RE = re.compile(r"`(?:\+\+|--)?([A-Za-z_]\w*)(?:\+\+|--)?'")
+GLOBAL_REF_RE = re.compile(r"\$\{([A-Za-z_]\w*)\}|\$([A-Za-z_]\w*)")
+STRING_RE = re.compile(r'`"(?:[^"]|"(?!\'))*"\'|"[^"]*"')
+BY_PREFIX_RE = re.compile(r"(?:by|bys|byso|bysor|bysort)\s+[^:]*:\s*", re.IGNORECASE)
+PREFIX_RE = re.compile(
+    r"(?:cap|capt|captu|captur|capture|qui|quie|quiet|quietl|quietly|n|no|noi|nois|noisi|noisil|noisily"
+    r"|version\s+[\d.]+\s*:|frame\s+\w+\s*:|timer\s+on\s+\d+\s*:)(?=\s|\{|$)\s*",
+    re.IGNORECASE,
+)
+LOOP_COMMANDS = {"foreach", "forvalues", "while"}
+DOFILE_SUFFIXES = {".do", ".doh", ".ado"}
+
+
+def _abbreviations(spec: dict[str, int]) -> dict[str, str]:
+    """{abbreviation: full name} from {full name: shortest allowed length}."""
+    table = {}
+    for full, shortest in spec.items():
+        for n in range(shortest, len(full) + 1):
+            table.setdefault(full[:n], full)
+    return table
+
+
+COMMAND_NAMES = _abbreviations({
+    "generate": 1, "replace": 7, "egen": 4, "use": 3, "save": 2, "saveold": 5, "merge": 3,
+    "append": 3, "joinby": 6, "drop": 4, "keep": 4, "rename": 3, "local": 3, "global": 2,
+    "tempvar": 7, "tempname": 8, "tempfile": 8, "foreach": 7, "forvalues": 4, "while": 5,
+    "program": 3, "sort": 4, "gsort": 5, "preserve": 8, "restore": 7, "collapse": 8,
+    "reshape": 7, "label": 2, "summarize": 2, "tabulate": 2, "regress": 3, "display": 2,
+    "levelsof": 8, "clonevar": 8, "encode": 6, "decode": 6, "insheet": 5, "outsheet": 4,
+    "import": 3, "export": 3, "erase": 5, "describe": 1, "format": 3, "order": 2, "predict": 4,
+    "expand": 6, "duplicates": 3, "xtile": 5, "tokenize": 4, "gettoken": 4, "syntax": 3,
+    "args": 4, "quietly": 3, "noisily": 1, "capture": 3, "include": 7, "run": 3, "do": 2,
+    "count": 3, "list": 1, "compress": 8, "isid": 4, "contract": 8, "statsby": 7,
+    "fillin": 6, "xpose": 5, "stack": 5, "cross": 5, "destring": 8, "tostring": 8, "macro": 2,
+})
+# Commands that load or write data files
+DATA_READ_COMMANDS = {"use", "merge", "append", "joinby", "cross", "insheet", "import", "infile", "infix"}
+DATA_WRITE_COMMANDS = {"save", "saveold", "outsheet", "export"}
+
+
+@dataclass
+class Command:
+    """One logical Stata command.
+
+    text has comments removed and continuations joined; name is the
+    unabbreviated command word with prefixes removed and args the text
+    after it. loops holds the first lines of the enclosing
+    foreach/forvalues/while blocks, outermost first, and program the name
+    of the enclosing program define (None at top level).
+    """
+
+    line: int
+    end_line: int
+    text: str
+    name: str
+    args: str
+    prefix: str = ""
+    loops: tuple[int, ...] = ()
+    program: str | None = None
+
+    @property
+    def by(self) -> bool:
+        return bool(BY_PREFIX_RE.search(self.prefix))
+
+
+def logical_lines(text: str):
+    """Yield (first line, last line, text) for each command in a do-file,
+    with comments removed and /// and #delimit ; continuations joined."""
+    pieces: list[str] = []
+    line = 1
+    start = None       # line of the first text of the current command
+    pos = 0
+    block = 0          # /* */ nesting depth
+    quote = None       # '"' or '`"' while inside a string
+    compound = 0
+    semicolon = False  # #delimit ; in effect
+
+    def add(piece: str):
+        nonlocal start
+        if start is None and piece.strip():
+            start = line
+        pieces.append(piece)
+
+    def flush(end: int):
+        nonlocal pieces, semicolon, start
+        cmd = "".join(pieces).strip()
+        first, pieces, start = start, [], None
+        if not cmd or cmd.startswith("*"):
+            return None
+        m = DELIMIT_RE.match(cmd)
+        if m:
+            semicolon = m.group(1) == ";"
+            return None
+        return first, end, cmd
+
+    cursor = 0
+    while True:
+        m = LEX_RE.search(text, cursor)
+        if not m:
+            break
+        tok, i = m.group(), m.start()
+        cursor = m.end()
+        if block:
+            if tok == "/*":
+                block += 1
+            elif tok == "*/":
+                block -= 1
+                if not block:
+                    pos = cursor
+                    add(" ")
+            elif tok == "\n":
+                line += 1
+            continue
+        if quote:
+            if tok == "\n":
+                quote, compound = None, 0  # strings never span lines; recover
+            elif quote == '"' and tok in ('"', "\"'"):
+                quote = None
+                continue
+            elif quote == '`"' and tok == '`"':
+                compound += 1
+                continue
+            elif quote == '`"' and tok == "\"'":
+                compound -= 1
+                if not compound:
+                    quote = None
+                continue
+            else:
+                continue
+        if tok in ('"', "\"'"):
+            quote = '"'
+            continue
+        if tok == '`"':
+            quote, compound = tok, 1
+            continue
+        if tok == "/*":
+            add(text[pos:i])
+            block = 1
+            continue
+        if tok in ("//", "///") and i > 0 and text[i - 1] not in " \t\n":
+            continue  # part of a word, e.g. a URL
+        if tok in ("//", "///"):
+            add(text[pos:i] + " ")
+            nl = text.find("\n", i)
+            if nl == -1:
+                pos = cursor = len(text)
+            elif tok == "//":
+                pos = cursor = nl  # the newline still ends the command
+            else:
+                line += 1
+                pos = cursor = nl + 1
+            continue
+        if tok == "\n":
+            add(text[pos:i])
+            pos = cursor
+            if semicolon and not DELIMIT_RE.match("".join(pieces).strip()):
+                pieces.append(" ")
+            else:
+                out = flush(line)
+                if out:
+                    yield out
+            line += 1
+            continue
+        if tok == ";" and semicolon:
+            add(text[pos:i])
+            pos = cursor
+            out = flush(line)
+            if out:
+                yield out
+    if not block:
+        add(text[pos:])
+    out = flush(line)
+    if out:
+        yield out
+
+
+def split_command(text: str) -> tuple[str, str, str]:
+    """(prefix, unabbreviated command name, arguments) of one command."""
+    rest = text
+    prefix_end = 0
+    while True:
+        m = PREFIX_RE.match(rest, prefix_end) or BY_PREFIX_RE.match(rest, prefix_end)
+        if not m or m.end() == prefix_end:
+            break
+        prefix_end = m.end()
+    prefix, rest = rest[:prefix_end].strip(), rest[prefix_end:]
+    m = WORD_RE.match(rest)
+    if not m:
+        return prefix, rest[:1], rest[1:].strip()
+    word = m.group().lower()
+    args = rest[m.end():]
+    # "gen x = ..." and "generate x = ..." but also "g x = ..."
+    name = COMMAND_NAMES.get(word, word)
+    return prefix, name, args.strip()
+
+
+def iter_commands(text: str):
+    """Yield the Commands of a do-file in order, tracking loop and program nesting."""
+    blocks: list[int | None] = []  # loop start line, or None for other { } blocks
+    program = None
+    for line, end_line, cmd in logical_lines(text):
+        # A leading } closes a block ("} else {" reopens one)
+        while cmd.startswith("}"):
+            if blocks:
+                blocks.pop()
+            cmd = cmd[1:].strip()
+        if not cmd:
+            continue
+        prefix, name, args = split_command(cmd)
+        if name == "program" and not re.match(r"(?:drop|dir|list)\b", args, re.IGNORECASE):
+            words = re.sub(r"^(?:define|defin|defi|def|de)\s+", "", args, flags=re.IGNORECASE).split(",")[0].split()
+            program = words[0] if words else ""
+        elif name == "end" and program is not None:
+            program = None
+            continue
+        loops = tuple(b for b in blocks if b is not None)
+        yield Command(line, end_line, cmd, name, args, prefix, loops, program)
+        if cmd.endswith("{"):
+            blocks.append(line if name in LOOP_COMMANDS else None)
+
+
+def local_refs(text: str) -> list[str]:
+    return LOCAL_REF_RE.findall(text)
+
+
+def global_refs(text: str) -> list[str]:
+    return [a or b for a, b in GLOBAL_REF_RE.findall(text)]
+
+
+def read_dofile(path: str) -> str:
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")  # do-files from Stata 13 and older
+
+
+def iter_dofiles(root):
+    """Paths of the do-files under root in a stable order, skipping hidden directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1].lower() in DOFILE_SUFFIXES:
+                yield os.path.join(dirpath, name)
@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""Static index of a Stata project for /audit-code and /optimize-code.
+
+Parses every .do/.doh/.ado file under a directory once and records, per
+file: do/run/include calls, global and local macro definitions and uses
+(locals per program scope; include shares the caller's scope), cd
+commands, datasets read and written (use/merge/append/joinby/import vs
+save/export), and variables created, dropped and referenced.
+
+The index is kept in ~/.cache/claude-core/stata-index/ and updated
+incrementally: only files whose mtime or size changed are re-parsed, so
+queries on an unchanged tree cost one directory scan.
+
+Queries:
+    summary              counts for every check below (default)
+    undefined-macros     globals never defined anywhere; locals not defined in scope
+    unused-macros        macros defined but never used
+    unread-datasets      datasets (and tempfiles) saved but never read back
+    orphan-dofiles       files no other file calls with do/run/include
+    unresolved-calls     do/run/include targets that match no project file
+    unused-variables     variables created but never referenced afterwards
+    callgraph            who calls whom
+    macro NAME           where a macro is defined and used
+    dataset TEXT         reads and writes of datasets whose path contains TEXT
+    variable NAME        where a variable is created, dropped and used
+
+Usage:
+    python stata_index.py <dofile-dir> [query [arg]] [--json] [--rebuild]
+
+Findings print as "file:line: message" (or JSON with --json). The checks
+are static: macros assembled at run time and code in strings are invisible
+to them, so treat findings as leads to confirm in the code.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import posixpath
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from stata import (
+    DATA_READ_COMMANDS, DATA_WRITE_COMMANDS, STRING_RE, global_refs, iter_commands, iter_dofiles, local_refs, read_dofile,
+)
+
+INDEX_VERSION = 2
+INDEX_DIR = Path.home() / ".cache" / "claude-core" / "stata-index"
+PARALLEL_THRESHOLD = 8  # re-parse in worker processes when this many files changed (and CPUs allow)
+QUERIES = [
+    "summary", "undefined-macros", "unused-macros", "unread-datasets", "orphan-dofiles",
+    "unresolved-calls", "unused-variables", "callgraph", "macro", "dataset", "variable",
+]
+CHECKS = QUERIES[1:7]
+
+NAME_RE = re.compile(r"[A-Za-z_]\w*$")
+PATH_TOKEN_RE = re.compile(r'\s*(`"(?:[^"]|"(?!\'))*"\'|"[^"]*"|[^\s,]+)')
+VAR_TOKEN_RE = re.compile(r"[\w`'$*?~{}]+")
+LOCAL_OPTION_RE = re.compile(r"\blocal\(\s*([A-Za-z_]\w*)\s*\)", re.IGNORECASE)
+ST_MACRO_RE = re.compile(r"st_(local|global)\(\s*\"([A-Za-z_]\w*)\"")
+# Macros named without quotes: foreach v of local NAME, : copy global NAME, : length local NAME
+BARE_MACRO_RE = re.compile(r"\b(local|global)\s+([A-Za-z_]\w*)")
+# Words of the : list extended function that are not macro names
+LIST_KEYWORDS = {"list", "uniq", "dups", "sort", "retokenize", "clean", "sizeof", "posof", "in"}
+STORAGE_TYPES = {"byte", "int", "long", "float", "double", "strL"}
+STR_TYPE_RE = re.compile(r"str\d+$")
+# Commands whose first variable is the one being created
+CREATE_COMMANDS = {"generate", "egen", "gegen", "clonevar"}
+# Commands that name variables without reading their values
+NON_USE_COMMANDS = {"drop", "keep", "label", "format", "order", "notes", "note", "compress"}
+CALL_COMMANDS = {"do", "run", "include"}
+
+
+def _add(facts: dict, key: str, name: str, line: int) -> None:
+    facts[key].setdefault(name, []).append(line)
+
+
+def _path_tokens(text: str) -> list[str]:
+    """File names at the start of text, up to the options comma."""
+    paths = []
+    pos = 0
+    while True:
+        m = PATH_TOKEN_RE.match(text, pos)
+        if not m or m.group(1).startswith(","):
+            break
+        paths.append(m.group(1))
+        pos = m.end()
+    return paths
+
+
+def _unquote(path: str) -> str:
+    if path.startswith('`"') and path.endswith("\"'"):
+        return path[2:-2]
+    return path.strip('"')
+
+
+def _after_using(args: str) -> list[str]:
+    m = re.search(r"(?:^|\s)using\s+", args)
+    return _path_tokens(args[m.end():]) if m else []
+
+
+def data_paths(name: str, args: str) -> list[str]:
+    """Files a read/write command touches, as written."""
+    if name in ("use", "insheet"):
+        return _after_using(args) or _path_tokens(args)[:1]
+    if name in ("merge", "append", "joinby", "cross", "outsheet", "infile", "infix"):
+        return _after_using(args)
+    if name in ("save", "saveold"):
+        return _path_tokens(args)[:1]
+    if name in ("import", "export"):
+        sub, _, rest = args.partition(" ")
+        return _after_using(rest) or ([] if name == "export" else _path_tokens(rest)[:1])
+    return []
+
+
+def _macro_pattern(name: str) -> str | None:
+    """A regex for a name assembled from macros (x_`v'), or None if literal."""
+    if "`" not in name and "$" not in name:
+        return None
+    parts = re.split(r"`[^']*'|\$\{?\w+\}?", name)
+    return "^" + r"\w*".join(re.escape(p) for p in parts) + "$"
+
+
+def _var_names(text: str) -> list[str]:
+    return VAR_TOKEN_RE.findall(STRING_RE.sub(" ", text))
+
+
+def bare_macro_uses(name: str, args: str) -> list[tuple[str, str]]:
+    """(kind, name) of macros a command reads without `' or $ quoting.
+
+    kind is "local" or "global". Covers foreach ... of local/global NAME,
+    the local/global : copy, length and list extended functions, and
+    macro drop/list (where a leading _ marks a local).
+    """
+    if name == "foreach":
+        m = re.search(r"\bof\s+(local|global)\s+([A-Za-z_]\w*)", args)
+        return [m.groups()] if m else []
+    if name == "macro":
+        sub, _, rest = args.partition(" ")
+        if not re.fullmatch(r"(?:drop|di|dir|l|li|lis|list)", sub.lower()):
+            return []
+        return [("local", w[1:]) if w.startswith("_") else ("global", w)
+                for w in rest.split() if w != "_all" and NAME_RE.match(w.lstrip("_"))]
+    if name not in ("local", "global") or ":" not in args:
+        return []
+    function = STRING_RE.sub(" ", args.split(":", 1)[1])
+    words = function.split()
+    if words and words[0] == "list":
+        return [("local", w) for w in re.findall(r"[A-Za-z_]\w*", function) if w not in LIST_KEYWORDS]
+    return BARE_MACRO_RE.findall(function)
+
+
+def scan_file(text: str) -> dict:
+    """Everything the queries need from one do-file."""
+    facts = {
+        "calls": [],            # [line, command, target as written]
+        "programs": [],
+        "global_defs": {}, "global_uses": {}, "global_values": {},
+        "scopes": {},           # program name ("" = file level) -> local defs/uses
+        "cds": [],              # [line, path as written]
+        "tempfiles": [],
+        "data": [],             # [line, "read"/"write", command, path as written]
+        "var_created": {}, "var_dropped": {}, "var_uses": {}, "var_patterns": [],
+        "lines": text.count("\n") + 1,
+    }
+
+    def scope(program):
+        return facts["scopes"].setdefault(program or "", {"defs": {}, "uses": {}, "patterns": [], "lenient": False})
+
+    for cmd in iter_commands(text):
+        sc = scope(cmd.program)
+        name, args, line = cmd.name, cmd.args, cmd.line
+        for ref in local_refs(cmd.text):
+            if not ref.isdigit():
+                _add(sc, "uses", ref, line)
+        for ref in global_refs(cmd.text):
+            _add(facts, "global_uses", ref, line)
+        for kind, ref in bare_macro_uses(name, args):
+            if kind == "local":
+                _add(sc, "uses", ref, line)
+            else:
+                _add(facts, "global_uses", ref, line)
+
+        words = args.replace("=", " = ").replace(":", " : ").split()
+        first = words[0].lstrip("+-") if words else ""
+        if name == "local":
+            target = first.rstrip("+-")
+            if NAME_RE.match(target):
+                _add(sc, "defs", target, line)
+            elif _macro_pattern(target):
+                sc["patterns"].append(_macro_pattern(target))
+        elif name == "global" and words:
+            if NAME_RE.match(first):
+                _add(facts, "global_defs", first, line)
+                value = args[len(words[0]):].strip()
+                if value.startswith("="):
+                    value = value[1:].strip()
+                facts["global_values"].setdefault(first, _unquote(value))
+        elif name in ("tempvar", "tempname", "tempfile", "args"):
+            for w in words:
+                if NAME_RE.match(w):
+                    _add(sc, "defs", w, line)
+                    if name == "tempfile":
+                        facts["tempfiles"].append(w)
+        elif name in ("foreach", "forvalues") and NAME_RE.match(first):
+            _add(sc, "defs", first, line)
+        elif name == "gettoken":
+            for w in args.split(":")[0].replace("(local)", " ").replace("(global)", " ").split():
+                if NAME_RE.match(w):
+                    _add(sc, "defs", w, line)
+        elif name == "syntax":
+            sc["lenient"] = True  # option names become locals; not worth modelling
+        elif name in ("marksample", "c_local") and NAME_RE.match(first):
+            # c_local sets a local in the caller, taken here as the file level
+            _add(scope(None) if name == "c_local" else sc, "defs", first, line)
+        elif name == "program" and cmd.program:
+            facts["programs"].append(cmd.program)
+        for m in LOCAL_OPTION_RE.finditer(args):
+            _add(sc, "defs", m.group(1), line)
+        for kind, macro in ST_MACRO_RE.findall(args):
+            _add(sc if kind == "local" else facts, "defs" if kind == "local" else "global_defs", macro, line)
+
+        if name in CALL_COMMANDS and args:
+            target = _path_tokens(args)[:1]
+            if target:
+                facts["calls"].append([line, name, _unquote(target[0])])
+        elif name == "cd" and args:
+            facts["cds"].append([line, _unquote(_path_tokens(args)[0])])
+        if name in DATA_READ_COMMANDS or name in DATA_WRITE_COMMANDS:
+            op = "read" if name in DATA_READ_COMMANDS else "write"
+            sub = args.split()[0].lower() if name in ("import", "export") and args else ""
+            for path in data_paths(name, args):
+                facts["data"].append([line, op, f"{name} {sub}".strip(), _unquote(path)])
+
+        # Variables
+        targets: set[str] = {first} if name in ("local", "global") else set()
+        if name in CREATE_COMMANDS or name == "replace":
+            rest = [w for w in words if w not in STORAGE_TYPES and not STR_TYPE_RE.match(w)]
+            var = rest[0] if rest else ""
+            if NAME_RE.match(var):
+                targets.add(var)
+                if name != "replace":
+                    _add(facts, "var_created", var, line)
+        elif name == "rename" and len(words) >= 2 and not words[0].startswith("("):
+            old, new = words[0], words[1]
+            targets.update((old, new))
+            if NAME_RE.match(new):
+                _add(facts, "var_created", new, line)
+            if NAME_RE.match(old):
+                _add(facts, "var_dropped", old, line)
+        elif name in ("encode", "decode", "xtile", "predict"):
+            m = re.search(r"\bgen(?:erate)?\(\s*(\w+)\s*\)", args)
+            var = m.group(1) if m else (first if name in ("xtile", "predict") else "")
+            if NAME_RE.match(var) and var not in STORAGE_TYPES:
+                targets.add(var)
+                _add(facts, "var_created", var, line)
+        elif name == "drop" and first not in ("if", "in", "_all"):
+            for w in _var_names(args.split(" if ")[0]):
+                if NAME_RE.match(w):
+                    _add(facts, "var_dropped", w, line)
+
+        # Macro contents count as uses: local controls age educ ... reg y `controls'
+        if name in NON_USE_COMMANDS or name == "program":
+            continue
+        for token in _var_names(args):
+            if token in targets:
+                continue
+            if any(c in token for c in "`$*?~"):
+                if not re.search(r"\w", re.sub(r"`[^']*'|\$\{?\w+\}?", "", token)):
+                    continue  # `varlist', $controls, *: nothing literal to match on
+                pattern = _macro_pattern(token) or "^" + re.escape(token).replace(r"\*", r"\w*").replace(r"\?", r"\w").replace("~", r"\w*") + "$"
+                facts["var_patterns"].append([line, pattern])
+            elif NAME_RE.match(token):
+                _add(facts, "var_uses", token, line)
+    return facts
+
+
+def _scan_path(path: str) -> dict:
+    return scan_file(read_dofile(path))
+
+
+def index_path(root: Path) -> Path:
+    return INDEX_DIR / f"{hashlib.sha1(str(root).encode()).hexdigest()[:16]}.pickle"
+
+
+def update_index(root: Path, index_file: Path, rebuild: bool = False) -> tuple[dict, int]:
+    """Load the index for root, re-parse changed files and save it.
+
+    Returns (index, number of files re-parsed).
+    """
+    index = {}
+    if not rebuild:
+        try:
+            with open(index_file, "rb") as f:
+                index = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+    if index.get("version") != INDEX_VERSION or index.get("root") != str(root):
+        index = {"version": INDEX_VERSION, "root": str(root), "files": {}}
+    old = index["files"]
+    files = {}
+    stale = []
+    for path in iter_dofiles(root):
+        rel = os.path.relpath(path, root)
+        st = os.stat(path)
+        entry = old.get(rel)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            files[rel] = entry
+        else:
+            files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+            stale.append(rel)
+
+    if stale:
+        paths = [str(root / rel) for rel in stale]
+        if len(stale) >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as pool:
+                results = list(pool.map(_scan_path, paths, chunksize=4))
+        else:
+            results = [_scan_path(p) for p in paths]
+        for rel, facts in zip(stale, results):
+            files[rel]["facts"] = facts
+    if stale or files.keys() != old.keys():
+        index["files"] = files
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_file.with_name(index_file.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_file)
+    return index, len(stale)
+
+
+class Project:
+    """Cross-file views over the per-file facts."""
+
+    def __init__(self, index: dict):
+        self.root = index["root"]
+        self.files = {rel: entry["facts"] for rel, entry in index["files"].items()}
+        self.globals = self._resolve_globals()
+        self.by_name: dict[str, list[str]] = {}
+        for rel in self.files:
+            self.by_name.setdefault(posixpath.basename(rel), []).append(rel)
+        self.calls = self._resolve_calls()
+
+    def _resolve_globals(self) -> dict[str, str]:
+        """Global values with other globals substituted where they are literal."""
+        raw = {}
+        for facts in self.files.values():
+            for name, value in facts["global_values"].items():
+                raw.setdefault(name, value)
+        resolved = {}
+        for name, value in raw.items():
+            for _ in range(5):
+                new = re.sub(r"\$\{(\w+)\}|\$(\w+)", lambda m: raw.get(m.group(1) or m.group(2), m.group()), value)
+                if new == value:
+                    break
+                value = new
+            resolved[name] = value
+        return resolved
+
+    def expand(self, path: str) -> str:
+        """path with literal globals substituted and separators normalized."""
+        path = re.sub(r"\$\{(\w+)\}|\$(\w+)", lambda m: self.globals.get(m.group(1) or m.group(2), m.group()), path)
+        return path.replace("\\", "/")
+
+    def _match_file(self, target: str, caller: str) -> str | None:
+        """The project file a do/run/include target names, by path or by the
+        longest unique trailing path match (globals may point elsewhere)."""
+        target = self.expand(target)
+        if not os.path.splitext(target)[1]:
+            target += ".do"
+        if "`" in target or "$" in target.split("/")[-1]:
+            return None
+        for base in (os.path.dirname(caller), ""):
+            candidate = posixpath.normpath(posixpath.join(base, target))
+            if candidate in self.files:
+                return candidate
+        if target.startswith(self.root + "/"):
+            rel = target[len(self.root) + 1:]
+            if rel in self.files:
+                return rel
+        parts = [p for p in target.split("/") if p not in ("", ".")]
+        best, best_len, tie = None, 0, False
+        for rel in self.by_name.get(parts[-1] if parts else "", []):
+            rel_parts = rel.split("/")
+            n = 0
+            while n < min(len(parts), len(rel_parts)) and parts[-1 - n] == rel_parts[-1 - n]:
+                n += 1
+            if n > best_len:
+                best, best_len, tie = rel, n, False
+            elif n == best_len and n:
+                tie = True
+        return best if best_len and not tie else None
+
+    def _resolve_calls(self) -> list[dict]:
+        calls = []
+        for rel, facts in self.files.items():
+            for line, kind, target in facts["calls"]:
+                calls.append({"file": rel, "line": line, "kind": kind, "target": target,
+                              "resolved": self._match_file(target, rel)})
+        return calls
+
+    def include_groups(self) -> dict[str, set[str]]:
+        """{file: files sharing its file-level locals through include}."""
+        parent = {rel: rel for rel in self.files}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for call in self.calls:
+            if call["kind"] == "include" and call["resolved"]:
+                parent[find(call["file"])] = find(call["resolved"])
+        groups: dict[str, set[str]] = {}
+        for rel in self.files:
+            groups.setdefault(find(rel), set()).add(rel)
+        return {rel: groups[find(rel)] for rel in self.files}
+
+    def _scope_defs(self, rel: str, program: str, groups) -> tuple[set[str], list[str], bool]:
+        if program:
+            sc = self.files[rel]["scopes"][program]
+            return set(sc["defs"]), sc["patterns"], sc["lenient"]
+        defs, patterns, lenient = set(), [], False
+        for member in groups[rel]:
+            sc = self.files[member]["scopes"].get("")
+            if sc:
+                defs.update(sc["defs"])
+                patterns += sc["patterns"]
+                lenient |= sc["lenient"]
+        return defs, patterns, lenient
+
+    # Checks: each returns a list of {"file", "line", "message", ...}
+
+    def undefined_macros(self) -> list[dict]:
+        defined = {n for f in self.files.values() for n in f["global_defs"]}
+        out = []
+        for rel, facts in self.files.items():
+            for name, lines in facts["global_uses"].items():
+                if name not in defined and not name.startswith("S_"):
+                    out.append({"file": rel, "line": lines[0], "name": "$" + name,
+                                "message": f"global ${name} is used but never defined"})
+        groups = self.include_groups()
+        for rel, facts in self.files.items():
+            for program, sc in facts["scopes"].items():
+                defs, patterns, lenient = self._scope_defs(rel, program, groups)
+                if lenient:
+                    continue
+                for name, lines in sc["uses"].items():
+                    if name in defs or any(re.match(p, name) for p in patterns):
+                        continue
+                    where = f" in program {program}" if program else ""
+                    out.append({"file": rel, "line": lines[0], "name": f"`{name}'",
+                                "message": f"local `{name}' is used{where} but never defined"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+    def unused_macros(self) -> list[dict]:
+        used = {n for f in self.files.values() for n in f["global_uses"]}
+        out = []
+        for rel, facts in self.files.items():
+            for name, lines in facts["global_defs"].items():
+                if name not in used:
+                    out.append({"file": rel, "line": lines[0], "name": "$" + name,
+                                "message": f"global ${name} is defined but never used"})
+        groups = self.include_groups()
+        for rel, facts in self.files.items():
+            for program, sc in facts["scopes"].items():
+                if program:
+                    uses = set(sc["uses"])
+                else:
+                    uses = {u for m in groups[rel] for u in self.files[m]["scopes"].get("", {}).get("uses", {})}
+                for name, lines in sc["defs"].items():
+                    if name not in uses:
+                        out.append({"file": rel, "line": lines[0], "name": f"`{name}'",
+                                    "message": f"local `{name}' is defined but never used"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+    def datasets(self) -> list[dict]:
+        """Every read/write with a normalized key for matching them up."""
+        out = []
+        for rel, facts in self.files.items():
+            cds = facts["cds"]
+            tempfiles = set(facts["tempfiles"])
+            for line, op, command, path in facts["data"]:
+                m = re.fullmatch(r"`(\w+)'", path.strip())
+                if m and m.group(1) in tempfiles:
+                    out.append({"file": rel, "line": line, "op": op, "command": command,
+                                "path": path, "key": f"{rel}:{path}", "tempfile": True})
+                    continue
+                key = self.expand(path)
+                cd = next((self.expand(p) for l, p in reversed(cds) if l < line), None)
+                if cd and not key.startswith("/") and not re.match(r"[A-Za-z]:", key) and "$" not in key:
+                    key = posixpath.join(cd, key)
+                if not os.path.splitext(key)[1] and command.split()[0] in ("use", "save", "saveold", "merge", "append", "joinby", "cross"):
+                    key += ".dta"
+                out.append({"file": rel, "line": line, "op": op, "command": command, "path": path,
+                            "key": posixpath.normpath(key) if key else key, "tempfile": False})
+        return out
+
+    def unread_datasets(self) -> list[dict]:
+        entries = self.datasets()
+        read = {d["key"] for d in entries if d["op"] == "read"}
+        read_names = {posixpath.basename(k) for k in read}
+        out = []
+        seen = set()
+        for d in entries:
+            # Exports (tables, CSVs for other tools) are final outputs by design
+            if d["command"] not in ("save", "saveold") or d["key"] in read or d["key"] in seen:
+                continue
+            # Paths built from unresolved macros can still match by file name
+            if "$" in d["key"] or "`" in d["key"]:
+                if posixpath.basename(d["key"]) in read_names:
+                    continue
+            seen.add(d["key"])
+            kind = "tempfile" if d["tempfile"] else "dataset"
+            out.append({"file": d["file"], "line": d["line"], "name": d["path"],
+                        "message": f"{kind} {d['path']} is written but never read"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+    def orphan_dofiles(self) -> list[dict]:
+        called = {c["resolved"] for c in self.calls if c["resolved"]}
+        return [{"file": rel, "line": 1, "name": rel, "message": "not called by any other file (entry point?)"}
+                for rel in sorted(self.files) if rel not in called and not rel.endswith(".ado")]
+
+    def unresolved_calls(self) -> list[dict]:
+        return [{"file": c["file"], "line": c["line"], "name": c["target"],
+                 "message": f"{c['kind']} {c['target']} matches no file in the project"}
+                for c in sorted(self.calls, key=lambda c: (c["file"], c["line"])) if not c["resolved"]]
+
+    def unused_variables(self) -> list[dict]:
+        used = set()
+        patterns = set()
+        for facts in self.files.values():
+            used.update(facts["var_uses"])
+            patterns.update(p for _, p in facts["var_patterns"])
+        # One alternation is far cheaper than trying each pattern in turn
+        combined = re.compile("|".join(f"(?:{p})" for p in sorted(patterns))) if patterns else None
+        out = []
+        for rel, facts in self.files.items():
+            for name, lines in facts["var_created"].items():
+                if name in used or (combined and combined.match(name)):
+                    continue
+                out.append({"file": rel, "line": lines[0], "name": name,
+                            "message": f"variable {name} is created but never used"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+    def callgraph(self) -> list[dict]:
+        return [{"file": c["file"], "line": c["line"], "name": c["resolved"] or c["target"],
+                 "message": f"{c['kind']} {c['resolved'] or c['target'] + ' (unresolved)'}"}
+                for c in sorted(self.calls, key=lambda c: (c["file"], c["line"]))]
+
+    def macro(self, name: str) -> list[dict]:
+        is_global = name.startswith("$")
+        name = name.strip("$`'{}")
+        out = []
+        for rel, facts in self.files.items():
+            sources = [("global", facts["global_defs"], facts["global_uses"])]
+            for program, sc in facts["scopes"].items():
+                sources.append((f"local{' in ' + program if program else ''}", sc["defs"], sc["uses"]))
+            for kind, defs, uses in sources:
+                if is_global and not kind.startswith("global"):
+                    continue
+                for what, table in (("defined", defs), ("used", uses)):
+                    for line in table.get(name, []):
+                        out.append({"file": rel, "line": line, "name": name, "message": f"{kind} {name} {what}"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+    def dataset(self, text: str) -> list[dict]:
+        return [{"file": d["file"], "line": d["line"], "name": d["key"],
+                 "message": f"{d['op']} ({d['command']}) {d['path']}"}
+                for d in sorted(self.datasets(), key=lambda d: (d["file"], d["line"]))
+                if text in d["path"] or text in d["key"]]
+
+    def variable(self, name: str) -> list[dict]:
+        out = []
+        for rel, facts in self.files.items():
+            for what, key in (("created", "var_created"), ("dropped", "var_dropped"), ("used", "var_uses")):
+                for line in facts[key].get(name, []):
+                    out.append({"file": rel, "line": line, "name": name, "message": f"{name} {what}"})
+        return sorted(out, key=lambda r: (r["file"], r["line"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index a Stata project and query macros, datasets, calls and variables")
+    parser.add_argument("root", type=Path, help="Directory containing the do-files")
+    parser.add_argument("query", nargs="?", default="summary", choices=QUERIES, help="What to report (default: summary)")
+    parser.add_argument("arg", nargs="?", help="Name or text for macro/dataset/variable queries")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached index")
+    parser.add_argument("--index", type=Path, default=None, help="Index file (default: under ~/.cache/claude-core)")
+    args = parser.parse_args()
+
+    root = args.root.expanduser().resolve()
+    if not root.is_dir():
+        print(f"ERROR: Directory not found: {root}", file=sys.stderr)
+        sys.exit(1)
+    if args.query in ("macro", "dataset", "variable") and not args.arg:
+        print(f"ERROR: {args.query} needs a name", file=sys.stderr)
+        sys.exit(1)
+
+    index, reparsed = update_index(root, args.index or index_path(root), args.rebuild)
+    project = Project(index)
+    print(f"{len(project.files)} files indexed, {reparsed} re-parsed", file=sys.stderr)
+
+    if args.query == "summary":
+        counts = {q: len(getattr(project, q.replace("-", "_"))()) for q in CHECKS}
+        if args.json:
+            print(json.dumps({"files": len(project.files), **counts}, indent=2))
+        else:
+            for q, n in counts.items():
+                print(f"{q}: {n}")
+        return
+
+    method = getattr(project, args.query.replace("-", "_"))
+    results = method(args.arg) if args.arg else method()
+    if args.json:
+        print(json.dumps({"query": args.query, "root": str(root), "results": results}, indent=2, ensure_ascii=False))
+    else:
+        for r in results:
+            print(f"{r['file']}:{r['line']}: {r['message']}")
+
+
+if __name__ == "__main__":
+    main()
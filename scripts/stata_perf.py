@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Flag slow Stata idioms in do-files, as a starting list for /optimize-code.
+
+Works on the tokenized commands from stata.py, so comments, continuations
+and prefixes are already handled and every command knows the loops it sits
+in. Rules:
+
+    egen-in-loop       egen inside a loop (a sort per call, per iteration)
+    sort-in-loop       the same sort / bysort keys on every iteration
+    preserve-in-loop   preserve inside a loop (a full copy per iteration)
+    io-in-loop         use/merge/save of the same file on every iteration
+    levelsof-loop      looping over levelsof values with if var == `v'
+    redundant-sort     sorting data already sorted on those keys, bysort
+                       where by would do, sort right before a merge
+    repeated-merge     the same using file merged more than once
+    gtools             base commands with a gtools drop-in (egen, collapse, ...)
+
+Cost classes describe how the work scales, not measured timings:
+
+    high     a pass over (or copy, sort, load of) the full dataset per loop iteration
+    medium   a redundant full-data sort or pass done once
+    low      constant-factor gain from a drop-in faster command
+
+Usage:
+    python stata_perf.py <dir-or-file> [...] [--min-cost medium] [--rules egen-in-loop,...] [--json]
+
+Findings print as "file:line: [cost] rule: message -> suggestion".
+Files are scanned in parallel when there are many.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from stata import BY_PREFIX_RE, LOOP_COMMANDS, iter_commands, iter_dofiles, local_refs, read_dofile
+
+COSTS = ["low", "medium", "high"]
+RULES = {
+    "egen-in-loop": "high",
+    "sort-in-loop": "high",
+    "preserve-in-loop": "high",
+    "io-in-loop": "high",
+    "levelsof-loop": "high",
+    "redundant-sort": "medium",
+    "repeated-merge": "medium",
+    "gtools": "low",
+}
+# optimize-code's mechanical substitution checklist
+GTOOLS = {
+    "egen": "gegen", "collapse": "gcollapse", "contract": "gcontract", "duplicates": "gduplicates",
+    "levelsof": "glevelsof", "isid": "gisid", "reshape": "greshape", "xtile": "gquantiles (xtile)",
+}
+# Commands after which the sort order is unknown
+REORDERING = {
+    "use", "merge", "append", "joinby", "cross", "collapse", "gcollapse", "reshape", "greshape",
+    "expand", "contract", "gcontract", "fillin", "restore", "insheet", "import", "clear", "stack",
+    "xpose", "sort", "gsort", "hashsort", "duplicates", "gduplicates", "statsby", "set",
+}
+PARALLEL_THRESHOLD = 16
+USING_RE = re.compile(r"(?:^|\s)using\s+(`\"(?:[^\"]|\"(?!'))*\"'|\"[^\"]*\"|[^\s,]+)")
+MERGE_KEYS_RE = re.compile(r"^\s*(?:1:1|1:m|m:1|m:m)\s+(.*?)\s+using\b")
+
+
+def _sort_keys(cmd) -> tuple[str, ...] | None:
+    """Keys a sort/gsort/hashsort command sorts on, or None if not a plain ascending sort."""
+    if cmd.name not in ("sort", "gsort", "hashsort"):
+        return None
+    words = cmd.args.split(",")[0].split()
+    if cmd.name == "gsort" and any(w.startswith("-") for w in words):
+        return None
+    keys = tuple(w.lstrip("+") for w in words)
+    return keys if keys and all(re.fullmatch(r"[\w`']+", k) for k in keys) else None
+
+
+def _by_keys(prefix: str) -> tuple[tuple[str, ...], bool] | None:
+    """(keys incl. the parenthesized ones, is bysort) of a by prefix."""
+    m = BY_PREFIX_RE.search(prefix)
+    if not m:
+        return None
+    text = m.group().rstrip(": \t")
+    word, _, rest = text.partition(" ")
+    rest = rest.split(",")[0].replace("(", " ").replace(")", " ")
+    return tuple(rest.split()), word.lower() != "by"
+
+
+def _using(cmd) -> str | None:
+    m = USING_RE.search(cmd.args)
+    return m.group(1).strip('"') if m else None
+
+
+def _io_target(cmd) -> str | None:
+    """The file a use/merge/joinby/save command reads or writes."""
+    if cmd.name in ("merge", "joinby") or (cmd.name == "use" and re.search(r"(?:^|\s)using\s", cmd.args)):
+        return _using(cmd)
+    if cmd.name in ("use", "save", "saveold"):
+        words = cmd.args.split(",")[0].split()
+        return words[0].strip('"') if words else None
+    return None
+
+
+def _mentions(text: str, names: set[str]) -> bool:
+    return any(ref in names for ref in local_refs(text))
+
+
+def _finding(cmd, rule: str, message: str, suggestion: str) -> dict:
+    return {
+        "line": cmd.line,
+        "rule": rule,
+        "cost": RULES[rule],
+        "code": cmd.text if len(cmd.text) <= 120 else cmd.text[:117] + "...",
+        "message": message,
+        "suggestion": suggestion,
+    }
+
+
+def scan_file(text: str) -> list[dict]:
+    """Findings for one do-file, in line order."""
+    commands = list(iter_commands(text))
+    loop_vars: dict[int, str] = {}    # loop header line -> loop macro name
+    loop_lists: dict[int, str] = {}   # loop header line -> "of local NAME" source
+    for cmd in commands:
+        if cmd.name in LOOP_COMMANDS:
+            words = cmd.args.split()
+            if cmd.name != "while" and words:
+                loop_vars[cmd.line] = words[0]
+            if cmd.name == "foreach" and len(words) >= 4 and words[1:3] == ["of", "local"]:
+                loop_lists[cmd.line] = words[3]
+            elif cmd.name == "foreach" and len(words) >= 3 and words[1] == "in":
+                m = re.fullmatch(r"`(\w+)'", words[2])
+                if m:
+                    loop_lists[cmd.line] = m.group(1)
+
+    findings = []
+    levels: dict[str, tuple[str, int]] = {}      # local -> (variable, levelsof line)
+    flagged_levels: set[int] = set()
+    merges: dict[str, int] = {}                   # using file -> first merge line
+    sorted_by: tuple[str, ...] | None = None
+    sorted_line = 0
+    prev_loops: tuple[int, ...] = ()
+
+    for i, cmd in enumerate(commands):
+        name = cmd.name
+        inner_vars = {loop_vars[l] for l in cmd.loops if l in loop_vars}
+        if cmd.loops != prev_loops:
+            sorted_by = None  # order inside and after loops is not tracked
+            prev_loops = cmd.loops
+        loop_at = f" inside the loop at line {cmd.loops[-1]}" if cmd.loops else ""
+
+        if name in ("levelsof", "glevelsof"):
+            m = re.search(r"\blocal\(\s*(\w+)\s*\)", cmd.args)
+            var = cmd.args.split(",")[0].split()
+            if m and var:
+                levels[m.group(1)] = (var[0], cmd.line)
+
+        if cmd.loops:
+            loop = cmd.loops[-1]
+            source = loop_lists.get(loop)
+            if source in levels and loop not in flagged_levels:
+                var, _ = levels[source]
+                v = re.escape(loop_vars.get(loop, ""))
+                if v and re.search(rf"\bif\s+{re.escape(var)}\s*==\s*\"?`{v}'", cmd.text):
+                    flagged_levels.add(loop)
+                    header = next(c for c in commands if c.line == loop)
+                    findings.append(_finding(
+                        header, "levelsof-loop",
+                        f"loops over the levels of {var} and subsets with if {var} == ..., one pass over the data per level",
+                        f"do it in one pass with by {var}: / bysort {var}:, or gegen/gcollapse ..., by({var})",
+                    ))
+            if name == "egen":
+                findings.append(_finding(
+                    cmd, "egen-in-loop", f"egen{loop_at} sorts the data on every call",
+                    "use gegen (hash-based, no sort); if the statistic does not depend on the loop, move it before the loop",
+                ))
+            if name == "preserve":
+                findings.append(_finding(
+                    cmd, "preserve-in-loop", f"preserve{loop_at} copies the whole dataset on every iteration",
+                    "save a tempfile once before the loop and use it, or compute all groups at once with by:/gcollapse",
+                ))
+            keys = _sort_keys(cmd)
+            by = _by_keys(cmd.prefix)
+            if keys and not any(_mentions(k, inner_vars) for k in keys):
+                findings.append(_finding(
+                    cmd, "sort-in-loop", f"sort {' '.join(keys)}{loop_at} repeats the same sort on every iteration",
+                    "sort once before the loop; nothing in between changes the order unless the data is reloaded",
+                ))
+            elif by and by[1] and not _mentions(" ".join(by[0]), inner_vars) and name not in ("egen",):
+                findings.append(_finding(
+                    cmd, "sort-in-loop", f"bysort {' '.join(by[0])}{loop_at} re-sorts on every iteration",
+                    f"sort {' '.join(by[0])} once before the loop and use by instead of bysort",
+                ))
+            target = _io_target(cmd)
+            if target and not _mentions(target, inner_vars):
+                if name in ("save", "saveold"):
+                    findings.append(_finding(
+                        cmd, "io-in-loop", f"{name}{loop_at} writes {target} on every iteration",
+                        "accumulate results in a frame or with postfile and save once after the loop",
+                    ))
+                else:
+                    findings.append(_finding(
+                        cmd, "io-in-loop", f"{name}{loop_at} reads {target} from disk on every iteration",
+                        "load it once before the loop (into a frame, or keep the needed variables in memory)",
+                    ))
+        # egen inside a loop is already reported above, with gegen as the fix
+        if name in GTOOLS and not (cmd.loops and name == "egen"):
+            findings.append(_finding(
+                cmd, "gtools", f"{name} has a faster gtools equivalent",
+                f"{GTOOLS[name]} (same syntax; skip for clearly small datasets)",
+            ))
+
+        if name == "merge":
+            using = _using(cmd)
+            if using and not _mentions(using, inner_vars):
+                if using in merges:
+                    findings.append(_finding(
+                        cmd, "repeated-merge", f"{using} was already merged at line {merges[using]}",
+                        "bring in all needed variables in the first merge (keepusing(...)) and drop this one",
+                    ))
+                else:
+                    merges[using] = cmd.line
+            # merge sorts both datasets itself
+            if i and commands[i - 1].loops == cmd.loops:
+                prev_keys = _sort_keys(commands[i - 1])
+                m = MERGE_KEYS_RE.match(cmd.args)
+                if prev_keys and m and tuple(m.group(1).split()) == prev_keys:
+                    findings.append(_finding(
+                        commands[i - 1], "redundant-sort", f"sort {' '.join(prev_keys)} right before merge on the same keys",
+                        "drop the sort: merge sorts master and using itself",
+                    ))
+
+        # Sort-order tracking (outside loops only)
+        if not cmd.loops:
+            keys = _sort_keys(cmd)
+            by = _by_keys(cmd.prefix)
+            if keys:
+                if sorted_by == keys:
+                    findings.append(_finding(
+                        cmd, "redundant-sort", f"data is already sorted by {' '.join(keys)} (line {sorted_line})",
+                        "drop this sort",
+                    ))
+                sorted_by, sorted_line = keys, cmd.line
+                continue
+            if by and by[1] and sorted_by and sorted_by[:len(by[0])] == by[0]:
+                findings.append(_finding(
+                    cmd, "redundant-sort", f"data is already sorted by {' '.join(sorted_by)} (line {sorted_line})",
+                    f"use by {' '.join(by[0])}: instead of bysort",
+                ))
+            elif by and by[1]:
+                sorted_by, sorted_line = by[0], cmd.line
+            if name in REORDERING:
+                sorted_by = None
+
+    findings.sort(key=lambda f: (f["line"], f["rule"]))
+    return findings
+
+
+def scan_path(path: str) -> tuple[str, list[dict]]:
+    return path, scan_file(read_dofile(path))
+
+
+def collect(paths: list[str]) -> list[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(iter_dofiles(path))
+        else:
+            files.append(path)
+    return files
+
+
+def scan(files: list[str], workers: int | None = None) -> dict[str, list[dict]]:
+    """{path: findings}, scanning in worker processes when there are many files."""
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(files) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return dict(pool.map(scan_path, files, chunksize=max(1, len(files) // (workers * 4))))
+    return dict(scan_path(f) for f in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag slow Stata idioms in do-files")
+    parser.add_argument("paths", nargs="+", help="Do-files or directories to scan")
+    parser.add_argument("--min-cost", choices=COSTS, default="low", help="Only report findings at least this costly")
+    parser.add_argument("--rules", default=None, help=f"Comma-separated subset of: {', '.join(RULES)}")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    rules = set(RULES)
+    if args.rules:
+        rules = {r.strip() for r in args.rules.split(",") if r.strip()}
+        unknown = rules - RULES.keys()
+        if unknown:
+            print(f"ERROR: Unknown rules: {', '.join(sorted(unknown))}", file=sys.stderr)
+            sys.exit(1)
+    missing = [p for p in args.paths if not os.path.exists(p)]
+    if missing:
+        print(f"ERROR: Not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    files = collect(args.paths)
+    results = scan(files, args.workers)
+    min_cost = COSTS.index(args.min_cost)
+    report = {}
+    for path in files:
+        kept = [f for f in results[path] if f["rule"] in rules and COSTS.index(f["cost"]) >= min_cost]
+        if kept:
+            report[path] = kept
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        for path, findings in report.items():
+            for f in findings:
+                print(f"{path}:{f['line']}: [{f['cost']}] {f['rule']}: {f['message']} -> {f['suggestion']}")
+    counts = {c: sum(1 for fs in report.values() for f in fs if f["cost"] == c) for c in reversed(COSTS)}
+    print(
+        f"{len(files)} files scanned, {sum(counts.values())} findings "
+        f"({', '.join(f'{n} {c}' for c, n in counts.items())}) in {len(report)} files",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
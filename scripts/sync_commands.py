@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Mirror ~/.claude/commands and ~/.claude/CLAUDE.md into claude-core and push.
+
+Runs from a hook after every skill edit, so the common case has to be
+cheap: a manifest of the source's (mtime, size, sha256) and the repo
+copy's (mtime, size) per file lets it exit after one scan of each tree
+when nothing changed, without hashing or git. Edits and deletions on the
+repo side (a git pull, a manual edit) are corrected like rsync did.
+
+When something did change, the changed files are copied (and deleted
+sources removed) right away. The commit is left to a detached process that
+waits for the debounce window; any edit within the window restarts it, so
+a burst of edits becomes one commit. Only the synced paths are staged.
+
+Usage:
+    python sync_commands.py [--repo DIR] [--source DIR] [--debounce SECONDS]
+
+State lives in the repo's .git directory (sync-commands-*.json).
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+EXCLUDE = {"citation-production.md"}  # confidential, never published
+COMMIT_MESSAGE = "Auto-sync commands and CLAUDE.md"
+
+
+def _hash(path: str) -> str:
+    if os.path.islink(path):
+        return "link:" + os.readlink(path)
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def scan_sources(source: Path, claude_md: Path) -> dict[str, tuple[str, os.stat_result]]:
+    """{path relative to the repo: (source path, lstat)} for everything to mirror."""
+    found = {}
+    stack = [(str(source), "skills")]
+    while stack:
+        src_dir, rel_dir = stack.pop()
+        try:
+            it = os.scandir(src_dir)
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name in EXCLUDE:
+                    continue
+                rel = f"{rel_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                else:
+                    found[rel] = (entry.path, entry.stat(follow_symlinks=False))
+    try:
+        found["CLAUDE.md"] = (str(claude_md), os.lstat(claude_md))
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _load(path: Path, default):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return default
+
+
+def _save(path: Path, data) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def _copy(src: str, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if os.path.lexists(dest) and (dest.is_symlink() or os.path.islink(src)):
+        dest.unlink()
+    shutil.copy2(src, dest, follow_symlinks=False)
+
+
+def _remove(dest: Path, top: Path) -> None:
+    if os.path.lexists(dest):
+        dest.unlink()
+    # Drop directories the deletion left empty, as rsync --delete would
+    parent = dest.parent
+    while parent != top and parent.is_dir() and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+def sync_files(repo: Path, source: Path, claude_md: Path, state_dir: Path) -> list[str]:
+    """Copy changed sources into the repo and delete removed ones.
+
+    Returns the repo-relative paths that changed ([] on the fast path).
+    """
+    manifest_path = state_dir / "sync-commands-manifest.json"
+    # {rel: [source mtime_ns, source size, sha256, repo mtime_ns, repo size]}
+    manifest: dict[str, list] = _load(manifest_path, {})
+    current = scan_sources(source, claude_md)
+    mirrored = scan_sources(repo / "skills", repo / "CLAUDE.md")
+
+    changed = []
+    new_manifest = {}
+    for rel, (src, st) in current.items():
+        old = manifest.get(rel)
+        dest = mirrored.get(rel)
+        dest_stat = [dest[1].st_mtime_ns, dest[1].st_size] if dest else None
+        if old and old[:2] == [st.st_mtime_ns, st.st_size] and old[3:] == dest_stat:
+            new_manifest[rel] = old
+            continue
+        digest = _hash(src)
+        # A touched-but-identical file on either side only refreshes its manifest entry
+        if (not old or old[2] != digest or dest is None
+                or (old[3:] != dest_stat and _hash(dest[0]) != digest)):
+            _copy(src, repo / rel)
+            changed.append(rel)
+        dest_st = os.lstat(repo / rel)
+        new_manifest[rel] = [st.st_mtime_ns, st.st_size, digest, dest_st.st_mtime_ns, dest_st.st_size]
+
+    # Deleted sources, and files that only exist on the repo side
+    for rel in mirrored.keys() - current.keys():
+        if rel == "CLAUDE.md":
+            continue  # a missing CLAUDE.md was never propagated as a deletion
+        _remove(repo / rel, repo / "skills")
+        changed.append(rel)
+
+    if new_manifest != manifest:
+        _save(manifest_path, new_manifest)
+    return changed
+
+
+def _git(repo: Path, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, **kwargs)
+
+
+def commit_pending(repo: Path, state_dir: Path, push: bool = True) -> bool:
+    """Commit and push the paths queued by earlier syncs. Returns True if a commit was made."""
+    with open(state_dir / "sync-commands.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        pending_path = state_dir / "sync-commands-pending.json"
+        paths = sorted(set(_load(pending_path, {}).get("paths", [])))
+        if not paths:
+            return False
+        # A path that is neither on disk nor tracked (created and deleted
+        # within one window) would make git reject the whole pathspec
+        tracked = set(_git(repo, "ls-files", "-z", "--", *paths).stdout.split("\0"))
+        paths = [p for p in paths if p in tracked or os.path.lexists(repo / p)]
+        # -A on explicit pathspecs picks up deletions without touching the rest of the tree
+        if paths:
+            _git(repo, "add", "-A", "--", *paths)
+        staged = _git(repo, "diff", "--cached", "--name-only", "-z", "--", *paths).stdout.split("\0") if paths else []
+        staged = [p for p in staged if p]
+        if not staged:
+            pending_path.unlink(missing_ok=True)
+            return False
+        result = _git(repo, "commit", "-q", "-m", COMMIT_MESSAGE, "--", *staged)
+        if result.returncode != 0:
+            print(result.stderr, file=sys.stderr)
+            return False
+        pending_path.unlink(missing_ok=True)
+    if push:
+        _git(repo, "push", "-q", "origin", "main")
+    print("claude-core synced to GitHub")
+    return True
+
+
+def queue_commit(state_dir: Path, paths: list[str]) -> str:
+    """Add paths to the pending set and return a fresh debounce token."""
+    with open(state_dir / "sync-commands.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        pending_path = state_dir / "sync-commands-pending.json"
+        pending = _load(pending_path, {})
+        token = str(time.time_ns())
+        _save(pending_path, {"paths": sorted(set(pending.get("paths", [])) | set(paths)), "token": token})
+    return token
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync Claude commands into claude-core and push")
+    parser.add_argument("--repo", type=Path, default=Path(__file__).resolve().parent.parent, help="claude-core checkout")
+    parser.add_argument("--source", type=Path, default=Path.home() / ".claude" / "commands", help="Commands directory to mirror")
+    parser.add_argument("--claude-md", type=Path, default=Path.home() / ".claude" / "CLAUDE.md", help="CLAUDE.md to copy")
+    parser.add_argument("--debounce", type=float, default=5.0, help="Seconds to wait for further edits before committing (0: commit now)")
+    parser.add_argument("--no-push", action="store_true", help="Commit but don't push")
+    parser.add_argument("--commit-after", metavar="TOKEN", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    repo = args.repo.resolve()
+    state_dir = repo / ".git"
+    if not state_dir.is_dir():
+        # Worktrees and submodules have a .git file; ask git only then
+        git_dir = _git(repo, "rev-parse", "--absolute-git-dir")
+        if git_dir.returncode != 0:
+            print(f"ERROR: Not a git repository: {repo}", file=sys.stderr)
+            sys.exit(1)
+        state_dir = Path(git_dir.stdout.strip())
+
+    if args.commit_after:
+        # Detached debounce worker: commit only if no newer edit re-armed the timer
+        time.sleep(args.debounce)
+        if _load(state_dir / "sync-commands-pending.json", {}).get("token") == args.commit_after:
+            commit_pending(repo, state_dir, push=not args.no_push)
+        return
+
+    changed = sync_files(repo, args.source, args.claude_md, state_dir)
+    if not changed:
+        return
+    token = queue_commit(state_dir, changed)
+    if args.debounce <= 0:
+        commit_pending(repo, state_dir, push=not args.no_push)
+        return
+
+    worker = [sys.executable, __file__, "--repo", str(repo), "--debounce", str(args.debounce), "--commit-after", token]
+    if args.no_push:
+        worker.append("--no-push")
+    subprocess.Popen(
+        worker,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Resolve missing .bib abstracts from the local Zotero library in one batch.
+
+The abstract-fetch skill checks Zotero before any online source. This does
+that step for a whole .bib file at once, without network access:
+
+1. zotero.sqlite is opened read-only; if Zotero holds a lock on it, a copy
+   is read instead.
+2. Every item with an abstract goes into a persistent index (an SQLite file,
+   rebuilt only when zotero.sqlite changes) keyed by normalized DOI and by
+   normalized title.
+3. Each entry missing an abstract is matched by DOI, then exact normalized
+   title, then fuzzy title (same first author, close year, title similarity
+   above --min-score).
+
+Usage:
+    python zotero_abstracts.py refs.bib [--zotero ~/Zotero/zotero.sqlite] [--output refs.abstracts.bib]
+
+Prints a JSON report ({key: {abstract, match, score, zotero_title}} plus the
+entries still missing) to stdout. With --output, also writes a copy of the
+.bib with the cleaned abstracts added as the last field.
+"""
+
+import argparse
+import difflib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bibtex import author_last_names, iter_blocks, normalize_title, year_of
+
+DEFAULT_ZOTERO = Path.home() / "Zotero" / "zotero.sqlite"
+DEFAULT_INDEX = Path.home() / ".cache" / "claude-core" / "zotero-abstracts.sqlite"
+INDEX_VERSION = 1
+DOI_RE = re.compile(r"10\.\d{4,9}/\S+", re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]*>")
+# %, &, $, _ and # not already preceded by a backslash
+LATEX_SPECIAL_RE = re.compile(r"(?<!\\)([%&$_#])")
+
+ITEMS_SQL = """
+SELECT d.itemID,
+       MAX(CASE WHEN f.fieldName = 'DOI' THEN v.value END),
+       MAX(CASE WHEN f.fieldName = 'extra' THEN v.value END),
+       MAX(CASE WHEN f.fieldName = 'title' THEN v.value END),
+       MAX(CASE WHEN f.fieldName = 'date' THEN v.value END),
+       MAX(CASE WHEN f.fieldName = 'abstractNote' THEN v.value END)
+FROM itemData d
+JOIN fields f ON f.fieldID = d.fieldID
+JOIN itemDataValues v ON v.valueID = d.valueID
+WHERE f.fieldName IN ('DOI', 'extra', 'title', 'date', 'abstractNote')
+  AND d.itemID NOT IN (SELECT itemID FROM deletedItems)
+GROUP BY d.itemID
+"""
+FIRST_AUTHORS_SQL = """
+SELECT ic.itemID, c.lastName
+FROM itemCreators ic JOIN creators c ON c.creatorID = ic.creatorID
+WHERE ic.orderIndex = 0
+"""
+
+
+def normalize_doi(value: str | None) -> str:
+    """Lowercase bare DOI ("10.xxxx/...") from a DOI, URL or 'DOI: ...' line, or ""."""
+    m = DOI_RE.search(value or "")
+    return m.group().rstrip(".,;").lower() if m else ""
+
+
+def match_title(title: str) -> str:
+    """normalize_title, after dropping the HTML tags Zotero keeps in titles."""
+    return normalize_title(TAG_RE.sub("", title))
+
+
+def clean_abstract(text: str) -> str:
+    """Strip JATS/HTML tags, collapse whitespace and escape BibTeX specials."""
+    text = " ".join(TAG_RE.sub(" ", text).split())
+    return LATEX_SPECIAL_RE.sub(r"\\\1", text)
+
+
+def open_zotero(path: Path) -> tuple[sqlite3.Connection, Path | None]:
+    """Read-only connection to zotero.sqlite, and the temp copy used if the
+    live file was locked (the caller deletes it)."""
+    # Don't sit out sqlite's default 5 s busy wait; a running Zotero can hold the lock for long
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=0.2)
+    try:
+        conn.execute("SELECT 1 FROM itemData LIMIT 1").fetchall()
+        return conn, None
+    except sqlite3.OperationalError as e:
+        conn.close()
+        if "locked" not in str(e):
+            raise
+    tmp = Path(tempfile.mkdtemp(prefix="zotero-")) / "zotero.sqlite"
+    shutil.copy2(path, tmp)
+    wal = Path(f"{path}-wal")
+    if wal.exists():
+        shutil.copy2(wal, Path(f"{tmp}-wal"))
+    return sqlite3.connect(f"file:{tmp}?mode=ro", uri=True), tmp
+
+
+def _source_stamp(zotero: Path) -> str:
+    parts = []
+    for p in (zotero, Path(f"{zotero}-wal")):
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+    return f"{INDEX_VERSION}|{zotero.resolve()}|{'|'.join(parts)}"
+
+
+def build_index(zotero: Path, index: Path) -> int:
+    """(Re)build the abstract index from zotero.sqlite. Returns the item count."""
+    src, copy = open_zotero(zotero)
+    try:
+        first_authors = dict(src.execute(FIRST_AUTHORS_SQL).fetchall())
+        rows = []
+        for item_id, doi, extra, title, date, abstract in src.execute(ITEMS_SQL):
+            if not abstract or not abstract.strip():
+                continue
+            year = re.search(r"\d{4}", date or "")
+            rows.append((
+                item_id,
+                normalize_doi(doi) or normalize_doi(extra),
+                match_title(title or ""),
+                title or "",
+                int(year.group()) if year else None,
+                normalize_title(first_authors.get(item_id) or ""),
+                abstract,
+            ))
+    finally:
+        src.close()
+        if copy:
+            shutil.rmtree(copy.parent, ignore_errors=True)
+
+    index.parent.mkdir(parents=True, exist_ok=True)
+    tmp = index.with_name(index.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    with conn:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(
+            "CREATE TABLE abstracts (item_id INTEGER, doi TEXT, title_norm TEXT, title TEXT, "
+            "year INTEGER, first_author TEXT, abstract TEXT)"
+        )
+        conn.executemany("INSERT INTO abstracts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("CREATE INDEX abstracts_doi ON abstracts (doi)")
+        conn.execute("CREATE INDEX abstracts_title ON abstracts (title_norm)")
+        conn.execute("INSERT INTO meta VALUES ('source', ?)", (_source_stamp(zotero),))
+    conn.close()
+    os.replace(tmp, index)
+    return len(rows)
+
+
+def ensure_index(zotero: Path, index: Path, rebuild: bool = False) -> bool:
+    """Build the index if it is missing or older than zotero.sqlite. Returns True if rebuilt."""
+    if not rebuild and index.exists():
+        conn = sqlite3.connect(f"file:{index}?mode=ro", uri=True)
+        try:
+            stamp = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        except sqlite3.DatabaseError:
+            stamp = None
+        finally:
+            conn.close()
+        if stamp and stamp[0] == _source_stamp(zotero):
+            return False
+    build_index(zotero, index)
+    return True
+
+
+class AbstractIndex:
+    """In-memory view of the index for batch lookups."""
+
+    def __init__(self, index: Path):
+        conn = sqlite3.connect(f"file:{index}?mode=ro", uri=True)
+        self.items = conn.execute("SELECT doi, title_norm, title, year, first_author, abstract FROM abstracts").fetchall()
+        conn.close()
+        self.by_doi: dict[str, int] = {}
+        self.by_title: dict[str, list[int]] = {}
+        self.by_word: dict[str, list[int]] = {}
+        for i, (doi, title_norm, *_rest) in enumerate(self.items):
+            if doi:
+                self.by_doi.setdefault(doi, i)
+            if title_norm:
+                self.by_title.setdefault(title_norm, []).append(i)
+                for word in set(title_norm.split()):
+                    self.by_word.setdefault(word, []).append(i)
+
+    def _fuzzy(self, title_norm: str, first_author: str, year: int | None, min_score: float) -> tuple[int, float] | None:
+        # Misspelled words are not in the index and say nothing about candidates
+        words = sorted((w for w in set(title_norm.split()) if w in self.by_word), key=lambda w: len(self.by_word[w]))
+        # Any title close enough shares at least one of the query's rarest indexed words
+        candidates = {i for w in words[:3] for i in self.by_word.get(w, ())}
+        best = None
+        for i in candidates:
+            _, cand_title, _, cand_year, cand_author, _ = self.items[i]
+            if first_author and cand_author and first_author != cand_author:
+                continue
+            if year and cand_year and abs(year - cand_year) > 1:
+                continue
+            matcher = difflib.SequenceMatcher(None, title_norm, cand_title)
+            if matcher.real_quick_ratio() < min_score or matcher.quick_ratio() < min_score:
+                continue
+            score = matcher.ratio()
+            if score >= min_score and (best is None or score > best[1]):
+                best = (i, score)
+        return best
+
+    def lookup(self, doi: str, title: str, first_author: str, year: int | None, min_score: float) -> dict | None:
+        hit, how, score = None, None, 1.0
+        if doi and doi in self.by_doi:
+            hit, how = self.by_doi[doi], "doi"
+        title_norm = match_title(title)
+        if hit is None and title_norm in self.by_title:
+            same = self.by_title[title_norm]
+            # Prefer the same first author when several items share a title
+            hit = next((i for i in same if self.items[i][4] == first_author), same[0])
+            how = "title"
+        if hit is None and title_norm:
+            fuzzy = self._fuzzy(title_norm, first_author, year, min_score)
+            if fuzzy:
+                (hit, score), how = fuzzy, "fuzzy"
+        if hit is None:
+            return None
+        return {
+            "abstract": clean_abstract(self.items[hit][5]),
+            "match": how,
+            "score": round(score, 3),
+            "zotero_title": self.items[hit][2],
+        }
+
+
+def resolve_bib(bib: Path, index: AbstractIndex, min_score: float) -> tuple[dict[str, dict], list[str], int]:
+    """({key: match} for entries missing an abstract that Zotero has, keys still missing, entry count)."""
+    found: dict[str, dict] = {}
+    missing: list[str] = []
+    entries = 0
+    with open(bib, encoding="utf-8", errors="surrogateescape") as fp:
+        for block in iter_blocks(fp):
+            if block.kind != "entry" or block.error:
+                continue
+            entries += 1
+            if block.fields.get("abstract", "").strip():
+                continue
+            authors = author_last_names(block.fields.get("author", ""))
+            hit = index.lookup(
+                normalize_doi(block.fields.get("doi", "")),
+                block.fields.get("title", ""),
+                authors[0] if authors else "",
+                year_of(block),
+                min_score,
+            )
+            if hit:
+                found[block.key] = hit
+            else:
+                missing.append(block.key)
+    return found, missing, entries
+
+
+def write_with_abstracts(bib: Path, output: Path, found: dict[str, dict]) -> None:
+    tmp = output.with_name(output.name + ".tmp")
+    with open(bib, encoding="utf-8", errors="surrogateescape") as fp, \
+            open(tmp, "w", encoding="utf-8", errors="surrogateescape") as out:
+        for block in iter_blocks(fp):
+            hit = found.get(block.key) if block.kind == "entry" and not block.error else None
+            out.write(block.with_field("abstract", hit["abstract"]) if hit else block.raw)
+    tmp.replace(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill missing .bib abstracts from the local Zotero database")
+    parser.add_argument("bib", type=Path, help=".bib file to resolve (not modified)")
+    parser.add_argument("--zotero", type=Path, default=DEFAULT_ZOTERO, help=f"zotero.sqlite (default: {DEFAULT_ZOTERO})")
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX, help=f"Abstract index (default: {DEFAULT_INDEX})")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index even if zotero.sqlite is unchanged")
+    parser.add_argument("--min-score", type=float, default=0.92, help="Minimum fuzzy title similarity (default: 0.92)")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write a copy of the .bib with the abstracts added")
+    args = parser.parse_args()
+
+    if not args.bib.is_file():
+        print(f"ERROR: File not found: {args.bib}", file=sys.stderr)
+        sys.exit(1)
+    if not args.zotero.is_file():
+        print(f"ERROR: Zotero database not found: {args.zotero}", file=sys.stderr)
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    if ensure_index(args.zotero, args.index, args.rebuild):
+        print(f"Indexed Zotero abstracts in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+    found, missing, entries = resolve_bib(args.bib, AbstractIndex(args.index), args.min_score)
+    if args.output:
+        write_with_abstracts(args.bib, args.output, found)
+
+    counts = {how: sum(1 for f in found.values() if f["match"] == how) for how in ("doi", "title", "fuzzy")}
+    print(
+        f"{entries} entries, {len(found) + len(missing)} missing abstracts: {len(found)} found in Zotero "
+        f"({counts['doi']} by DOI, {counts['title']} by title, {counts['fuzzy']} fuzzy), "
+        f"{len(missing)} still missing ({time.perf_counter() - t0:.2f}s)",
+        file=sys.stderr,
+    )
+    print(json.dumps({"found": found, "missing": missing}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,16 @@
 """Generate and serve a review page for eval results.
 
 Reads the workspace directory, discovers runs (directories with outputs/),
-embeds all output data into a self-contained HTML page, and serves it via
-a tiny HTTP server. Feedback auto-saves to feedback.json in the workspace.
+and serves a review page via a tiny HTTP server. The page only embeds file
+metadata; output files are served on demand from /files/<run>/<name> (with
+caching headers and range requests), so it loads in the same time however
+large the outputs are. --static instead writes a self-contained HTML page
+with every output embedded. Feedback auto-saves to feedback.json in the
+workspace.
+
+The server is threaded, so a large page or file never blocks feedback
+saves, and compresses HTML/JSON with gzip (or brotli, if the brotli
+module is installed) when the browser accepts it.
 
 Usage:
     python generate_review.py <workspace-path> [--port PORT] [--skill-name NAME]
@@ -14,6 +22,8 @@ No dependencies beyond the Python stdlib are required.
 
 import argparse
 import base64
+import gzip
+import hashlib
 import json
 import mimetypes
 import os
@@ -21,15 +31,21 @@ import re
 import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import webbrowser
-from functools import partial
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from functools import lru_cache, partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
 
 # Files to exclude from output listings
 METADATA_FILES = {"user_notes.md", "metrics.json"}
 
+# Directories never searched for runs
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
+
 # Extensions we render as inline text
 TEXT_EXTENSIONS = {
     ".txt", ".md", ".json", ".csv", ".py", ".js", ".ts", ".tsx", ".jsx",
@@ -57,33 +73,52 @@ def get_mime_type(path: Path) -> str:
     return mime or "application/octet-stream"
 
 
-def find_runs(workspace: Path) -> list[dict]:
-    """Recursively find directories that contain an outputs/ subdirectory."""
+def find_runs(workspace: Path, file_urls: dict[str, Path] | None = None, url_prefix: str = "/files") -> list[dict]:
+    """Recursively find directories that contain an outputs/ subdirectory.
+
+    With file_urls, output files are described rather than embedded (see
+    build_run) and their URLs are registered in file_urls.
+    """
     runs: list[dict] = []
-    _find_runs_recursive(workspace, workspace, runs)
+    _find_runs_recursive(workspace, workspace, runs, file_urls, url_prefix)
     runs.sort(key=lambda r: (r.get("eval_id", float("inf")), r["id"]))
     return runs
 
 
-def _find_runs_recursive(root: Path, current: Path, runs: list[dict]) -> None:
+def _find_runs_recursive(
+    root: Path,
+    current: Path,
+    runs: list[dict],
+    file_urls: dict[str, Path] | None = None,
+    url_prefix: str = "/files",
+) -> None:
     if not current.is_dir():
         return
 
     outputs_dir = current / "outputs"
     if outputs_dir.is_dir():
-        run = build_run(root, current)
+        run = build_run(root, current, file_urls, url_prefix)
         if run:
             runs.append(run)
         return
 
-    skip = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
     for child in sorted(current.iterdir()):
-        if child.is_dir() and child.name not in skip:
-            _find_runs_recursive(root, child, runs)
+        if child.is_dir() and child.name not in SKIP_DIRS:
+            _find_runs_recursive(root, child, runs, file_urls, url_prefix)
+
 
+def build_run(
+    root: Path,
+    run_dir: Path,
+    file_urls: dict[str, Path] | None = None,
+    url_prefix: str = "/files",
+) -> dict | None:
+    """Build a run dict with prompt, outputs, and grading data.
 
-def build_run(root: Path, run_dir: Path) -> dict | None:
-    """Build a run dict with prompt, outputs, and grading data."""
+    Output files are embedded (embed_file) unless file_urls is given, in
+    which case only their metadata is included (describe_file) and each
+    file's unquoted URL path is mapped to it in file_urls for the server.
+    """
     prompt = ""
     eval_id = None
 
@@ -124,7 +159,12 @@ def build_run(root: Path, run_dir: Path) -> dict | None:
     if outputs_dir.is_dir():
         for f in sorted(outputs_dir.iterdir()):
             if f.is_file() and f.name not in METADATA_FILES:
-                output_files.append(embed_file(f))
+                if file_urls is None:
+                    output_files.append(embed_file(f))
+                else:
+                    file_urls[f"{url_prefix}/{run_id}/{f.name}"] = f
+                    url = f"{url_prefix}/{quote(run_id, safe='')}/{quote(f.name, safe='')}"
+                    output_files.append(describe_file(f, url))
 
     # Load grading if present
     grading = None
@@ -210,10 +250,48 @@ def embed_file(path: Path) -> dict:
         }
 
 
-def load_previous_iteration(workspace: Path) -> dict[str, dict]:
+def _file_type(path: Path) -> str:
+    ext = path.suffix.lower()
+    if ext in TEXT_EXTENSIONS:
+        return "text"
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext == ".pdf":
+        return "pdf"
+    if ext == ".xlsx":
+        return "xlsx"
+    return "binary"
+
+
+def file_version(path: Path, st: os.stat_result) -> str:
+    """Short version hash of a file from its path, size and mtime (not its
+    contents, so describing a run never reads the output files)."""
+    return hashlib.sha1(f"{path}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def describe_file(path: Path, url: str) -> dict:
+    """Metadata for a file the server serves on demand at url."""
+    try:
+        st = path.stat()
+    except OSError:
+        return {"name": path.name, "type": "error", "content": "(Error reading file)"}
+    version = file_version(path, st)
+    return {
+        "name": path.name,
+        "type": _file_type(path),
+        "mime": get_mime_type(path),
+        "size": st.st_size,
+        "hash": version,
+        # The version in the URL lets the browser cache the body indefinitely
+        "url": f"{url}?v={version}",
+    }
+
+
+def load_previous_iteration(workspace: Path, file_urls: dict[str, Path] | None = None) -> dict[str, dict]:
     """Load previous iteration's feedback and outputs.
 
     Returns a map of run_id -> {"feedback": str, "outputs": list[dict]}.
+    With file_urls, outputs are served from /previous-files/ like find_runs.
     """
     result: dict[str, dict] = {}
 
@@ -232,7 +310,7 @@ def load_previous_iteration(workspace: Path) -> dict[str, dict]:
             pass
 
     # Load runs (to get outputs)
-    prev_runs = find_runs(workspace)
+    prev_runs = find_runs(workspace, file_urls, url_prefix="/previous-files")
     for run in prev_runs:
         result[run["id"]] = {
             "feedback": feedback_map.get(run["id"], ""),
@@ -253,7 +331,8 @@ def generate_html(
     previous: dict[str, dict] | None = None,
     benchmark: dict | None = None,
 ) -> str:
-    """Generate the complete standalone HTML page with embedded data."""
+    """Generate the complete HTML page with embedded data (file contents,
+    or only file metadata when the runs were built for serving)."""
     template_path = Path(__file__).parent / "viewer.html"
     template = template_path.read_text()
 
@@ -281,6 +360,220 @@ def generate_html(
     return template.replace("/*__EMBEDDED_DATA__*/", f"const EMBEDDED_DATA = {data_json};")
 
 
+@lru_cache(maxsize=None)
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def choose_encoding(accept_encoding: str) -> str:
+    """Pick br, gzip or identity for an Accept-Encoding header (br only when
+    the brotli module is installed; br wins ties)."""
+    supported = ["br", "gzip"] if _brotli() is not None else ["gzip"]
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[name.strip().lower()] = q
+    best, best_q = "identity", 0.0
+    for name in supported:
+        q = qualities.get(name, qualities.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "br":
+        return _brotli().compress(body, quality=5)
+    return body
+
+
+_feedback_locks: dict[Path, threading.Lock] = {}
+_feedback_locks_guard = threading.Lock()
+# Read once at import: os.umask() can only be queried by setting it, which
+# would race with files other threads create
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _feedback_mode(path: Path) -> int:
+    """Mode for a rewritten feedback.json: the old file's, or what open() would give a new one."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def save_feedback(path: Path, data: dict) -> None:
+    """Write feedback.json atomically (temp file + rename). Saves for the same
+    workspace are serialized, so concurrent tabs never interleave writes."""
+    with _feedback_locks_guard:
+        lock = _feedback_locks.setdefault(path, threading.Lock())
+    with lock:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".feedback-", suffix=".tmp")
+        try:
+            # mkstemp creates the file 0600; keep feedback.json readable as before
+            os.fchmod(fd, _feedback_mode(path))
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(data, indent=2) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+class ReviewServer(ThreadingHTTPServer):
+    # The viewer fires many file requests at once; the default backlog of 5
+    # makes the overflow wait on a SYN retry
+    request_queue_size = 64
+
+
+class WorkspaceIndex:
+    """In-memory index of a workspace's runs, kept fresh by mtimes.
+
+    refresh() only stats directories and run files: a directory's child
+    list is reused while its mtime is unchanged, and a run is rebuilt with
+    build_run only when the stat signature of its metadata, grading or
+    output files changed. The rendered page is cached under a version hash
+    of all signatures, which doubles as its ETag.
+    """
+
+    def __init__(self, workspace: Path, file_urls: dict[str, Path]):
+        self.workspace = workspace
+        self.file_urls = file_urls
+        self._dirs: dict[Path, tuple[int, bool, list[Path]]] = {}
+        self._runs: dict[Path, tuple[tuple, dict]] = {}
+        # (etag, {content-encoding: body}); compressed bodies are added on
+        # first request and reused until the page changes
+        self._page: tuple[str, dict[str, bytes]] | None = None
+        self._lock = threading.Lock()
+
+    def _walk(self, current: Path, found: list[Path]) -> None:
+        try:
+            mtime = current.stat().st_mtime_ns
+        except OSError:
+            return
+        cached = self._dirs.get(current)
+        if cached is None or cached[0] != mtime:
+            is_run = (current / "outputs").is_dir()
+            children = [] if is_run else [
+                c for c in sorted(current.iterdir()) if c.is_dir() and c.name not in SKIP_DIRS
+            ]
+            cached = (mtime, is_run, children)
+            self._dirs[current] = cached
+        if cached[1]:
+            found.append(current)
+            return
+        for child in cached[2]:
+            self._walk(child, found)
+
+    @staticmethod
+    def _signature(run_dir: Path) -> tuple:
+        """(mtime, size) of everything build_run reads, without reading it."""
+        entries: list = []
+        for p in (
+            run_dir / "eval_metadata.json", run_dir.parent / "eval_metadata.json",
+            run_dir / "transcript.md", run_dir / "outputs" / "transcript.md",
+            run_dir / "grading.json", run_dir.parent / "grading.json",
+        ):
+            try:
+                st = p.stat()
+                entries.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                entries.append(None)
+        try:
+            with os.scandir(run_dir / "outputs") as it:
+                for f in sorted(it, key=lambda e: e.name):
+                    st = f.stat()
+                    entries.append((f.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+        return tuple(entries)
+
+    def refresh(self) -> tuple[list[dict], str]:
+        """Current runs (sorted like find_runs) and their version hash."""
+        found: list[Path] = []
+        self._walk(self.workspace, found)
+        runs = []
+        for run_dir in found:
+            signature = self._signature(run_dir)
+            cached = self._runs.get(run_dir)
+            if cached is None or cached[0] != signature:
+                run = build_run(self.workspace, run_dir, self.file_urls)
+                cached = (signature, run)
+                self._runs[run_dir] = cached
+            if cached[1]:
+                runs.append(cached[1])
+        for gone in set(self._runs) - set(found):
+            del self._runs[gone]
+        runs.sort(key=lambda r: (r.get("eval_id", float("inf")), r["id"]))
+        version = hashlib.sha1(repr(sorted(
+            (str(d), sig) for d, (sig, _) in self._runs.items()
+        )).encode()).hexdigest()[:16]
+        return runs, version
+
+    def page(
+        self,
+        skill_name: str,
+        previous: dict[str, dict],
+        benchmark_path: Path | None,
+        encoding: str = "identity",
+    ) -> tuple[bytes, str]:
+        """The review page (in the given content encoding) and its ETag,
+        re-rendered only when something changed. Safe to call from several
+        request threads."""
+        with self._lock:
+            return self._page_locked(skill_name, previous, benchmark_path, encoding)
+
+    def _page_locked(
+        self,
+        skill_name: str,
+        previous: dict[str, dict],
+        benchmark_path: Path | None,
+        encoding: str,
+    ) -> tuple[bytes, str]:
+        runs, version = self.refresh()
+        extra = []
+        for p in (benchmark_path, Path(__file__).parent / "viewer.html"):
+            try:
+                st = p.stat() if p else None
+                extra.append((st.st_mtime_ns, st.st_size) if st else None)
+            except OSError:
+                extra.append(None)
+        etag = '"' + hashlib.sha1(f"{version}:{extra}".encode()).hexdigest()[:16] + '"'
+        if self._page is None or self._page[0] != etag:
+            benchmark = None
+            if benchmark_path and benchmark_path.exists():
+                try:
+                    benchmark = json.loads(benchmark_path.read_text())
+                except (json.JSONDecodeError, OSError):
+                    pass
+            html = generate_html(runs, skill_name, previous, benchmark)
+            self._page = (etag, {"identity": html.encode("utf-8")})
+        bodies = self._page[1]
+        if encoding not in bodies:
+            bodies[encoding] = compress(bodies["identity"], encoding)
+        return bodies[encoding], etag
+
+
 # ---------------------------------------------------------------------------
 # HTTP server (stdlib only, zero dependencies)
 # ---------------------------------------------------------------------------
@@ -305,11 +598,37 @@ def _kill_port(port: int) -> None:
     except FileNotFoundError:
         print("Note: lsof not found, cannot check if port is in use", file=sys.stderr)
 
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single-range "bytes=start-end" header into inclusive offsets.
+
+    Returns None if the range is unsatisfiable; multi-range requests are
+    answered with their first range.
+    """
+    spec = header.split("=", 1)[1].split(",")[0].strip() if "=" in header else ""
+    start_s, _, end_s = spec.partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = min(int(end_s), size - 1) if end_s else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(0, size - int(end_s))
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
 class ReviewHandler(BaseHTTPRequestHandler):
     """Serves the review HTML and handles feedback saves.
 
-    Regenerates the HTML on each page load so that refreshing the browser
-    picks up new eval outputs without restarting the server.
+    Checks the workspace index on each page load so that refreshing the
+    browser picks up new eval outputs without restarting the server. The
+    page only carries file metadata; bodies are served from /files/ and
+    /previous-files/, looked up in the index's file_urls (so only
+    discovered output files can be read).
     """
 
     def __init__(
@@ -319,6 +638,7 @@ class ReviewHandler(BaseHTTPRequestHandler):
         feedback_path: Path,
         previous: dict[str, dict],
         benchmark_path: Path | None,
+        index: WorkspaceIndex,
         *args,
         **kwargs,
     ):
@@ -327,34 +647,109 @@ class ReviewHandler(BaseHTTPRequestHandler):
         self.feedback_path = feedback_path
         self.previous = previous
         self.benchmark_path = benchmark_path
+        self.index = index
+        self.file_urls = index.file_urls
         super().__init__(*args, **kwargs)
 
+    def serve_file(self, path: Path, head_only: bool = False) -> None:
+        """Send a file with ETag/Last-Modified caching and Range support."""
+        try:
+            st = path.stat()
+        except OSError:
+            self.send_error(404)
+            return
+        etag = f'"{file_version(path, st)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        size = st.st_size
+        start, end = 0, size - 1
+        range_header = self.headers.get("Range")
+        if range_header and size > 0:
+            byte_range = parse_range(range_header, size)
+            if byte_range is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+
+        mime = get_mime_type(path)
+        if mime.startswith("text/") or path.suffix.lower() in TEXT_EXTENSIONS:
+            mime = f"{mime}; charset=utf-8"
+        length = max(0, end - start + 1)
+        self.send_header("Content-Type", mime)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(int(st.st_mtime)))
+        # URLs carry ?v=<version>, so a given URL's body never changes
+        self.send_header("Cache-Control", "private, max-age=31536000, immutable")
+        self.end_headers()
+        if head_only:
+            return
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(1 << 16, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def do_HEAD(self) -> None:
+        path = self.file_urls.get(unquote(urlsplit(self.path).path))
+        if path is None:
+            self.send_error(404)
+            return
+        self.serve_file(path, head_only=True)
+
     def do_GET(self) -> None:
-        if self.path == "/" or self.path == "/index.html":
-            # Regenerate HTML on each request (re-scans workspace for new outputs)
-            runs = find_runs(self.workspace)
-            benchmark = None
-            if self.benchmark_path and self.benchmark_path.exists():
-                try:
-                    benchmark = json.loads(self.benchmark_path.read_text())
-                except (json.JSONDecodeError, OSError):
-                    pass
-            html = generate_html(runs, self.skill_name, self.previous, benchmark)
-            content = html.encode("utf-8")
+        route = urlsplit(self.path).path
+        if route.startswith(("/files/", "/previous-files/")):
+            path = self.file_urls.get(unquote(route))
+            if path is None:
+                self.send_error(404)
+                return
+            self.serve_file(path)
+        elif self.path == "/" or self.path == "/index.html":
+            # Re-validated against the workspace on each request, so refreshing
+            # the browser picks up new outputs; unchanged pages get a 304
+            encoding = choose_encoding(self.headers.get("Accept-Encoding", ""))
+            content, etag = self.index.page(self.skill_name, self.previous, self.benchmark_path, encoding)
+            if encoding != "identity":
+                # Each encoding of the page is a different representation
+                etag = f'{etag[:-1]}-{encoding}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header("Content-Type", "text/html; charset=utf-8")
             self.send_header("Content-Length", str(len(content)))
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
             self.end_headers()
             self.wfile.write(content)
         elif self.path == "/api/feedback":
             data = b"{}"
             if self.feedback_path.exists():
                 data = self.feedback_path.read_bytes()
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            self.send_json(data)
         else:
             self.send_error(404)
 
@@ -366,19 +761,26 @@ class ReviewHandler(BaseHTTPRequestHandler):
                 data = json.loads(body)
                 if not isinstance(data, dict) or "reviews" not in data:
                     raise ValueError("Expected JSON object with 'reviews' key")
-                self.feedback_path.write_text(json.dumps(data, indent=2) + "\n")
-                resp = b'{"ok":true}'
-                self.send_response(200)
+                save_feedback(self.feedback_path, data)
+                self.send_json(b'{"ok":true}')
             except (json.JSONDecodeError, OSError, ValueError) as e:
-                resp = json.dumps({"error": str(e)}).encode()
-                self.send_response(500)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(resp)))
-            self.end_headers()
-            self.wfile.write(resp)
+                self.send_json(json.dumps({"error": str(e)}).encode(), status=500)
         else:
             self.send_error(404)
 
+    def send_json(self, data: bytes, status: int = 200) -> None:
+        """Send a JSON body, compressed when it is worth it and accepted."""
+        encoding = choose_encoding(self.headers.get("Accept-Encoding", "")) if len(data) > 1024 else "identity"
+        data = compress(data, encoding)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        self.wfile.write(data)
+
     def log_message(self, format: str, *args: object) -> None:
         # Suppress request logging to keep terminal clean
         pass
@@ -408,7 +810,10 @@ def main() -> None:
         print(f"Error: {workspace} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    runs = find_runs(workspace)
+    # Served pages only describe output files; --static embeds them all
+    file_urls: dict[str, Path] | None = None if args.static else {}
+
+    runs = find_runs(workspace, file_urls)
     if not runs:
         print(f"No runs found in {workspace}", file=sys.stderr)
         sys.exit(1)
@@ -418,7 +823,7 @@ def main() -> None:
 
     previous: dict[str, dict] = {}
     if args.previous_workspace:
-        previous = load_previous_iteration(args.previous_workspace.resolve())
+        previous = load_previous_iteration(args.previous_workspace.resolve(), file_urls)
 
     benchmark_path = args.benchmark.resolve() if args.benchmark else None
     benchmark = None
@@ -438,12 +843,13 @@ def main() -> None:
     # Kill any existing process on the target port
     port = args.port
     _kill_port(port)
-    handler = partial(ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path)
+    index = WorkspaceIndex(workspace, file_urls)
+    handler = partial(ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path, index)
     try:
-        server = HTTPServer(("127.0.0.1", port), handler)
+        server = ReviewServer(("127.0.0.1", port), handler)
     except OSError:
         # Port still in use after kill attempt — find a free one
-        server = HTTPServer(("127.0.0.1", 0), handler)
+        server = ReviewServer(("127.0.0.1", 0), handler)
         port = server.server_address[1]
 
     url = f"http://localhost:{port}"
@@ -3,8 +3,10 @@
 Aggregate individual run results into benchmark summary statistics.
 
 Reads grading.json files from run directories and produces:
-- run_summary with mean, stddev, min, max for each metric
-- delta between with_skill and without_skill configurations
+- run_summary with mean, stddev, min, max, p50, p95 and a bootstrap
+  confidence interval of the mean for each metric
+- delta between with_skill and without_skill configurations, plus
+  pairwise deltas (with confidence intervals) across all configurations
 
 Usage:
     python aggregate_benchmark.py <benchmark_dir>
@@ -37,7 +39,10 @@ The script supports two directory layouts:
 import argparse
 import json
 import math
+import os
+import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -64,123 +69,348 @@ def calculate_stats(values: list[float]) -> dict:
     }
 
 
-def load_run_results(benchmark_dir: Path) -> dict:
+METRICS = ("pass_rate", "time_seconds", "tokens")
+BOOTSTRAP_RESAMPLES = 10_000
+CONFIDENCE = 0.95
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Linear-interpolation percentile (same convention as numpy's default)."""
+    pos = (len(sorted_values) - 1) * q
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _bootstrap_means_numpy(columns: list[list[float]], resamples: int, seed: int) -> list[list[float]]:
+    import numpy as np
+
+    data = np.asarray(columns, dtype=float)  # (metrics, runs)
+    n = data.shape[1]
+    rng = np.random.default_rng(seed)
+    # Draw resample indices in chunks so memory stays bounded for large n
+    chunk = max(1, 2_000_000 // n)
+    means = []
+    for start in range(0, resamples, chunk):
+        idx = rng.integers(0, n, size=(min(chunk, resamples - start), n))
+        # Row-by-row take is much faster than one fancy-indexed 3-D gather
+        means.append(np.stack([row[idx].mean(axis=1) for row in data]))
+    return np.concatenate(means, axis=1).tolist()
+
+
+def _bootstrap_means_python(columns: list[list[float]], resamples: int, seed: int) -> list[list[float]]:
+    n = len(columns[0])
+    rng = random.Random(seed)
+    indices = range(n)
+    means: list[list[float]] = [[] for _ in columns]
+    for _ in range(resamples):
+        idx = rng.choices(indices, k=n)
+        for col, out in zip(columns, means):
+            out.append(sum(map(col.__getitem__, idx)) / n)
+    return means
+
+
+def bootstrap_means(columns: list[list[float]], resamples: int, seed: int = 0) -> list[list[float]]:
+    """Bootstrap distribution of the mean for several equal-length columns.
+
+    All columns are resampled with the same run indices, so one pass covers
+    every metric of a configuration. Uses NumPy when installed and a
+    pure-Python loop otherwise (same statistics, much slower on big inputs).
+    """
+    if resamples <= 0 or not columns or not columns[0]:
+        return [[] for _ in columns]
+    try:
+        return _bootstrap_means_numpy(columns, resamples, seed)
+    except ImportError:
+        return _bootstrap_means_python(columns, resamples, seed)
+
+
+def _interval(samples: list[float]) -> tuple[float, float]:
+    tail = (1 - CONFIDENCE) / 2
+    ordered = sorted(samples)
+    return _percentile(ordered, tail), _percentile(ordered, 1 - tail)
+
+
+def summarize_metrics(runs: list[dict], boot: list[list[float]]) -> dict:
+    """Per-metric stats for one configuration, given its bootstrap means."""
+    summary = {}
+    for metric, means in zip(METRICS, boot):
+        values = [r.get(metric, 0) for r in runs]
+        stats = calculate_stats(values)
+        ordered = sorted(values)
+        stats["p50"] = round(_percentile(ordered, 0.5), 4)
+        stats["p95"] = round(_percentile(ordered, 0.95), 4)
+        if means:
+            low, high = _interval(means)
+            stats["ci_low"] = round(low, 4)
+            stats["ci_high"] = round(high, 4)
+        summary[metric] = stats
+    return summary
+
+
+MANIFEST_NAME = ".aggregate_manifest.json"
+# Bump when _parse_run's output changes, so stale cached runs are re-read
+MANIFEST_VERSION = 2
+
+
+def _scandir_sorted(path: str) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda e: e.name)
+    except OSError:
+        return []
+
+
+def _read_eval_id(eval_entry: os.DirEntry, eval_idx: int) -> int:
+    metadata_path = os.path.join(eval_entry.path, "eval_metadata.json")
+    try:
+        with open(metadata_path) as mf:
+            return json.load(mf).get("eval_id", eval_idx)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, OSError):
+        return eval_idx
+    try:
+        return int(eval_entry.name.split("-")[1])
+    except ValueError:
+        return eval_idx
+
+
+def _scan_benchmark(search_dir: Path) -> list[tuple[object, str, str, int, dict[str, int]]]:
+    """Walk eval-*/<config>/run-* with os.scandir, in the same order as the
+    original glob-based walk.
+
+    Returns (eval_id, config, run_dir, run_number, {file name: mtime_ns})
+    per run; the per-run listing replaces separate exists() checks.
+    """
+    runs = []
+    eval_entries = [e for e in _scandir_sorted(str(search_dir)) if e.name.startswith("eval-")]
+    for eval_idx, eval_entry in enumerate(eval_entries):
+        if not eval_entry.is_dir():
+            continue
+        eval_id = _read_eval_id(eval_entry, eval_idx)
+
+        # Discover config directories dynamically rather than hardcoding names
+        for config_entry in _scandir_sorted(eval_entry.path):
+            if not config_entry.is_dir():
+                continue
+            run_entries = [e for e in _scandir_sorted(config_entry.path) if e.name.startswith("run-")]
+            # Skip non-config directories (inputs, outputs, etc.)
+            if not run_entries:
+                continue
+            for run_entry in run_entries:
+                files = {
+                    f.name: f.stat().st_mtime_ns
+                    for f in _scandir_sorted(run_entry.path)
+                    if f.name in ("grading.json", "timing.json")
+                }
+                runs.append((eval_id, config_entry.name, run_entry.path, int(run_entry.name.split("-")[1]), files))
+    return runs
+
+
+def _parse_run(run_dir: Path, files: dict[str, int]) -> tuple[dict | None, list[str]]:
+    """Read one run's grading.json (and timing.json if needed).
+
+    Returns (metrics without eval_id/run_number, warnings); metrics is None
+    when the run has to be skipped.
+    """
+    warnings: list[str] = []
+    grading_file = run_dir / "grading.json"
+
+    if "grading.json" not in files:
+        return None, [f"Warning: grading.json not found in {run_dir}"]
+
+    try:
+        with open(grading_file) as f:
+            grading = json.load(f)
+    except json.JSONDecodeError as e:
+        return None, [f"Warning: Invalid JSON in {grading_file}: {e}"]
+
+    # Extract metrics
+    result = {
+        "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
+        "passed": grading.get("summary", {}).get("passed", 0),
+        "failed": grading.get("summary", {}).get("failed", 0),
+        "total": grading.get("summary", {}).get("total", 0),
+    }
+
+    # Extract timing — check grading.json first, then sibling timing.json.
+    # timing.json is read whenever present: it is also where the subagent's
+    # token counts are recorded.
+    timing = grading.get("timing", {})
+    result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
+    timing_data = {}
+    if "timing.json" in files:
+        try:
+            with open(run_dir / "timing.json") as tf:
+                timing_data = json.load(tf)
+        except json.JSONDecodeError:
+            pass
+    if result["time_seconds"] == 0.0:
+        result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
+        if not result["time_seconds"] and timing_data.get("duration_ms"):
+            result["time_seconds"] = timing_data["duration_ms"] / 1000
+
+    # Extract metrics if available
+    metrics = grading.get("execution_metrics", {})
+    result["tool_calls"] = metrics.get("total_tool_calls", 0)
+    result["input_tokens"] = timing_data.get("input_tokens") or metrics.get("input_tokens") or 0
+    result["output_tokens"] = timing_data.get("output_tokens") or metrics.get("output_tokens") or 0
+
+    # Tokens: real counts when recorded, output size only as a last resort
+    if timing_data.get("total_tokens"):
+        result["tokens"] = timing_data["total_tokens"]
+        result["tokens_source"] = "total_tokens"
+    elif result["input_tokens"] or result["output_tokens"]:
+        result["tokens"] = result["input_tokens"] + result["output_tokens"]
+        result["tokens_source"] = "input_output_tokens"
+    else:
+        result["tokens"] = metrics.get("output_chars", 0)
+        result["tokens_source"] = "output_chars" if result["tokens"] else "none"
+    result["errors"] = metrics.get("errors_encountered", 0)
+
+    # Extract expectations — viewer requires fields: text, passed, evidence
+    raw_expectations = grading.get("expectations", [])
+    for exp in raw_expectations:
+        if "text" not in exp or "passed" not in exp:
+            warnings.append(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
+    result["expectations"] = raw_expectations
+
+    # Extract notes from user_notes_summary
+    notes_summary = grading.get("user_notes_summary", {})
+    notes = []
+    notes.extend(notes_summary.get("uncertainties", []))
+    notes.extend(notes_summary.get("needs_review", []))
+    notes.extend(notes_summary.get("workarounds", []))
+    result["notes"] = notes
+
+    return result, warnings
+
+
+def load_run_results(benchmark_dir: Path, incremental: bool = False, workers: int = 16) -> dict:
     """
     Load all run results from a benchmark directory.
 
     Returns dict keyed by config name (e.g. "with_skill"/"without_skill",
     or "new_skill"/"old_skill"), each containing a list of run results.
+
+    The tree is listed with os.scandir and the per-run JSON files are read
+    in parallel on a thread pool (mostly I/O wait on slow or network
+    filesystems). With incremental=True, parsed runs are cached in a
+    manifest in benchmark_dir keyed by file mtimes, so re-aggregating after
+    adding a run only reads the new or changed files.
     """
     # Support both layouts: eval dirs directly under benchmark_dir, or under runs/
     runs_dir = benchmark_dir / "runs"
     if runs_dir.exists():
         search_dir = runs_dir
-    elif list(benchmark_dir.glob("eval-*")):
+    elif any(e.name.startswith("eval-") for e in _scandir_sorted(str(benchmark_dir))):
         search_dir = benchmark_dir
     else:
         print(f"No eval directories found in {benchmark_dir} or {benchmark_dir / 'runs'}")
         return {}
 
-    results: dict[str, list] = {}
+    scanned = _scan_benchmark(search_dir)
 
-    for eval_idx, eval_dir in enumerate(sorted(search_dir.glob("eval-*"))):
-        metadata_path = eval_dir / "eval_metadata.json"
-        if metadata_path.exists():
-            try:
-                with open(metadata_path) as mf:
-                    eval_id = json.load(mf).get("eval_id", eval_idx)
-            except (json.JSONDecodeError, OSError):
-                eval_id = eval_idx
-        else:
-            try:
-                eval_id = int(eval_dir.name.split("-")[1])
-            except ValueError:
-                eval_id = eval_idx
+    manifest_path = benchmark_dir / MANIFEST_NAME
+    manifest: dict[str, dict] = {}
+    if incremental and manifest_path.exists():
+        try:
+            stored = json.loads(manifest_path.read_text())
+            if stored.get("version") == MANIFEST_VERSION:
+                manifest = stored["runs"]
+        except (json.JSONDecodeError, OSError, KeyError):
+            manifest = {}
 
-        # Discover config directories dynamically rather than hardcoding names
-        for config_dir in sorted(eval_dir.iterdir()):
-            if not config_dir.is_dir():
-                continue
-            # Skip non-config directories (inputs, outputs, etc.)
-            if not list(config_dir.glob("run-*")):
-                continue
-            config = config_dir.name
-            if config not in results:
-                results[config] = []
-
-            for run_dir in sorted(config_dir.glob("run-*")):
-                run_number = int(run_dir.name.split("-")[1])
-                grading_file = run_dir / "grading.json"
-
-                if not grading_file.exists():
-                    print(f"Warning: grading.json not found in {run_dir}")
-                    continue
-
-                try:
-                    with open(grading_file) as f:
-                        grading = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Invalid JSON in {grading_file}: {e}")
-                    continue
-
-                # Extract metrics
-                result = {
-                    "eval_id": eval_id,
-                    "run_number": run_number,
-                    "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
-                    "passed": grading.get("summary", {}).get("passed", 0),
-                    "failed": grading.get("summary", {}).get("failed", 0),
-                    "total": grading.get("summary", {}).get("total", 0),
-                }
+    def load(entry: tuple) -> tuple[dict | None, list[str]]:
+        _, _, run_dir, _, files = entry
+        cached = manifest.get(os.path.relpath(run_dir, benchmark_dir))
+        if cached is not None and cached["files"] == files:
+            return cached["result"], cached["warnings"]
+        return _parse_run(Path(run_dir), files)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        parsed = list(pool.map(load, scanned))
 
-                # Extract timing — check grading.json first, then sibling timing.json
-                timing = grading.get("timing", {})
-                result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
-                timing_file = run_dir / "timing.json"
-                if result["time_seconds"] == 0.0 and timing_file.exists():
-                    try:
-                        with open(timing_file) as tf:
-                            timing_data = json.load(tf)
-                        result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
-                        result["tokens"] = timing_data.get("total_tokens", 0)
-                    except json.JSONDecodeError:
-                        pass
-
-                # Extract metrics if available
-                metrics = grading.get("execution_metrics", {})
-                result["tool_calls"] = metrics.get("total_tool_calls", 0)
-                if not result.get("tokens"):
-                    result["tokens"] = metrics.get("output_chars", 0)
-                result["errors"] = metrics.get("errors_encountered", 0)
-
-                # Extract expectations — viewer requires fields: text, passed, evidence
-                raw_expectations = grading.get("expectations", [])
-                for exp in raw_expectations:
-                    if "text" not in exp or "passed" not in exp:
-                        print(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
-                result["expectations"] = raw_expectations
-
-                # Extract notes from user_notes_summary
-                notes_summary = grading.get("user_notes_summary", {})
-                notes = []
-                notes.extend(notes_summary.get("uncertainties", []))
-                notes.extend(notes_summary.get("needs_review", []))
-                notes.extend(notes_summary.get("workarounds", []))
-                result["notes"] = notes
-
-                results[config].append(result)
+    results: dict[str, list] = {}
+    new_manifest: dict[str, dict] = {}
+    for (eval_id, config, run_dir, run_number, files), (metrics, warnings) in zip(scanned, parsed):
+        if config not in results:
+            results[config] = []
+        for warning in warnings:
+            print(warning)
+        new_manifest[os.path.relpath(run_dir, benchmark_dir)] = {"files": files, "result": metrics, "warnings": warnings}
+        if metrics is None:
+            continue
+        results[config].append({"eval_id": eval_id, "run_number": run_number, **metrics})
+
+    if incremental:
+        tmp = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+        tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "runs": new_manifest}))
+        os.replace(tmp, manifest_path)
 
     return results
 
 
-def aggregate_results(results: dict) -> dict:
+def _per_passed(total: float, passed: int, digits: int = 1) -> float | None:
+    return round(total / passed, digits) if passed else None
+
+
+def run_cost(result: dict) -> dict:
+    """Cost of one run: tokens, wall time and tool calls, absolute and per
+    passed expectation (None when nothing passed)."""
+    passed = result.get("passed", 0)
+    tokens = result.get("tokens", 0)
+    return {
+        "input_tokens": result.get("input_tokens", 0),
+        "output_tokens": result.get("output_tokens", 0),
+        "tokens": tokens,
+        "tokens_source": result.get("tokens_source", "none"),
+        "time_seconds": result.get("time_seconds", 0.0),
+        "tool_calls": result.get("tool_calls", 0),
+        "tokens_per_passed": _per_passed(tokens, passed),
+        "seconds_per_passed": _per_passed(result.get("time_seconds", 0.0), passed, 2),
+        "tool_calls_per_passed": _per_passed(result.get("tool_calls", 0), passed, 2),
+    }
+
+
+def summarize_cost(runs: list[dict]) -> dict:
+    """Total cost of a configuration and its cost per passed expectation.
+
+    estimated_token_runs counts runs whose tokens are only the output_chars
+    proxy, which is not comparable with real token counts.
+    """
+    passed = sum(r.get("passed", 0) for r in runs)
+    tokens = sum(r.get("tokens", 0) for r in runs)
+    seconds = sum(r.get("time_seconds", 0.0) for r in runs)
+    tool_calls = sum(r.get("tool_calls", 0) for r in runs)
+    return {
+        "runs": len(runs),
+        "passed_expectations": passed,
+        "input_tokens": sum(r.get("input_tokens", 0) for r in runs),
+        "output_tokens": sum(r.get("output_tokens", 0) for r in runs),
+        "tokens": tokens,
+        "time_seconds": round(seconds, 2),
+        "tool_calls": tool_calls,
+        "tokens_per_passed": _per_passed(tokens, passed),
+        "seconds_per_passed": _per_passed(seconds, passed, 2),
+        "tool_calls_per_passed": _per_passed(tool_calls, passed, 2),
+        "estimated_token_runs": sum(1 for r in runs if r.get("tokens_source") == "output_chars"),
+    }
+
+
+def aggregate_results(results: dict, resamples: int = BOOTSTRAP_RESAMPLES, seed: int = 0) -> dict:
     """
     Aggregate run results into summary statistics.
 
-    Returns run_summary with stats for each configuration and delta.
+    Returns run_summary with stats for each configuration and delta. The
+    delta strings compare the first two configs; delta["pairwise"] lists
+    every pair of configs with bootstrap confidence intervals of the
+    difference in means. resamples=0 skips the bootstrap.
     """
     run_summary = {}
     configs = list(results.keys())
+    boot_by_config = {}
 
     for config in configs:
         runs = results.get(config, [])
@@ -193,15 +423,11 @@ def aggregate_results(results: dict) -> dict:
             }
             continue
 
-        pass_rates = [r["pass_rate"] for r in runs]
-        times = [r["time_seconds"] for r in runs]
-        tokens = [r.get("tokens", 0) for r in runs]
-
-        run_summary[config] = {
-            "pass_rate": calculate_stats(pass_rates),
-            "time_seconds": calculate_stats(times),
-            "tokens": calculate_stats(tokens)
-        }
+        columns = [[float(r.get(metric, 0)) for r in runs] for metric in METRICS]
+        # Offset the seed per config so their resamples are independent
+        boot_by_config[config] = bootstrap_means(columns, resamples, seed + len(boot_by_config))
+        run_summary[config] = summarize_metrics(runs, boot_by_config[config])
+        run_summary[config]["cost"] = summarize_cost(runs)
 
     # Calculate delta between the first two configs (if two exist)
     if len(configs) >= 2:
@@ -215,21 +441,46 @@ def aggregate_results(results: dict) -> dict:
     delta_time = primary.get("time_seconds", {}).get("mean", 0) - baseline.get("time_seconds", {}).get("mean", 0)
     delta_tokens = primary.get("tokens", {}).get("mean", 0) - baseline.get("tokens", {}).get("mean", 0)
 
+    pairwise = []
+    for i, a in enumerate(configs):
+        for b in configs[i + 1:]:
+            if a not in boot_by_config or b not in boot_by_config:
+                continue
+            pair = {"a": a, "b": b}
+            for m, metric in enumerate(METRICS):
+                entry = {"delta": round(run_summary[a][metric]["mean"] - run_summary[b][metric]["mean"], 4)}
+                boot_a, boot_b = boot_by_config[a][m], boot_by_config[b][m]
+                if boot_a and boot_b:
+                    low, high = _interval([x - y for x, y in zip(boot_a, boot_b)])
+                    entry["ci_low"] = round(low, 4)
+                    entry["ci_high"] = round(high, 4)
+                pair[metric] = entry
+            pairwise.append(pair)
+
     run_summary["delta"] = {
         "pass_rate": f"{delta_pass_rate:+.2f}",
         "time_seconds": f"{delta_time:+.1f}",
-        "tokens": f"{delta_tokens:+.0f}"
+        "tokens": f"{delta_tokens:+.0f}",
+        "pairwise": pairwise,
     }
 
     return run_summary
 
 
-def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "") -> dict:
+def generate_benchmark(
+    benchmark_dir: Path,
+    skill_name: str = "",
+    skill_path: str = "",
+    incremental: bool = False,
+    workers: int = 16,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 0,
+) -> dict:
     """
     Generate complete benchmark.json from run results.
     """
-    results = load_run_results(benchmark_dir)
-    run_summary = aggregate_results(results)
+    results = load_run_results(benchmark_dir, incremental=incremental, workers=workers)
+    run_summary = aggregate_results(results, resamples=resamples, seed=seed)
 
     # Build runs array for benchmark.json
     runs = []
@@ -249,6 +500,7 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
                     "tool_calls": result.get("tool_calls", 0),
                     "errors": result.get("errors", 0)
                 },
+                "cost": run_cost(result),
                 "expectations": result["expectations"],
                 "notes": result["notes"]
             })
@@ -278,6 +530,84 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
     return benchmark
 
 
+def _baseline_runs(baseline: dict, config: str) -> list[dict]:
+    """Runs of one config from a baseline benchmark.json, flattened to the
+    load_run_results shape (older files have no "result" nesting or cost)."""
+    runs = []
+    for run in baseline.get("runs", []):
+        if run.get("configuration") != config:
+            continue
+        result = dict(run.get("result", run))
+        result.setdefault("tokens_source", run.get("cost", {}).get("tokens_source", "unknown"))
+        runs.append(result)
+    return runs
+
+
+def check_regression(benchmark: dict, baseline: dict, max_regression: float) -> dict:
+    """Compare the primary config's time and token cost against a baseline.
+
+    A metric regresses when it grows by more than max_regression (a
+    fraction, 0.1 = 10%) and, for means with a bootstrap interval, the
+    whole interval lies above the baseline mean. Token metrics are skipped
+    when only one side has real token counts.
+    """
+    summary = benchmark["run_summary"]
+    base_summary = baseline.get("run_summary", {})
+    configs = [k for k in summary if k != "delta"]
+    base_configs = [k for k in base_summary if k != "delta"]
+    if not configs or not base_configs:
+        return {"passed": True, "checks": [], "note": "nothing to compare"}
+
+    config = configs[0]
+    base_config = config if config in base_summary else base_configs[0]
+    current = summary[config]
+    previous = base_summary[base_config]
+    cost = current.get("cost", {})
+    base_runs = _baseline_runs(baseline, base_config)
+    base_cost = summarize_cost(base_runs)
+
+    def baseline_mean(metric: str) -> float | None:
+        stats = previous.get(metric)
+        if isinstance(stats, dict) and "mean" in stats:
+            return stats["mean"]
+        # Hand-written summaries may lack the stats objects; use the runs
+        values = [r.get(metric, 0) for r in base_runs]
+        return sum(values) / len(values) if values else None
+
+    tokens_comparable = (cost.get("estimated_token_runs", 0) == 0) == (base_cost["estimated_token_runs"] == 0)
+    candidates = [
+        ("time_seconds (mean)", current.get("time_seconds", {}), baseline_mean("time_seconds"), True),
+        ("tokens (mean)", current.get("tokens", {}), baseline_mean("tokens"), tokens_comparable),
+        ("seconds_per_passed", {"mean": cost.get("seconds_per_passed")}, base_cost["seconds_per_passed"], True),
+        ("tokens_per_passed", {"mean": cost.get("tokens_per_passed")}, base_cost["tokens_per_passed"], tokens_comparable),
+    ]
+
+    checks = []
+    for name, stats, old, comparable in candidates:
+        new = stats.get("mean")
+        if not comparable or new is None or not old:
+            checks.append({"metric": name, "current": new, "baseline": old, "status": "skipped"})
+            continue
+        change = (new - old) / old
+        significant = stats.get("ci_low") is None or stats["ci_low"] > old
+        regressed = change > max_regression and significant
+        checks.append({
+            "metric": name,
+            "current": new,
+            "baseline": old,
+            "change": round(change, 4),
+            "status": "regressed" if regressed else "ok",
+        })
+
+    return {
+        "config": config,
+        "baseline_config": base_config,
+        "max_regression": max_regression,
+        "checks": checks,
+        "passed": not any(c["status"] == "regressed" for c in checks),
+    }
+
+
 def generate_markdown(benchmark: dict) -> str:
     """Generate human-readable benchmark.md from benchmark data."""
     metadata = benchmark["metadata"]
@@ -322,6 +652,47 @@ def generate_markdown(benchmark: dict) -> str:
     b_tokens = b_summary.get("tokens", {})
     lines.append(f"| Tokens | {a_tokens.get('mean', 0):.0f} ± {a_tokens.get('stddev', 0):.0f} | {b_tokens.get('mean', 0):.0f} ± {b_tokens.get('stddev', 0):.0f} | {delta.get('tokens', '—')} |")
 
+    # Cost per passed expectation
+    cost_rows = [(c, run_summary[c]["cost"]) for c in configs if "cost" in run_summary[c]]
+    if cost_rows:
+        lines.extend([
+            "",
+            "## Cost",
+            "",
+            "| Configuration | Passed | Tokens | Time | Tool Calls | Tokens / Pass | Time / Pass |",
+            "|---------------|--------|--------|------|------------|---------------|-------------|",
+        ])
+        for config, cost in cost_rows:
+            per_tok = "—" if cost["tokens_per_passed"] is None else f"{cost['tokens_per_passed']:.0f}"
+            per_sec = "—" if cost["seconds_per_passed"] is None else f"{cost['seconds_per_passed']:.1f}s"
+            lines.append(
+                f"| {config} | {cost['passed_expectations']} | {cost['tokens']} | {cost['time_seconds']:.1f}s "
+                f"| {cost['tool_calls']} | {per_tok} | {per_sec} |"
+            )
+        if any(cost["estimated_token_runs"] for _, cost in cost_rows):
+            lines.append("")
+            lines.append("Some runs have no recorded token count; their tokens are the output_chars proxy.")
+
+    # Pairwise deltas with confidence intervals
+    pairwise = delta.get("pairwise", [])
+    if any("ci_low" in pair["pass_rate"] for pair in pairwise):
+        ci = f"{CONFIDENCE*100:.0f}% CI"
+        lines.extend([
+            "",
+            "## Pairwise Deltas",
+            "",
+            f"| Comparison | Pass Rate ({ci}) | Time ({ci}) | Tokens ({ci}) |",
+            "|------------|------------------|-------------|---------------|",
+        ])
+        for pair in pairwise:
+            pr, t, tok = pair["pass_rate"], pair["time_seconds"], pair["tokens"]
+            lines.append(
+                f"| {pair['a']} − {pair['b']} "
+                f"| {pr['delta']:+.2f} [{pr.get('ci_low', 0):+.2f}, {pr.get('ci_high', 0):+.2f}] "
+                f"| {t['delta']:+.1f}s [{t.get('ci_low', 0):+.1f}, {t.get('ci_high', 0):+.1f}] "
+                f"| {tok['delta']:+.0f} [{tok.get('ci_low', 0):+.0f}, {tok.get('ci_high', 0):+.0f}] |"
+            )
+
     # Notes section
     if benchmark.get("notes"):
         lines.extend([
@@ -360,6 +731,54 @@ def main():
         help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json)"
     )
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Cache parsed runs in <benchmark_dir>/{MANIFEST_NAME} and only re-read files that changed"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Threads used to read run files in parallel (default: 16)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Baseline benchmark.json; exit with status 1 if time or token cost regresses against it"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="Allowed relative increase in time/token cost versus --baseline (default: 0.1 = 10%%)"
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="Benchmark history store to append runs to (.sqlite, or .parquet with pyarrow). "
+             "Default: benchmark_history.* next to the directory when it is an iteration-N directory"
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not append runs to the benchmark history store"
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help=f"Bootstrap resamples for confidence intervals, 0 to skip (default: {BOOTSTRAP_RESAMPLES})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for the bootstrap, so reruns give identical intervals (default: 0)"
+    )
+
     args = parser.parse_args()
 
     if not args.benchmark_dir.exists():
@@ -367,12 +786,21 @@ def main():
         sys.exit(1)
 
     # Generate benchmark
-    benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path)
+    benchmark = generate_benchmark(
+        args.benchmark_dir, args.skill_name, args.skill_path,
+        incremental=args.incremental, workers=args.workers,
+        resamples=args.bootstrap, seed=args.seed,
+    )
 
     # Determine output paths
     output_json = args.output or (args.benchmark_dir / "benchmark.json")
     output_md = output_json.with_suffix(".md")
 
+    # Cost regression gate against a previous iteration
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        benchmark["regression"] = check_regression(benchmark, baseline, args.max_regression)
+
     # Write benchmark.json
     with open(output_json, "w") as f:
         json.dump(benchmark, f, indent=2)
@@ -384,6 +812,21 @@ def main():
         f.write(markdown)
     print(f"Generated: {output_md}")
 
+    # Append to the cross-iteration history store
+    if not args.no_store:
+        try:
+            from scripts.benchmark_store import append_benchmark, default_store_path, iteration_of
+        except ImportError:
+            # Run as a plain script (python scripts/aggregate_benchmark.py)
+            from benchmark_store import append_benchmark, default_store_path, iteration_of
+
+        store = args.store
+        if store is None and iteration_of(args.benchmark_dir) is not None:
+            store = default_store_path(args.benchmark_dir)
+        if store is not None:
+            count = append_benchmark(store, benchmark, args.benchmark_dir)
+            print(f"Appended {count} runs to {store}")
+
     # Print summary
     run_summary = benchmark["run_summary"]
     configs = [k for k in run_summary if k != "delta"]
@@ -396,6 +839,18 @@ def main():
         print(f"  {label}: {pr*100:.1f}% pass rate")
     print(f"  Delta:         {delta.get('pass_rate', '—')}")
 
+    regression = benchmark.get("regression")
+    if regression:
+        print(f"\nCost regression check vs {args.baseline} (max +{args.max_regression*100:.0f}%):")
+        for check in regression["checks"]:
+            if check["status"] == "skipped":
+                print(f"  {check['metric']}: skipped")
+                continue
+            print(f"  {check['metric']}: {check['baseline']} -> {check['current']} ({check['change']*100:+.1f}%) {check['status'].upper()}")
+        if not regression["passed"]:
+            print("FAILED: cost regressed beyond the allowed threshold")
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Benchmark the eval harness itself against the fake `claude` CLI.
+
+Drives the real run_eval (and optionally run_loop) against
+scripts/fake_claude.py at several concurrency levels, without spending any
+real `claude -p` calls, and reports per level:
+
+- queries/sec (finished runs per wall-clock second)
+- worker utilization (busy time / (wall time x workers))
+- peak process count and peak RSS of the whole process tree
+- p50/p95 time to decision
+
+Usage:
+    python -m scripts.bench_eval --concurrency 1,4,10 --queries 20 --latency 0.5,0.2
+
+The JSON results go to stdout and a summary table to stderr.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from scripts.run_eval import QueryDurations, run_eval
+from scripts.run_loop import run_loop
+
+FAKE_CLAUDE = Path(__file__).resolve().parent / "fake_claude.py"
+
+
+def process_tree_usage() -> tuple[int, float]:
+    """(process count, total RSS in MB) for this process and its descendants."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        root = psutil.Process()
+        procs = [root, *root.children(recursive=True)]
+        rss = 0
+        for p in procs:
+            try:
+                rss += p.memory_info().rss
+            except psutil.Error:
+                pass
+        return len(procs), rss / 2**20
+
+    # No psutil: one `ps` call, then walk the parent links ourselves
+    out = subprocess.run(["ps", "-eo", "pid=,ppid=,rss="], capture_output=True, text=True).stdout
+    children: dict[int, list[int]] = {}
+    rss_kb: dict[int, int] = {}
+    for line in out.splitlines():
+        pid, ppid, rss = (int(x) for x in line.split())
+        children.setdefault(ppid, []).append(pid)
+        rss_kb[pid] = rss
+    tree = [os.getpid()]
+    for pid in tree:
+        tree.extend(children.get(pid, []))
+    return len(tree), sum(rss_kb.get(pid, 0) for pid in tree) / 1024
+
+
+class ResourceSampler(threading.Thread):
+    """Polls process_tree_usage() in the background and keeps the peaks."""
+
+    def __init__(self, interval: float = 0.25):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_processes = 0
+        self.peak_rss_mb = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            count, rss = process_tree_usage()
+            self.peak_processes = max(self.peak_processes, count)
+            self.peak_rss_mb = max(self.peak_rss_mb, rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def make_eval_set(n: int) -> list[dict]:
+    return [
+        {"query": f"benchmark query {i}: please help me with task number {i}", "should_trigger": i % 2 == 0}
+        for i in range(n)
+    ]
+
+
+def make_skill(root: Path) -> Path:
+    skill_path = root / "bench-skill"
+    skill_path.mkdir()
+    (skill_path / "SKILL.md").write_text(
+        "---\nname: bench-skill\ndescription: Synthetic skill used to benchmark the eval harness.\n---\n\n# Bench\n"
+    )
+    return skill_path
+
+
+def bench_level(args: argparse.Namespace, workers: int, eval_set: list[dict], skill_path: Path, root: Path) -> dict:
+    # Keep the synthetic queries out of the user's real duration store
+    durations = QueryDurations(root / "query_durations.json")
+    sampler = ResourceSampler()
+    sampler.start()
+    t0 = time.perf_counter()
+    if args.loop_iterations:
+        output = run_loop(
+            eval_set=eval_set,
+            skill_path=skill_path,
+            description_override=None,
+            num_workers=workers,
+            timeout=args.timeout,
+            max_iterations=args.loop_iterations,
+            runs_per_query=args.runs_per_query,
+            trigger_threshold=0.5,
+            holdout=0.4,
+            model=None,
+            verbose=False,
+            candidates=args.candidates,
+            durations=durations,
+        )
+        runs = [
+            t
+            for h in output["history"]
+            for r in h["train_results"] + (h["test_results"] or [])
+            for t in r["telemetry"]
+        ]
+    else:
+        output = run_eval(
+            eval_set=eval_set,
+            skill_name="bench-skill",
+            description="Synthetic skill used to benchmark the eval harness.",
+            num_workers=workers,
+            timeout=args.timeout,
+            project_root=root,
+            runs_per_query=args.runs_per_query,
+            durations=durations,
+        )
+        runs = [t for r in output["results"] for t in r["telemetry"]]
+    wall = time.perf_counter() - t0
+    sampler.stop()
+
+    busy = sum(r.get("decision_seconds") or 0.0 for r in runs)
+    decisions = sorted(r["decision_seconds"] for r in runs if r.get("decision_seconds") is not None)
+    return {
+        "workers": workers,
+        "runs": len(runs),
+        "wall_seconds": round(wall, 3),
+        "queries_per_second": round(len(runs) / wall, 3) if wall else None,
+        "worker_utilization": round(busy / (wall * workers), 3) if wall else None,
+        "peak_processes": sampler.peak_processes,
+        "peak_rss_mb": round(sampler.peak_rss_mb, 1),
+        "decision_p50": round(decisions[len(decisions) // 2], 3) if decisions else None,
+        "decision_p95": round(decisions[int(len(decisions) * 0.95)], 3) if decisions else None,
+        "timeouts": sum(1 for r in runs if r.get("decision_source") == "timeout"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark run_eval/run_loop against the fake claude CLI")
+    parser.add_argument("--concurrency", default="1,4,10", help="Comma-separated worker counts to try")
+    parser.add_argument("--queries", type=int, default=20, help="Synthetic queries in the eval set")
+    parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
+    parser.add_argument("--timeout", type=int, default=10, help="Timeout per query in seconds")
+    parser.add_argument("--latency", default="0.5,0.2", help="Fake CLI latency, 'mean[,jitter]' seconds")
+    parser.add_argument("--trigger-rate", type=float, default=0.5, help="Fake CLI trigger probability")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fake CLI failure probability")
+    parser.add_argument("--failure-mode", default="hang", choices=["hang", "crash", "garbage", "slow"], help="Fake CLI failure mode")
+    parser.add_argument("--loop-iterations", type=int, default=0, help="Benchmark run_loop with this many iterations instead of a single run_eval")
+    parser.add_argument("--candidates", type=int, default=1, help="Candidates per iteration when benchmarking run_loop")
+    args = parser.parse_args()
+
+    os.environ.update({
+        "SKILL_CREATOR_CLAUDE": str(FAKE_CLAUDE),
+        "FAKE_CLAUDE_LATENCY": args.latency,
+        "FAKE_CLAUDE_TRIGGER_RATE": str(args.trigger_rate),
+        "FAKE_CLAUDE_FAILURE_RATE": str(args.failure_rate),
+        "FAKE_CLAUDE_FAILURE_MODE": args.failure_mode,
+    })
+
+    eval_set = make_eval_set(args.queries)
+    levels = []
+    with tempfile.TemporaryDirectory(prefix="skill-eval-bench-") as tmp:
+        root = Path(tmp)
+        skill_path = make_skill(root)
+        # run_loop finds its project root from the cwd
+        os.chdir(root)
+        for workers in (int(c) for c in args.concurrency.split(",")):
+            print(f"Benchmarking {workers} worker(s)...", file=sys.stderr)
+            levels.append(bench_level(args, workers, eval_set, skill_path, root))
+
+    print(f"\n{'workers':>7} {'runs':>5} {'wall s':>8} {'q/s':>7} {'util':>6} {'procs':>6} {'rss MB':>8} {'p50 s':>6} {'p95 s':>6}", file=sys.stderr)
+    for lv in levels:
+        print(
+            f"{lv['workers']:>7} {lv['runs']:>5} {lv['wall_seconds']:>8.2f} {lv['queries_per_second']:>7.2f} "
+            f"{lv['worker_utilization']:>6.0%} {lv['peak_processes']:>6} {lv['peak_rss_mb']:>8.1f} "
+            f"{lv['decision_p50'] or 0:>6.2f} {lv['decision_p95'] or 0:>6.2f}",
+            file=sys.stderr,
+        )
+
+    print(json.dumps({"settings": vars(args), "levels": levels}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Columnar history of benchmark runs across skill-creator iterations.
+
+aggregate_benchmark.py appends every run of an iteration to a store next to
+the iteration directories (<skill>-workspace/benchmark_history.*), one row
+per run with flat columns, so trends across iterations and skills can be
+read without re-parsing every nested benchmark.json. The store is a
+directory of Parquet files when pyarrow is installed, and an SQLite
+database otherwise; the backend follows the path suffix.
+
+Usage:
+    # Backfill from existing benchmark.json files
+    python -m scripts.benchmark_store ingest <workspace>/iteration-*/benchmark.json
+
+    # Mean pass rate / time / tokens per iteration and configuration
+    python -m scripts.benchmark_store trends <workspace>/benchmark_history.sqlite [--skill NAME]
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+COLUMNS = {
+    "skill_name": "TEXT",
+    "iteration": "INTEGER",
+    "benchmark_dir": "TEXT",
+    "timestamp": "TEXT",
+    "eval_id": "TEXT",
+    "configuration": "TEXT",
+    "run_number": "INTEGER",
+    "pass_rate": "REAL",
+    "passed": "INTEGER",
+    "failed": "INTEGER",
+    "total": "INTEGER",
+    "time_seconds": "REAL",
+    "tokens": "INTEGER",
+    "tool_calls": "INTEGER",
+    "errors": "INTEGER",
+}
+TREND_METRICS = ("pass_rate", "time_seconds", "tokens")
+ITERATION_RE = re.compile(r"^iteration-(\d+)$")
+
+
+def _have_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_store_path(benchmark_dir: Path) -> Path:
+    """Where aggregate_benchmark keeps the history for a benchmark directory:
+    next to the iteration-N directories of the workspace. An existing store
+    is kept whichever backend wrote it, so installing pyarrow later does not
+    start a new, empty history."""
+    workspace = benchmark_dir.resolve().parent
+    existing = [p for p in (workspace / "benchmark_history.parquet", workspace / "benchmark_history.sqlite") if p.exists()]
+    if existing:
+        return max(existing, key=lambda p: p.stat().st_mtime)
+    suffix = ".parquet" if _have_pyarrow() else ".sqlite"
+    return workspace / f"benchmark_history{suffix}"
+
+
+def iteration_of(benchmark_dir: Path) -> int | None:
+    match = ITERATION_RE.match(benchmark_dir.resolve().name)
+    return int(match.group(1)) if match else None
+
+
+def rows_from_benchmark(benchmark: dict, benchmark_dir: Path) -> list[dict]:
+    """Flatten a benchmark.json into one row per run.
+
+    Accepts both the aggregate_benchmark layout (metrics under "result") and
+    hand-written files with the metrics at the top level of each run.
+    """
+    metadata = benchmark.get("metadata", {})
+    base = {
+        "skill_name": metadata.get("skill_name", ""),
+        "iteration": iteration_of(benchmark_dir),
+        "benchmark_dir": str(benchmark_dir.resolve()),
+        "timestamp": metadata.get("timestamp", ""),
+    }
+    rows = []
+    for run in benchmark.get("runs", []):
+        result = run.get("result", run)
+        rows.append({
+            **base,
+            "eval_id": str(run.get("eval_id", run.get("eval_name", ""))),
+            "configuration": run.get("configuration", ""),
+            "run_number": run.get("run_number", 1),
+            "pass_rate": float(result.get("pass_rate") or 0),
+            "passed": int(result.get("passed") or 0),
+            "failed": int(result.get("failed") or 0),
+            "total": int(result.get("total") or 0),
+            "time_seconds": float(result.get("time_seconds") or 0),
+            "tokens": int(result.get("tokens") or 0),
+            "tool_calls": int(result.get("tool_calls") or 0),
+            "errors": int(result.get("errors") or 0),
+        })
+    return rows
+
+
+# --- SQLite backend ---
+
+def _sqlite_connect(store: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(store)
+    cols = ", ".join(f"{name} {kind}" for name, kind in COLUMNS.items())
+    conn.execute(f"CREATE TABLE IF NOT EXISTS runs ({cols})")
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_by_iteration ON runs (skill_name, iteration)")
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_by_dir ON runs (benchmark_dir)")
+    return conn
+
+
+def _sqlite_append(store: Path, benchmark_dir: str, rows: list[dict]) -> None:
+    with _sqlite_connect(store) as conn:
+        conn.execute("DELETE FROM runs WHERE benchmark_dir = ?", (benchmark_dir,))
+        placeholders = ", ".join("?" * len(COLUMNS))
+        conn.executemany(
+            f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+            [tuple(row[c] for c in COLUMNS) for row in rows],
+        )
+    conn.close()
+
+
+def _sqlite_load(store: Path, columns: list[str], skill: str | None) -> dict[str, list]:
+    conn = _sqlite_connect(store)
+    sql = f"SELECT {', '.join(columns)} FROM runs"
+    params: tuple = ()
+    if skill:
+        sql += " WHERE skill_name = ?"
+        params = (skill,)
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return {c: [r[i] for r in rows] for i, c in enumerate(columns)}
+
+
+# --- Parquet backend: one file per benchmark directory, so re-aggregating
+# an iteration rewrites only its own file ---
+
+def _parquet_file(store: Path, benchmark_dir: str) -> Path:
+    import hashlib
+
+    return store / f"{hashlib.sha1(benchmark_dir.encode()).hexdigest()[:16]}.parquet"
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    kinds = {"TEXT": pa.string(), "INTEGER": pa.int64(), "REAL": pa.float64()}
+    return pa.schema([(name, kinds[kind]) for name, kind in COLUMNS.items()])
+
+
+def _parquet_append(store: Path, benchmark_dir: str, rows: list[dict]) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    store.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pylist(rows, schema=_parquet_schema())
+    target = _parquet_file(store, benchmark_dir)
+    tmp = target.with_suffix(".tmp")
+    pq.write_table(table, tmp)
+    tmp.replace(target)
+
+
+def _parquet_load(store: Path, columns: list[str], skill: str | None) -> dict[str, list]:
+    import pyarrow.dataset as ds
+
+    if not store.exists():
+        return {c: [] for c in columns}
+    dataset = ds.dataset(store, format="parquet", schema=_parquet_schema())
+    flt = ds.field("skill_name") == skill if skill else None
+    return dataset.to_table(columns=columns, filter=flt).to_pydict()
+
+
+def append_benchmark(store: Path, benchmark: dict, benchmark_dir: Path) -> int:
+    """Add (or replace) the runs of one benchmark directory. Returns the row count."""
+    rows = rows_from_benchmark(benchmark, benchmark_dir)
+    key = str(benchmark_dir.resolve())
+    if store.suffix == ".parquet":
+        _parquet_append(store, key, rows)
+    else:
+        _sqlite_append(store, key, rows)
+    return len(rows)
+
+
+def load_columns(store: Path, columns: list[str], skill: str | None = None) -> dict[str, list]:
+    """Read only the given columns, as {column: values}."""
+    unknown = [c for c in columns if c not in COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    if store.suffix == ".parquet":
+        return _parquet_load(store, columns, skill)
+    return _sqlite_load(store, columns, skill)
+
+
+def trends(store: Path, skill: str | None = None) -> list[dict]:
+    """Mean of each trend metric per (skill, iteration, configuration), ordered by iteration."""
+    keys = ["skill_name", "iteration", "configuration"]
+    data = load_columns(store, keys + list(TREND_METRICS), skill)
+
+    groups: dict[tuple, list[int]] = {}
+    for i, key in enumerate(zip(*(data[k] for k in keys))):
+        groups.setdefault(key, []).append(i)
+
+    out = []
+    for (skill_name, iteration, configuration), idx in groups.items():
+        entry = {"skill_name": skill_name, "iteration": iteration, "configuration": configuration, "runs": len(idx)}
+        for metric in TREND_METRICS:
+            entry[metric] = round(sum(data[metric][i] for i in idx) / len(idx), 4)
+        out.append(entry)
+    out.sort(key=lambda e: (e["skill_name"], e["iteration"] is None, e["iteration"] or 0, e["configuration"]))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query or backfill the benchmark history store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Append existing benchmark.json files to a store")
+    ingest.add_argument("benchmark_json", nargs="+", type=Path, help="benchmark.json files (their directory is the iteration)")
+    ingest.add_argument("--store", type=Path, default=None, help="Store path (default: benchmark_history.* next to the iteration directories)")
+
+    trend = sub.add_parser("trends", help="Pass rate, time and tokens by iteration")
+    trend.add_argument("store", type=Path, help="Path to benchmark_history.sqlite or benchmark_history.parquet")
+    trend.add_argument("--skill", default=None, help="Only this skill")
+    trend.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        for path in args.benchmark_json:
+            benchmark_dir = path.parent
+            store = args.store or default_store_path(benchmark_dir)
+            count = append_benchmark(store, json.loads(path.read_text()), benchmark_dir)
+            print(f"{path}: {count} runs -> {store}")
+        return
+
+    if not args.store.exists():
+        print(f"Store not found: {args.store}", file=sys.stderr)
+        sys.exit(1)
+    rows = trends(args.store, args.skill)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'skill':<20} {'iter':>4} {'configuration':<16} {'runs':>5} {'pass rate':>9} {'time s':>8} {'tokens':>9}")
+    for r in rows:
+        iteration = "-" if r["iteration"] is None else r["iteration"]
+        print(
+            f"{r['skill_name'][:20]:<20} {iteration:>4} {r['configuration'][:16]:<16} {r['runs']:>5} "
+            f"{r['pass_rate']*100:>8.1f}% {r['time_seconds']:>8.1f} {r['tokens']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Measure what skill descriptions cost and where they collide.
+
+Every description in a skill library is injected into the available-skills
+list of every session, so the sum of their sizes is paid on every request,
+and two descriptions that say the same thing make routing a coin flip.
+This reads the quick_validate index (refreshing it first) and reports:
+
+- per-skill and total description tokens (estimated, see estimate_tokens)
+- the biggest budget consumers
+- pairs of descriptions with high TF-IDF cosine similarity
+
+Usage:
+    python -m scripts.description_budget ../../skills [--top 10] [--min-similarity 0.3]
+
+As a pre-commit gate (exit 1 when a limit is exceeded):
+    python -m scripts.description_budget skills --max-total-tokens 6000 \\
+        --max-tokens 250 --max-similarity 0.6
+
+The JSON report goes to stdout and a summary to stderr.
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+
+from scripts.quick_validate import validate_all
+
+WORD_RE = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+TOKEN_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+# Words that say nothing about which skill should trigger
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have if in into is it its of on or "
+    "so such that the their them then this to use used user uses via when where "
+    "which while who will with without wants want also any all".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one token per ~4 letters of a word, one
+    per number group of up to 3 digits, and one per punctuation mark."""
+    total = 0
+    for piece in TOKEN_PIECE_RE.findall(text):
+        if piece[0].isalpha():
+            total += math.ceil(len(piece) / 4)
+        elif piece[0].isdigit():
+            total += math.ceil(len(piece) / 3)
+        else:
+            total += 1
+    return total
+
+
+def terms(text: str) -> list[str]:
+    """Content words and adjacent-word bigrams of a description."""
+    words = [w for w in WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def tfidf_vectors(docs: list[str]) -> list[dict[str, float]]:
+    """L2-normalized sparse TF-IDF vectors, one per document."""
+    counts = []
+    df: dict[str, int] = {}
+    for doc in docs:
+        tf: dict[str, int] = {}
+        for term in terms(doc):
+            tf[term] = tf.get(term, 0) + 1
+        counts.append(tf)
+        for term in tf:
+            df[term] = df.get(term, 0) + 1
+
+    n = len(docs)
+    vectors = []
+    for tf in counts:
+        vec = {t: (1 + math.log(c)) * (math.log((1 + n) / (1 + df[t])) + 1) for t, c in tf.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({t: v / norm for t, v in vec.items()})
+    return vectors
+
+
+def similar_pairs(names: list[str], docs: list[str], min_similarity: float) -> list[dict]:
+    """Every pair of documents whose cosine similarity is at least min_similarity.
+
+    Only pairs that share a term are scored: an inverted index over the
+    terms gives the candidate pairs and their dot products in one pass.
+    """
+    vectors = tfidf_vectors(docs)
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for i, vec in enumerate(vectors):
+        for term, weight in vec.items():
+            postings.setdefault(term, []).append((i, weight))
+
+    dots: dict[tuple[int, int], float] = {}
+    shared: dict[tuple[int, int], list[tuple[float, str]]] = {}
+    for term, plist in postings.items():
+        for x in range(len(plist)):
+            i, wi = plist[x]
+            for j, wj in plist[x + 1:]:
+                dots[(i, j)] = dots.get((i, j), 0.0) + wi * wj
+                shared.setdefault((i, j), []).append((wi * wj, term))
+
+    pairs = []
+    for (i, j), sim in dots.items():
+        if sim >= min_similarity:
+            top_terms = [t for _, t in sorted(shared[(i, j)], reverse=True)[:5]]
+            pairs.append({"a": names[i], "b": names[j], "similarity": round(sim, 3), "shared_terms": top_terms})
+    pairs.sort(key=lambda p: -p["similarity"])
+    return pairs
+
+
+def analyze(roots: list[str], top: int = 10, min_similarity: float = 0.3) -> dict:
+    entries = [e for root in roots for e in validate_all(root)]
+    skills = []
+    for e in entries:
+        skills.append({
+            "name": e["name"],
+            "path": e["path"],
+            "chars": e["description_chars"],
+            "tokens": estimate_tokens(e["description"]),
+        })
+    total_tokens = sum(s["tokens"] for s in skills)
+    for s in skills:
+        s["share"] = round(s["tokens"] / total_tokens, 4) if total_tokens else 0.0
+
+    return {
+        "skills": len(skills),
+        "total_tokens": total_tokens,
+        "total_chars": sum(s["chars"] for s in skills),
+        "largest": sorted(skills, key=lambda s: -s["tokens"])[:top],
+        "similar_pairs": similar_pairs(
+            [s["name"] for s in skills], [e["description"] for e in entries], min_similarity
+        ),
+        "per_skill": sorted(skills, key=lambda s: s["name"]),
+    }
+
+
+def check_limits(report: dict, max_total_tokens: int | None, max_tokens: int | None, max_similarity: float | None) -> list[str]:
+    """Human-readable violations of the given limits (empty when within budget)."""
+    problems = []
+    if max_total_tokens is not None and report["total_tokens"] > max_total_tokens:
+        problems.append(f"total description tokens {report['total_tokens']} > {max_total_tokens}")
+    if max_tokens is not None:
+        for s in report["per_skill"]:
+            if s["tokens"] > max_tokens:
+                problems.append(f"{s['name']}: {s['tokens']} tokens > {max_tokens}")
+    if max_similarity is not None:
+        for p in report["similar_pairs"]:
+            if p["similarity"] > max_similarity:
+                problems.append(f"{p['a']} ~ {p['b']}: similarity {p['similarity']} > {max_similarity}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report description token budget and overlapping descriptions")
+    parser.add_argument("roots", nargs="+", help="Skill library directories (as for quick_validate --all)")
+    parser.add_argument("--top", type=int, default=10, help="How many of the largest descriptions to list")
+    parser.add_argument("--min-similarity", type=float, default=0.3, help="Report pairs at or above this cosine similarity")
+    parser.add_argument("--max-total-tokens", type=int, default=None, help="Fail if all descriptions together exceed this")
+    parser.add_argument("--max-tokens", type=int, default=None, help="Fail if any one description exceeds this")
+    parser.add_argument("--max-similarity", type=float, default=None, help="Fail if any pair is more similar than this")
+    args = parser.parse_args()
+
+    min_similarity = args.min_similarity
+    if args.max_similarity is not None:
+        min_similarity = min(min_similarity, args.max_similarity)
+    report = analyze(args.roots, args.top, min_similarity)
+    problems = check_limits(report, args.max_total_tokens, args.max_tokens, args.max_similarity)
+    report["violations"] = problems
+
+    print(f"{report['skills']} skills, {report['total_tokens']} description tokens ({report['total_chars']} chars)", file=sys.stderr)
+    for s in report["largest"]:
+        print(f"  {s['tokens']:>5} tok {s['share']:>6.1%}  {s['name']}", file=sys.stderr)
+    for p in report["similar_pairs"]:
+        print(f"  similar {p['similarity']:.2f}: {p['a']} ~ {p['b']} ({', '.join(p['shared_terms'])})", file=sys.stderr)
+    for problem in problems:
+        print(f"FAIL {problem}", file=sys.stderr)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Stand-in for the `claude` CLI, for exercising the eval scripts offline.
+
+Point the scripts at it with SKILL_CREATOR_CLAUDE=/path/to/fake_claude.py,
+or put it on PATH under the name `claude`. It understands the two call
+shapes the scripts use:
+
+    claude -p <query> --output-format stream-json ...   (run_eval)
+    claude -p --output-format text  < prompt            (improve_description)
+
+In stream-json mode it emits a synthetic stream in which Claude either
+invokes one of the temporary skills registered in .claude/commands/ or
+answers in text, or replays a recorded stream. Behaviour is configured
+through environment variables:
+
+    FAKE_CLAUDE_LATENCY        seconds before the first event, "mean[,jitter]" (default 0.5)
+    FAKE_CLAUDE_TRIGGER_RATE   probability of invoking a registered skill (default 0.5)
+    FAKE_CLAUDE_FAILURE_RATE   probability of a failure (default 0)
+    FAKE_CLAUDE_FAILURE_MODE   hang | crash | garbage | slow (default hang)
+    FAKE_CLAUDE_REPLAY         stream-json file to replay instead; "{skill}" in it
+                               is replaced by a registered skill's command name
+    FAKE_CLAUDE_LINE_DELAY     seconds between replayed/synthetic lines (default 0.01)
+    FAKE_CLAUDE_SEED           seed for reproducible behaviour
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+TEMP_COMMAND_RE = re.compile(r"-skill-[0-9a-f]{8}\.md$")
+
+
+def env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def sleep_latency(rng: random.Random, spec: str) -> None:
+    mean, _, jitter = spec.partition(",")
+    delay = float(mean) + (rng.uniform(-1, 1) * float(jitter) if jitter else 0.0)
+    time.sleep(max(0.0, delay))
+
+
+def emit(event: dict, line_delay: float) -> None:
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+    if line_delay:
+        time.sleep(line_delay)
+
+
+def registered_skills() -> list[str]:
+    commands_dir = Path(".claude") / "commands"
+    if not commands_dir.is_dir():
+        return []
+    return sorted(p.stem for p in commands_dir.iterdir() if TEMP_COMMAND_RE.search(p.name))
+
+
+def fail(mode: str, line_delay: float) -> None:
+    if mode == "crash":
+        print("fake claude: simulated crash", file=sys.stderr)
+        sys.exit(1)
+    if mode == "garbage":
+        sys.stdout.write("{not json\n\x00\x01 partial")
+        sys.stdout.flush()
+        sys.exit(0)
+    if mode == "slow":
+        # Decides eventually, but only after the default 30 s eval timeout
+        time.sleep(35)
+        return
+    # hang: never produce output, never exit on our own
+    while True:
+        time.sleep(60)
+
+
+def stream(query: str, rng: random.Random, line_delay: float) -> None:
+    skills = registered_skills()
+    replay = os.environ.get("FAKE_CLAUDE_REPLAY")
+    if replay:
+        skill = rng.choice(skills) if skills else ""
+        for line in Path(replay).read_text().splitlines():
+            if line.strip():
+                sys.stdout.write(line.replace("{skill}", skill) + "\n")
+                sys.stdout.flush()
+                time.sleep(line_delay)
+        return
+
+    emit({"type": "system", "subtype": "init", "session_id": "fake"}, line_delay)
+    emit({"type": "stream_event", "event": {"type": "message_start"}}, line_delay)
+    if skills and rng.random() < env_float("FAKE_CLAUDE_TRIGGER_RATE", 0.5):
+        skill = rng.choice(skills)
+        payload = json.dumps({"skill": skill})
+        emit({"type": "stream_event", "event": {
+            "type": "content_block_start",
+            "content_block": {"type": "tool_use", "name": "Skill"},
+        }}, line_delay)
+        # Split the input JSON across deltas like the real stream does
+        for i in range(0, len(payload), 16):
+            emit({"type": "stream_event", "event": {
+                "type": "content_block_delta",
+                "delta": {"type": "input_json_delta", "partial_json": payload[i:i + 16]},
+            }}, line_delay)
+        emit({"type": "stream_event", "event": {"type": "content_block_stop"}}, line_delay)
+        content = [{"type": "tool_use", "name": "Skill", "input": {"skill": skill}}]
+    else:
+        text = f"Here is how I would handle: {query[:40]}"
+        emit({"type": "stream_event", "event": {
+            "type": "content_block_start", "content_block": {"type": "text"},
+        }}, line_delay)
+        emit({"type": "stream_event", "event": {
+            "type": "content_block_delta", "delta": {"type": "text_delta", "text": text},
+        }}, line_delay)
+        emit({"type": "stream_event", "event": {"type": "content_block_stop"}}, line_delay)
+        content = [{"type": "text", "text": text}]
+    emit({"type": "stream_event", "event": {"type": "message_stop"}}, line_delay)
+    emit({"type": "assistant", "message": {"content": content}}, line_delay)
+    emit({"type": "result", "subtype": "success"}, line_delay)
+
+
+def improve(rng: random.Random) -> None:
+    prompt = sys.stdin.read()
+    match = re.search(r'<current_description>\s*"(.*?)"\s*</current_description>', prompt, re.DOTALL)
+    current = match.group(1) if match else "A skill"
+    print(f"<new_description>{current} (variant {rng.randrange(10**6)})</new_description>")
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    seed = os.environ.get("FAKE_CLAUDE_SEED")
+    rng = random.Random(f"{seed}-{args}" if seed is not None else None)
+    line_delay = env_float("FAKE_CLAUDE_LINE_DELAY", 0.01)
+    output_format = args[args.index("--output-format") + 1] if "--output-format" in args else "text"
+
+    sleep_latency(rng, os.environ.get("FAKE_CLAUDE_LATENCY", "0.5"))
+    if rng.random() < env_float("FAKE_CLAUDE_FAILURE_RATE", 0.0):
+        fail(os.environ.get("FAKE_CLAUDE_FAILURE_MODE", "hang"), line_delay)
+
+    if output_format == "stream-json":
+        query = args[args.index("-p") + 1]
+        stream(query, rng, line_delay)
+    else:
+        improve(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,25 +13,9 @@ import sys
 from pathlib import Path
 
 
-def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "") -> str:
-    """Generate HTML report from loop output data. If auto_refresh is True, adds a meta refresh tag."""
-    history = data.get("history", [])
-    holdout = data.get("holdout", 0)
-    title_prefix = html.escape(skill_name + " \u2014 ") if skill_name else ""
-
-    # Get all unique queries from train and test sets, with should_trigger info
-    train_queries: list[dict] = []
-    test_queries: list[dict] = []
-    if history:
-        for r in history[0].get("train_results", history[0].get("results", [])):
-            train_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
-        if history[0].get("test_results"):
-            for r in history[0].get("test_results", []):
-                test_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
-
-    refresh_tag = '    <meta http-equiv="refresh" content="5">\n' if auto_refresh else ""
-
-    html_parts = ["""<!DOCTYPE html>
+def _page_head(title_prefix: str, refresh_tag: str = "") -> str:
+    """Everything up to and including the explainer box."""
+    return ("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -150,22 +134,20 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
     <div class="explainer">
         <strong>Optimizing your skill's description.</strong> This page updates automatically as Claude tests different versions of your skill's description. Each row is an iteration — a new description attempt. The columns show test queries: green checkmarks mean the skill triggered correctly (or correctly didn't trigger), red crosses mean it got it wrong. The "Train" score shows performance on queries used to improve the description; the "Test" score shows performance on held-out queries the optimizer hasn't seen. When it's done, Claude will apply the best-performing description to your skill.
     </div>
-"""]
+""")
 
-    # Summary section
+
+def _summary_inner(data: dict) -> str:
     best_test_score = data.get('best_test_score')
-    best_train_score = data.get('best_train_score')
-    html_parts.append(f"""
-    <div class="summary">
+    return f"""
         <p><strong>Original:</strong> {html.escape(data.get('original_description', 'N/A'))}</p>
         <p class="best"><strong>Best:</strong> {html.escape(data.get('best_description', 'N/A'))}</p>
         <p><strong>Best Score:</strong> {data.get('best_score', 'N/A')} {'(test)' if best_test_score else '(train)'}</p>
         <p><strong>Iterations:</strong> {data.get('iterations_run', 0)} | <strong>Train:</strong> {data.get('train_size', '?')} | <strong>Test:</strong> {data.get('test_size', '?')}</p>
-    </div>
-""")
+"""
 
-    # Legend
-    html_parts.append("""
+
+LEGEND_HTML = """
     <div class="legend">
         <span style="font-weight:600">Query columns:</span>
         <span class="legend-item"><span class="legend-swatch swatch-positive"></span> Should trigger</span>
@@ -173,10 +155,29 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         <span class="legend-item"><span class="legend-swatch swatch-train"></span> Train</span>
         <span class="legend-item"><span class="legend-swatch swatch-test"></span> Test</span>
     </div>
-""")
+"""
 
-    # Table header
-    html_parts.append("""
+TABLE_TAIL = """        </tbody>
+    </table>
+    </div>
+"""
+
+
+def _query_columns(history: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Train and test query columns, with should_trigger info, from the first iteration."""
+    train_queries: list[dict] = []
+    test_queries: list[dict] = []
+    if history:
+        for r in history[0].get("train_results", history[0].get("results", [])):
+            train_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
+        if history[0].get("test_results"):
+            for r in history[0].get("test_results", []):
+                test_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
+    return train_queries, test_queries
+
+
+def _table_head(train_queries: list[dict], test_queries: list[dict]) -> str:
+    parts = ["""
     <div class="table-container">
     <table>
         <thead>
@@ -185,114 +186,126 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
                 <th>Train</th>
                 <th>Test</th>
                 <th class="query-col">Description</th>
-""")
+"""]
 
     # Add column headers for train queries
     for qinfo in train_queries:
         polarity = "positive-col" if qinfo["should_trigger"] else "negative-col"
-        html_parts.append(f'                <th class="{polarity}">{html.escape(qinfo["query"])}</th>\n')
+        parts.append(f'                <th class="{polarity}">{html.escape(qinfo["query"])}</th>\n')
 
     # Add column headers for test queries (different color)
     for qinfo in test_queries:
         polarity = "positive-col" if qinfo["should_trigger"] else "negative-col"
-        html_parts.append(f'                <th class="test-col {polarity}">{html.escape(qinfo["query"])}</th>\n')
+        parts.append(f'                <th class="test-col {polarity}">{html.escape(qinfo["query"])}</th>\n')
 
-    html_parts.append("""            </tr>
+    parts.append("""            </tr>
         </thead>
         <tbody>
 """)
-
-    # Find best iteration for highlighting
-    if test_queries:
-        best_iter = max(history, key=lambda h: h.get("test_passed") or 0).get("iteration")
-    else:
-        best_iter = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0))).get("iteration")
-
-    # Add rows for each iteration
-    for h in history:
-        iteration = h.get("iteration", "?")
-        train_passed = h.get("train_passed", h.get("passed", 0))
-        train_total = h.get("train_total", h.get("total", 0))
-        test_passed = h.get("test_passed")
-        test_total = h.get("test_total")
-        description = h.get("description", "")
-        train_results = h.get("train_results", h.get("results", []))
-        test_results = h.get("test_results", [])
-
-        # Create lookups for results by query
-        train_by_query = {r["query"]: r for r in train_results}
-        test_by_query = {r["query"]: r for r in test_results} if test_results else {}
-
-        # Compute aggregate correct/total runs across all retries
-        def aggregate_runs(results: list[dict]) -> tuple[int, int]:
-            correct = 0
-            total = 0
-            for r in results:
-                runs = r.get("runs", 0)
-                triggers = r.get("triggers", 0)
-                total += runs
-                if r.get("should_trigger", True):
-                    correct += triggers
-                else:
-                    correct += runs - triggers
-            return correct, total
-
-        train_correct, train_runs = aggregate_runs(train_results)
-        test_correct, test_runs = aggregate_runs(test_results)
-
-        # Determine score classes
-        def score_class(correct: int, total: int) -> str:
-            if total > 0:
-                ratio = correct / total
-                if ratio >= 0.8:
-                    return "score-good"
-                elif ratio >= 0.5:
-                    return "score-ok"
-            return "score-bad"
-
-        train_class = score_class(train_correct, train_runs)
-        test_class = score_class(test_correct, test_runs)
-
-        row_class = "best-row" if iteration == best_iter else ""
-
-        html_parts.append(f"""            <tr class="{row_class}">
+    return "".join(parts)
+
+
+def _score(h: dict, has_test: bool) -> int:
+    """What the best row is chosen by: held-out test passes when there is a test set."""
+    if has_test:
+        return h.get("test_passed") or 0
+    return h.get("train_passed", h.get("passed", 0))
+
+
+def _aggregate_runs(results: list[dict]) -> tuple[int, int]:
+    """Correct/total runs across all retries."""
+    correct = 0
+    total = 0
+    for r in results:
+        runs = r.get("runs", 0)
+        triggers = r.get("triggers", 0)
+        total += runs
+        if r.get("should_trigger", True):
+            correct += triggers
+        else:
+            correct += runs - triggers
+    return correct, total
+
+
+def _score_class(correct: int, total: int) -> str:
+    if total > 0:
+        ratio = correct / total
+        if ratio >= 0.8:
+            return "score-good"
+        elif ratio >= 0.5:
+            return "score-ok"
+    return "score-bad"
+
+
+def _row_html(h: dict, train_queries: list[dict], test_queries: list[dict], is_best: bool) -> str:
+    """One table row: an iteration (or candidate) with a result cell per query."""
+    iteration = h.get("iteration", "?")
+    if "candidate" in h:
+        iteration = f"{iteration}{chr(ord('a') + h['candidate'])}"
+    description = h.get("description", "")
+    train_results = h.get("train_results", h.get("results", []))
+    test_results = h.get("test_results", [])
+
+    # Create lookups for results by query
+    train_by_query = {r["query"]: r for r in train_results}
+    test_by_query = {r["query"]: r for r in test_results} if test_results else {}
+
+    train_correct, train_runs = _aggregate_runs(train_results)
+    test_correct, test_runs = _aggregate_runs(test_results or [])
+    train_class = _score_class(train_correct, train_runs)
+    test_class = _score_class(test_correct, test_runs)
+
+    row_class = "best-row" if is_best else ""
+
+    parts = [f"""            <tr class="{row_class}">
                 <td>{iteration}</td>
                 <td><span class="score {train_class}">{train_correct}/{train_runs}</span></td>
                 <td><span class="score {test_class}">{test_correct}/{test_runs}</span></td>
                 <td class="description">{html.escape(description)}</td>
-""")
+"""]
 
-        # Add result for each train query
-        for qinfo in train_queries:
-            r = train_by_query.get(qinfo["query"], {})
-            did_pass = r.get("pass", False)
-            triggers = r.get("triggers", 0)
-            runs = r.get("runs", 0)
+    # Add result for each train query
+    for qinfo in train_queries:
+        r = train_by_query.get(qinfo["query"], {})
+        did_pass = r.get("pass", False)
+        icon = "✓" if did_pass else "✗"
+        css_class = "pass" if did_pass else "fail"
+        parts.append(f'                <td class="result {css_class}">{icon}<span class="rate">{r.get("triggers", 0)}/{r.get("runs", 0)}</span></td>\n')
 
-            icon = "✓" if did_pass else "✗"
-            css_class = "pass" if did_pass else "fail"
+    # Add result for each test query (with different background)
+    for qinfo in test_queries:
+        r = test_by_query.get(qinfo["query"], {})
+        did_pass = r.get("pass", False)
+        icon = "✓" if did_pass else "✗"
+        css_class = "pass" if did_pass else "fail"
+        parts.append(f'                <td class="result test-result {css_class}">{icon}<span class="rate">{r.get("triggers", 0)}/{r.get("runs", 0)}</span></td>\n')
 
-            html_parts.append(f'                <td class="result {css_class}">{icon}<span class="rate">{triggers}/{runs}</span></td>\n')
+    parts.append("            </tr>\n")
+    return "".join(parts)
 
-        # Add result for each test query (with different background)
-        for qinfo in test_queries:
-            r = test_by_query.get(qinfo["query"], {})
-            did_pass = r.get("pass", False)
-            triggers = r.get("triggers", 0)
-            runs = r.get("runs", 0)
 
-            icon = "✓" if did_pass else "✗"
-            css_class = "pass" if did_pass else "fail"
+def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "") -> str:
+    """Generate HTML report from loop output data. If auto_refresh is True, adds a meta refresh tag."""
+    history = data.get("history", [])
+    title_prefix = html.escape(skill_name + " \u2014 ") if skill_name else ""
+    train_queries, test_queries = _query_columns(history)
+    refresh_tag = '    <meta http-equiv="refresh" content="5">\n' if auto_refresh else ""
 
-            html_parts.append(f'                <td class="result test-result {css_class}">{icon}<span class="rate">{triggers}/{runs}</span></td>\n')
+    html_parts = [_page_head(title_prefix, refresh_tag)]
+    html_parts.append(f"""
+    <div class="summary">{_summary_inner(data)}    </div>
+""")
+    html_parts.append(LEGEND_HTML)
+    html_parts.append(_table_head(train_queries, test_queries))
 
-        html_parts.append("            </tr>\n")
+    # Find best iteration (or candidate, with --candidates) for highlighting
+    best_entry = max(history, key=lambda h: _score(h, bool(test_queries))) if history else None
 
-    html_parts.append("""        </tbody>
-    </table>
-    </div>
-""")
+    # Add rows for each iteration
+    for h in history:
+        html_parts.append(_row_html(h, train_queries, test_queries, h is best_entry))
 
+    html_parts.append(TABLE_TAIL)
     html_parts.append("""
 </body>
 </html>
@@ -301,6 +314,113 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
     return "".join(html_parts)
 
 
+LIVE_SCRIPT = """
+    <script>
+    // Load the numbered data chunks one after another. <script> tags are
+    // used instead of fetch() because fetch() is blocked for file:// pages.
+    (function() {
+        const dataDir = %s;
+        const tbody = () => document.querySelector("#live-table tbody");
+        let next = 0;
+        let best = null;
+        window.reportChunk = function(chunk) {
+            if (chunk.table !== undefined) document.getElementById("live-table").innerHTML = chunk.table;
+            if (chunk.summary !== undefined) document.querySelector(".summary").innerHTML = chunk.summary;
+            if (chunk.rows) tbody().insertAdjacentHTML("beforeend", chunk.rows.join(""));
+            if (chunk.best !== undefined && chunk.best !== null && chunk.best !== best) {
+                const rows = tbody().rows;
+                if (best !== null && rows[best]) rows[best].classList.remove("best-row");
+                if (rows[chunk.best]) rows[chunk.best].classList.add("best-row");
+                best = chunk.best;
+            }
+            if (chunk.done) next = -1;
+        };
+        function poll() {
+            if (next < 0) return;
+            const script = document.createElement("script");
+            script.src = dataDir + "/" + String(next).padStart(6, "0") + ".js";
+            script.onload = () => { script.remove(); if (next >= 0) next++; poll(); };
+            script.onerror = () => { script.remove(); setTimeout(poll, 2000); };
+            document.head.appendChild(script);
+        }
+        poll();
+    })();
+    </script>
+"""
+
+
+class LiveReport:
+    """Report that run_loop updates while it runs, at O(new rows) per update.
+
+    The HTML file is a static shell written once. Each update is a new,
+    never-modified chunk file in <report>_data/ (summary, new rows, best
+    row) that the page picks up and appends, so nothing is re-rendered and
+    the page never reloads. finish() replaces the shell with the full
+    static report for later viewing.
+    """
+
+    def __init__(self, path: Path, skill_name: str = ""):
+        self.path = path
+        self.skill_name = skill_name
+        self.data_dir = path.with_name(path.stem + "_data")
+        self._seq = 0
+        self._count = 0
+        self._best: int | None = None
+        self._best_score = 0
+        self._train_queries: list[dict] = []
+        self._test_queries: list[dict] = []
+
+    def _write(self, target: Path, text: str) -> None:
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(text)
+        tmp.replace(target)
+
+    def _chunk(self, chunk: dict) -> None:
+        self._write(self.data_dir / f"{self._seq:06d}.js", f"reportChunk({json.dumps(chunk)});\n")
+        self._seq += 1
+
+    def start(self, train_queries: list[dict], test_queries: list[dict], summary: dict, history: list[dict] | None = None) -> None:
+        """Write the shell and the table header; history pre-fills rows (e.g. on --resume)."""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        for old in self.data_dir.glob("*.js"):
+            old.unlink()
+        self._train_queries = [{"query": q["query"], "should_trigger": q.get("should_trigger", True)} for q in train_queries]
+        self._test_queries = [{"query": q["query"], "should_trigger": q.get("should_trigger", True)} for q in test_queries]
+
+        title_prefix = html.escape(self.skill_name + " \u2014 ") if self.skill_name else ""
+        self._write(self.path, "".join([
+            _page_head(title_prefix),
+            '\n    <div class="summary"><p>Starting optimization loop...</p></div>\n',
+            LEGEND_HTML,
+            '\n    <div id="live-table"></div>\n',
+            LIVE_SCRIPT % json.dumps(self.data_dir.name),
+            "\n</body>\n</html>\n",
+        ]))
+        self._chunk({
+            "table": _table_head(self._train_queries, self._test_queries) + TABLE_TAIL,
+            "summary": _summary_inner(summary),
+        })
+        if history:
+            self.append(history, summary)
+
+    def append(self, entries: list[dict], summary: dict) -> None:
+        """Add rows for new history entries and refresh the summary."""
+        rows = []
+        for h in entries:
+            score = _score(h, bool(self._test_queries))
+            # Same tie-breaking as generate_html: the first best row wins
+            if self._best is None or score > self._best_score:
+                self._best, self._best_score = self._count, score
+            rows.append(_row_html(h, self._train_queries, self._test_queries, False))
+            self._count += 1
+        self._chunk({"rows": rows, "best": self._best, "summary": _summary_inner(summary)})
+
+    def finish(self, data: dict) -> None:
+        """Show the final summary on open pages, then swap in the full static report."""
+        self._chunk({"summary": _summary_inner(data), "done": True})
+        self._write(self.path, generate_html(data, skill_name=self.skill_name))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate HTML report from run_loop output")
     parser.add_argument("input", help="Path to JSON output from run_loop.py (or - for stdin)")
@@ -14,7 +14,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from scripts.utils import parse_skill_md
+from scripts.utils import claude_executable, parse_skill_md
 
 
 def _call_claude(prompt: str, model: str | None, timeout: int = 300) -> str:
@@ -23,7 +23,7 @@ def _call_claude(prompt: str, model: str | None, timeout: int = 300) -> str:
     Prompt goes over stdin (not argv) because it embeds the full SKILL.md
     body and can easily exceed comfortable argv length.
     """
-    cmd = ["claude", "-p", "--output-format", "text"]
+    cmd = [claude_executable(), "-p", "--output-format", "text"]
     if model:
         cmd.extend(["--model", model])
 
@@ -57,8 +57,14 @@ def improve_description(
     test_results: dict | None = None,
     log_dir: Path | None = None,
     iteration: int | None = None,
+    candidate: int | None = None,
 ) -> str:
-    """Call Claude to improve the description based on eval results."""
+    """Call Claude to improve the description based on eval results.
+
+    Pass candidate when several descriptions are drafted in parallel from
+    the same results; it nudges each draft in a different direction and
+    keeps the per-candidate logs apart.
+    """
     failed_triggers = [
         r for r in eval_results["results"]
         if r["should_trigger"] and not r["pass"]
@@ -141,6 +147,12 @@ I'd encourage you to be creative and mix up the style in different iterations si
 
 Please respond with only the new description text in <new_description> tags, nothing else."""
 
+    if candidate is not None:
+        prompt += (
+            f"\n\nSeveral alternative descriptions are being drafted in parallel from these same results; "
+            f"this is draft #{candidate + 1}. Take a clearly different angle from the most obvious rewrite."
+        )
+
     text = _call_claude(prompt, model)
 
     match = re.search(r"<new_description>(.*?)</new_description>", text, re.DOTALL)
@@ -185,7 +197,8 @@ Please respond with only the new description text in <new_description> tags, not
 
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"improve_iter_{iteration or 'unknown'}.json"
+        suffix = f"_cand_{candidate}" if candidate is not None else ""
+        log_file = log_dir / f"improve_iter_{iteration or 'unknown'}{suffix}.json"
         log_file.write_text(json.dumps(transcript, indent=2))
 
     return description
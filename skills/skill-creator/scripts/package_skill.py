@@ -2,17 +2,29 @@
 """
 Skill Packager - Creates a distributable .skill file of a skill folder
 
+The archive is reproducible: entries are sorted, timestamps are fixed and
+the content hash is stored as the zip comment, so packaging the same files
+twice gives byte-identical output. Files are read and compressed in a
+thread pool; formats that are already compressed are stored as-is.
+
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--incremental]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
-    python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --incremental
 """
 
+import argparse
 import fnmatch
+import hashlib
+import os
+import struct
 import sys
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from scripts.quick_validate import validate_skill
 
@@ -23,6 +35,24 @@ EXCLUDE_FILES = {".DS_Store"}
 # Directories excluded only at the skill root (not when nested deeper).
 ROOT_EXCLUDE_DIRS = {"evals"}
 
+# Formats whose contents are already compressed; deflating them again only
+# costs time.
+STORED_SUFFIXES = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".skill",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp",
+    ".mp3", ".mp4", ".m4a", ".mov", ".webm", ".ogg",
+    ".woff", ".woff2", ".pdf",
+}
+# Bump when the archive layout changes, so incremental builds repack.
+FORMAT_VERSION = 1
+HASH_PREFIX = b"skill-content-sha256:"
+# MS-DOS date/time of 1980-01-01 00:00, the earliest a zip can record
+FIXED_DOS_TIME = 0
+FIXED_DOS_DATE = (1 << 5) | 1
+# Compressed entries kept in memory ahead of the writer
+IN_FLIGHT_PER_WORKER = 4
+
 
 def should_exclude(rel_path: Path) -> bool:
     """Check if a path should be excluded from packaging."""
@@ -39,13 +69,130 @@ def should_exclude(rel_path: Path) -> bool:
     return any(fnmatch.fnmatch(name, pat) for pat in EXCLUDE_GLOBS)
 
 
-def package_skill(skill_path, output_dir=None):
+def iter_skill_files(skill_path: Path) -> list[tuple[str, Path]]:
+    """(arcname, path) for every file to package, sorted by arcname.
+
+    Excluded directories are pruned before the walk descends into them.
+    """
+    root = skill_path.parent
+    files = []
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        rel_dir = Path(dirpath).relative_to(root)
+        dirnames[:] = [d for d in dirnames if not should_exclude(rel_dir / d)]
+        for name in filenames:
+            rel = rel_dir / name
+            if not should_exclude(rel):
+                files.append((rel.as_posix(), Path(dirpath) / name))
+    files.sort()
+    return files
+
+
+def _file_mode(path: Path) -> int:
+    # Only the executable bit survives, so the archive doesn't depend on umask
+    return 0o755 if os.stat(path).st_mode & 0o111 else 0o644
+
+
+def _hash_file(arcname: str, path: Path) -> bytes:
+    h = hashlib.sha256()
+    h.update(f"{arcname}\0{_file_mode(path):o}\0".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def content_hash(files: list[tuple[str, Path]], pool: ThreadPoolExecutor) -> str:
+    """SHA-256 over every entry's name, mode and bytes (and the format version)."""
+    h = hashlib.sha256(f"skill-format-{FORMAT_VERSION}\0".encode())
+    for digest in pool.map(lambda f: _hash_file(*f), files):
+        h.update(digest)
+    return h.hexdigest()
+
+
+def _compress_entry(arcname: str, path: Path) -> tuple[str, int, int, int, int, bytes]:
+    """(arcname, mode, method, crc, size, data) with data already compressed."""
+    raw = path.read_bytes()
+    crc = zlib.crc32(raw)
+    method, data = zipfile.ZIP_STORED, raw
+    if path.suffix.lower() not in STORED_SUFFIXES:
+        deflater = zlib.compressobj(6, zlib.DEFLATED, -15)
+        packed = deflater.compress(raw) + deflater.flush()
+        if len(packed) < len(raw):
+            method, data = zipfile.ZIP_DEFLATED, packed
+    return arcname, _file_mode(path), method, crc, len(raw), data
+
+
+def _write_zip(target: Path, entries, comment: bytes) -> int:
+    """Write pre-compressed entries as a zip with fixed metadata. Returns the entry count.
+
+    zipfile compresses inside write(), which would serialize the work, so
+    the headers are written here directly.
+    """
+    central = []
+    with open(target, "wb") as out:
+        for arcname, mode, method, crc, size, data in entries:
+            name = arcname.encode("utf-8")
+            if size > 0xFFFFFFFF or out.tell() > 0xFFFFFFFF:
+                raise ValueError(f"{arcname}: archives over 4 GB are not supported")
+            flags = 0 if name.isascii() else 0x800  # UTF-8 names
+            offset = out.tell()
+            out.write(struct.pack(
+                "<4s5H3L2H", b"PK\x03\x04", 20, flags, method,
+                FIXED_DOS_TIME, FIXED_DOS_DATE, crc, len(data), size, len(name), 0,
+            ))
+            out.write(name)
+            out.write(data)
+            central.append(struct.pack(
+                "<4s6H3L5H2L", b"PK\x01\x02", (3 << 8) | 20, 20, flags, method,
+                FIXED_DOS_TIME, FIXED_DOS_DATE, crc, len(data), size, len(name), 0, 0, 0, 0,
+                (0o100000 | mode) << 16, offset,
+            ) + name)
+        if len(central) > 0xFFFF:
+            raise ValueError("archives with more than 65535 files are not supported")
+        start = out.tell()
+        for record in central:
+            out.write(record)
+        out.write(struct.pack(
+            "<4s4H2LH", b"PK\x05\x06", 0, 0, len(central), len(central),
+            out.tell() - start, start, len(comment),
+        ))
+        out.write(comment)
+    return len(central)
+
+
+def _stored_hash(skill_file: Path) -> str | None:
+    try:
+        with zipfile.ZipFile(skill_file) as zf:
+            comment = zf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if comment.startswith(HASH_PREFIX):
+        return comment[len(HASH_PREFIX):].decode("ascii", "replace")
+    return None
+
+
+def _ordered_results(pool: ThreadPoolExecutor, fn, items, window: int):
+    """Like pool.map, but with at most `window` results pending, so only a
+    bounded number of compressed files sit in memory."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, *item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def package_skill(skill_path, output_dir=None, incremental=False, workers=None, verbose=False):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        incremental: Leave an existing .skill file alone if its content hash matches
+        workers: Threads used to hash and compress files (default: CPU count)
+        verbose: List every packaged file
 
     Returns:
         Path to the created .skill file, or None if error
@@ -87,44 +234,47 @@ def package_skill(skill_path, output_dir=None):
     skill_filename = output_path / f"{skill_name}.skill"
 
     # Create the .skill file (zip format)
+    workers = workers or os.cpu_count() or 4
+    tmp = skill_filename.with_name(f".{skill_filename.name}.tmp")
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory, excluding build artifacts
-            for file_path in skill_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                arcname = file_path.relative_to(skill_path.parent)
-                if should_exclude(arcname):
-                    print(f"  Skipped: {arcname}")
-                    continue
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+        files = iter_skill_files(skill_path)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digest = content_hash(files, pool)
+            if incremental and skill_filename.exists() and _stored_hash(skill_filename) == digest:
+                print(f"✅ Unchanged since last build, kept: {skill_filename}")
+                return skill_filename
 
-        print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+            entries = _ordered_results(pool, _compress_entry, files, workers * IN_FLIGHT_PER_WORKER)
+            count = _write_zip(tmp, entries, HASH_PREFIX + digest.encode("ascii"))
+        os.replace(tmp, skill_filename)
+
+        if verbose:
+            for arcname, _ in files:
+                print(f"  Added: {arcname}")
+        print(f"\n✅ Successfully packaged {count} files to: {skill_filename}")
         return skill_filename
 
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         print(f"❌ Error creating .skill file: {e}")
         return None
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
-
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(description="Package a skill folder into a .skill file")
+    parser.add_argument("skill_path", help="Path to the skill folder")
+    parser.add_argument("output_dir", nargs="?", default=None, help="Output directory (default: current directory)")
+    parser.add_argument("--incremental", action="store_true", help="Skip packaging when the content hash matches the existing .skill file")
+    parser.add_argument("--workers", type=int, default=None, help="Threads for hashing and compression (default: CPU count)")
+    parser.add_argument("--verbose", action="store_true", help="List every packaged file")
+    args = parser.parse_args()
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.skill_path, args.output_dir, args.incremental, args.workers, args.verbose)
 
     if result:
         sys.exit(0)
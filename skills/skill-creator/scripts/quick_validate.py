@@ -1,14 +1,42 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Validates one skill directory, or with --all every skill in a library
+(<dir>/SKILL.md and flat <name>.md commands) in parallel, writing a compact
+index (name, description, char counts, mtime, hash) that other tools can
+load with load_index() instead of re-reading every file.
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --all <skills_root> [<skills_root> ...] [--json]
 """
 
-import sys
+import argparse
+import hashlib
+import json
 import os
 import re
-import yaml
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from scripts.utils import FrontmatterError, discover_skills, parse_frontmatter
+except ImportError:
+    # Run as a plain script (python scripts/quick_validate.py)
+    from utils import FrontmatterError, discover_skills, parse_frontmatter
+
+# Define allowed properties
+ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata', 'compatibility'}
+# Flat command files may also carry the slash-command settings
+COMMAND_PROPERTIES = ALLOWED_PROPERTIES | {'argument-hint', 'disable-model-invocation', 'model'}
+
+INDEX_NAME = '.skill-index.json'
+# Bump when the entry layout or the validation rules change
+INDEX_VERSION = 1
+
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -18,39 +46,25 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
-
-    frontmatter_text = match.group(1)
-
-    # Parse YAML frontmatter
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        frontmatter = parse_frontmatter(skill_md.read_text())
+    except FrontmatterError as e:
+        return False, str(e)
+    return validate_frontmatter(frontmatter)
 
-    # Define allowed properties
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata', 'compatibility'}
 
+def validate_frontmatter(frontmatter, allowed=ALLOWED_PROPERTIES, require_name=True):
+    """Check parsed frontmatter against the skill spec. Returns (valid, message)."""
     # Check for unexpected properties (excluding nested keys under metadata)
-    unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
+    unexpected_keys = set(frontmatter.keys()) - allowed
     if unexpected_keys:
         return False, (
-            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
-            f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
+            f"Unexpected key(s) in {'SKILL.md ' if require_name else ''}frontmatter: {', '.join(sorted(unexpected_keys))}. "
+            f"Allowed properties are: {', '.join(sorted(allowed))}"
         )
 
     # Check required fields
-    if 'name' not in frontmatter:
+    if require_name and 'name' not in frontmatter:
         return False, "Missing 'name' in frontmatter"
     if 'description' not in frontmatter:
         return False, "Missing 'description' in frontmatter"
@@ -93,11 +107,121 @@ def validate_skill(skill_path):
 
     return True, "Skill is valid!"
 
+
+def index_entry(md_path, root):
+    """Read, parse and validate one skill/command file into an index entry."""
+    md_path = Path(md_path)
+    raw = md_path.read_bytes()
+    st = md_path.stat()
+    is_skill = md_path.name == 'SKILL.md'
+    entry = {
+        'path': md_path.relative_to(root).as_posix(),
+        'kind': 'skill' if is_skill else 'command',
+        'name': md_path.parent.name if is_skill else md_path.stem,
+        'description': '',
+        'name_chars': 0,
+        'description_chars': 0,
+        'content_chars': 0,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'hash': hashlib.sha256(raw).hexdigest(),
+        'valid': False,
+        'message': '',
+    }
+    try:
+        content = raw.decode('utf-8')
+        frontmatter = parse_frontmatter(content)
+    except (UnicodeDecodeError, FrontmatterError) as e:
+        entry['message'] = str(e)
+        return entry
+
+    name = frontmatter.get('name')
+    description = frontmatter.get('description')
+    if isinstance(name, str) and name.strip():
+        entry['name'] = name.strip()
+    if isinstance(description, str):
+        entry['description'] = description.strip()
+    entry['name_chars'] = len(entry['name'])
+    entry['description_chars'] = len(entry['description'])
+    entry['content_chars'] = len(content)
+    if is_skill:
+        valid, message = validate_frontmatter(frontmatter)
+    else:
+        valid, message = validate_frontmatter(frontmatter, COMMAND_PROPERTIES, require_name=False)
+    entry['valid'], entry['message'] = valid, message
+    return entry
+
+
+def load_index(root):
+    """The cached index of a skills root as {relative path: entry}, or {} if
+    there is none (or it was written by an older version)."""
+    try:
+        data = json.loads((Path(root) / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != INDEX_VERSION:
+        return {}
+    return {e['path']: e for e in data.get('entries', [])}
+
+
+def validate_all(root, workers=8, use_cache=True):
+    """Validate every skill and command under root and refresh its index.
+
+    Files whose mtime and size match the cached entry are not re-read.
+    Returns the entries sorted by path.
+    """
+    root = Path(root)
+    cached = load_index(root) if use_cache else {}
+
+    def entry_for(md_path):
+        entry = cached.get(md_path.relative_to(root).as_posix())
+        if entry is not None:
+            st = md_path.stat()
+            if entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                return entry
+        return index_entry(md_path, root)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = list(pool.map(entry_for, discover_skills(root)))
+
+    data = {'version': INDEX_VERSION, 'root': str(root.resolve()), 'entries': entries}
+    index_path = root / INDEX_NAME
+    tmp = index_path.with_name(f"{INDEX_NAME}.tmp")
+    tmp.write_text(json.dumps(data, separators=(',', ':'), ensure_ascii=False) + "\n")
+    os.replace(tmp, index_path)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a skill, or every skill in a library")
+    parser.add_argument('skill_directory', nargs='?', help="Skill directory to validate")
+    parser.add_argument('--all', nargs='+', metavar='ROOT', help="Validate every skill and command under these directories")
+    parser.add_argument('--workers', type=int, default=8, help="Parallel readers for --all")
+    parser.add_argument('--no-cache', action='store_true', help="Re-read every file instead of trusting the index")
+    parser.add_argument('--json', action='store_true', help="Print the index entries as JSON (--all only)")
+    args = parser.parse_args()
+
+    if not args.all:
+        if not args.skill_directory:
+            print("Usage: python quick_validate.py <skill_directory>")
+            sys.exit(1)
+        valid, message = validate_skill(args.skill_directory)
+        print(message)
+        sys.exit(0 if valid else 1)
+
+    entries = []
+    for root in args.all:
+        for entry in validate_all(root, args.workers, not args.no_cache):
+            entries.append({**entry, 'root': root})
+    invalid = [e for e in entries if not e['valid']]
+    if args.json:
+        print(json.dumps(entries, indent=2, ensure_ascii=False))
+    else:
+        for e in invalid:
+            print(f"{Path(e['root']) / e['path']}: {e['message']}")
+        print(f"{len(entries) - len(invalid)}/{len(entries)} skills valid")
+    sys.exit(1 if invalid else 0)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    main()
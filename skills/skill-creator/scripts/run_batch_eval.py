@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Run trigger evaluation for a whole skill library in one pass.
+
+Registers every candidate skill at once, runs each query, and attributes
+the trigger to whichever skill Claude invoked. Outputs a confusion matrix
+across skills (plus per-skill precision/recall and the most frequent
+description collisions) as JSON.
+
+The eval set is a JSON list of {"query": ..., "expected_skill": <name or null>},
+where null means no skill should trigger.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import as_completed
+from pathlib import Path
+
+from scripts.run_eval import (
+    QueryDurations,
+    SandboxPool,
+    _run_batch_in_sandbox,
+    find_project_root,
+    format_timing,
+    summarize_telemetry,
+)
+from scripts.utils import discover_skills, parse_skill_file
+
+NO_SKILL = "(none)"
+
+
+def load_skills(skills_dirs: list[Path], skill_paths: list[Path]) -> list[tuple[str, str]]:
+    """Collect (name, description) for every skill to register.
+
+    Falls back to the directory (SKILL.md) or file stem when the
+    frontmatter has no name.
+    """
+    files = [f for d in skills_dirs for f in discover_skills(d)]
+    files += [p / "SKILL.md" if p.is_dir() else p for p in skill_paths]
+
+    skills: dict[str, str] = {}
+    for f in files:
+        name, description, _ = parse_skill_file(f)
+        name = name or (f.parent.name if f.name == "SKILL.md" else f.stem)
+        if name in skills:
+            print(f"Warning: duplicate skill name {name!r} ({f}), keeping the first", file=sys.stderr)
+            continue
+        skills[name] = description
+    return list(skills.items())
+
+
+def build_confusion(results: list[dict], labels: list[str]) -> dict:
+    """Per-run confusion matrix {expected: {invoked: count}} plus per-skill stats."""
+    confusion = {expected: {invoked: 0 for invoked in labels} for expected in labels}
+    for r in results:
+        for invoked, count in r["invoked"].items():
+            confusion[r["expected_skill"]][invoked] += count
+
+    per_skill = {}
+    for label in labels:
+        if label == NO_SKILL:
+            continue
+        tp = confusion[label][label]
+        fn = sum(confusion[label].values()) - tp
+        fp = sum(confusion[e][label] for e in labels) - tp
+        per_skill[label] = {
+            "tp": tp,
+            "fp": fp,
+            "fn": fn,
+            "precision": tp / (tp + fp) if (tp + fp) else None,
+            "recall": tp / (tp + fn) if (tp + fn) else None,
+        }
+
+    collisions = sorted(
+        (
+            {"expected": e, "invoked": i, "count": confusion[e][i]}
+            for e in labels
+            for i in labels
+            if e != i and NO_SKILL not in (e, i) and confusion[e][i]
+        ),
+        key=lambda c: -c["count"],
+    )
+    return {"matrix": confusion, "per_skill": per_skill, "collisions": collisions}
+
+
+def run_batch_eval(
+    eval_set: list[dict],
+    skills: list[tuple[str, str]],
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    model: str | None = None,
+) -> dict:
+    """Run every query once per run with all skills registered, and tally invocations."""
+    labels = [name for name, _ in skills] + [NO_SKILL]
+    known = set(labels)
+    for item in eval_set:
+        if (item.get("expected_skill") or NO_SKILL) not in known:
+            raise ValueError(f"expected_skill {item['expected_skill']!r} is not one of the registered skills")
+
+    # Submit the historically slowest queries first to cut the straggler tail
+    durations = QueryDurations()
+    order = durations.longest_first([{"query": item["query"], "idx": idx} for idx, item in enumerate(eval_set)])
+
+    query_runs: dict[int, list[dict]] = {}
+    with SandboxPool(project_root, num_workers) as pool:
+        future_to_idx = {}
+        for job in order:
+            idx, item = job["idx"], eval_set[job["idx"]]
+            for _ in range(runs_per_query):
+                future = pool.executor.submit(_run_batch_in_sandbox, item["query"], skills, timeout, model=model)
+                future_to_idx[future] = idx
+
+        for future in as_completed(future_to_idx):
+            try:
+                run = future.result()
+            except Exception as e:
+                print(f"Warning: query failed: {e}", file=sys.stderr)
+                run = {"invoked": None, "decision_source": "error"}
+            if run.get("decision_seconds") is not None:
+                durations.record(eval_set[future_to_idx[future]]["query"], run["decision_seconds"])
+            query_runs.setdefault(future_to_idx[future], []).append(run)
+    durations.save()
+
+    results = []
+    all_runs = []
+    for idx, item in enumerate(eval_set):
+        runs = query_runs.get(idx, [])
+        all_runs.extend(runs)
+        invoked: dict[str, int] = {}
+        for run in runs:
+            label = run["invoked"] or NO_SKILL
+            invoked[label] = invoked.get(label, 0) + 1
+        expected = item.get("expected_skill") or NO_SKILL
+        top = max(invoked, key=invoked.get) if invoked else NO_SKILL
+        results.append({
+            "query": item["query"],
+            "expected_skill": expected,
+            "invoked": invoked,
+            "top": top,
+            "runs": len(runs),
+            "pass": top == expected,
+        })
+
+    passed = sum(1 for r in results if r["pass"])
+    return {
+        "skills": [name for name, _ in skills],
+        "results": results,
+        "confusion": build_confusion(results, labels),
+        "summary": {
+            "total": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "timing": summarize_telemetry(all_runs),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run trigger evaluation across many skills at once")
+    parser.add_argument("--eval-set", required=True, help="Path to eval set JSON ([{query, expected_skill}])")
+    parser.add_argument("--skills-dir", action="append", default=[], help="Register every skill found in this directory (repeatable)")
+    parser.add_argument("--skill-path", action="append", default=[], help="Register one skill directory or .md file (repeatable)")
+    parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
+    parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
+    parser.add_argument("--runs-per-query", type=int, default=1, help="Number of runs per query")
+    parser.add_argument("--model", default=None, help="Model to use for claude -p (default: user's configured model)")
+    parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
+    args = parser.parse_args()
+
+    skills = load_skills([Path(d) for d in args.skills_dir], [Path(p) for p in args.skill_path])
+    if not skills:
+        print("Error: no skills to evaluate (use --skills-dir or --skill-path)", file=sys.stderr)
+        sys.exit(1)
+
+    eval_set = json.loads(Path(args.eval_set).read_text())
+
+    if args.verbose:
+        print(f"Evaluating {len(eval_set)} queries against {len(skills)} skills", file=sys.stderr)
+
+    output = run_batch_eval(
+        eval_set=eval_set,
+        skills=skills,
+        num_workers=args.num_workers,
+        timeout=args.timeout,
+        project_root=find_project_root(),
+        runs_per_query=args.runs_per_query,
+        model=args.model,
+    )
+
+    if args.verbose:
+        summary = output["summary"]
+        print(f"Results: {summary['passed']}/{summary['total']} routed to the expected skill", file=sys.stderr)
+        for r in output["results"]:
+            status = "PASS" if r["pass"] else "FAIL"
+            print(f"  [{status}] expected={r['expected_skill']} got={r['top']}: {r['query'][:60]}", file=sys.stderr)
+        for c in output["confusion"]["collisions"][:10]:
+            print(f"  collision: {c['expected']} -> {c['invoked']} ({c['count']} runs)", file=sys.stderr)
+        print(format_timing(summary["timing"]), file=sys.stderr)
+
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,23 @@ for a set of queries. Outputs results as JSON.
 """
 
 import argparse
+import hashlib
 import json
+import multiprocessing
 import os
+import re
 import select
+import shutil
 import subprocess
 import sys
+import tempfile
 import time
 import uuid
+import weakref
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-from scripts.utils import parse_skill_md
+from scripts.utils import claude_executable, parse_skill_md
 
 
 def find_project_root() -> Path:
@@ -32,6 +38,158 @@ def find_project_root() -> Path:
     return current
 
 
+# Temporary command files written by run_single_query: <name>-skill-<8 hex>.md
+TEMP_COMMAND_RE = re.compile(r"-skill-[0-9a-f]{8}\.md$")
+
+
+class SandboxPool:
+    """A fixed set of isolated project roots plus the worker pool that uses them.
+
+    Each root mirrors the real project's .claude/ (via symlinks) and
+    CLAUDE.md, but gets its own commands/ directory, so concurrent
+    `claude -p` runs only ever see their own temporary command file.
+    Every worker process of `executor` claims one root for its lifetime.
+    Roots and workers are built once and shared by every evaluation
+    submitted to the pool; use as a context manager (or call close()) to
+    tear them down. Anything left over is removed at interpreter exit.
+    """
+
+    def __init__(self, project_root: Path, size: int):
+        self.base = Path(tempfile.mkdtemp(prefix="skill-eval-sandboxes-"))
+        self.roots = [
+            self._build_root(Path(project_root), self.base / f"slot-{i}")
+            for i in range(max(1, size))
+        ]
+        self._slots = multiprocessing.Queue()
+        for root in self.roots:
+            self._slots.put(str(root))
+        self.executor = ProcessPoolExecutor(
+            max_workers=len(self.roots),
+            initializer=_claim_sandbox,
+            initargs=(self._slots,),
+        )
+        self._cleanup = weakref.finalize(self, self._teardown, self.executor, self.base)
+
+    @staticmethod
+    def _build_root(project_root: Path, root: Path) -> Path:
+        commands_dir = root / ".claude" / "commands"
+        commands_dir.mkdir(parents=True)
+
+        claude_dir = project_root / ".claude"
+        if claude_dir.is_dir():
+            for entry in claude_dir.iterdir():
+                if entry.name != "commands":
+                    (root / ".claude" / entry.name).symlink_to(entry.resolve())
+                    continue
+                # Mirror the project's own commands, minus leftover temp files
+                # from earlier (possibly crashed) eval runs.
+                for command in entry.iterdir():
+                    if not TEMP_COMMAND_RE.search(command.name):
+                        (commands_dir / command.name).symlink_to(command.resolve())
+
+        claude_md = project_root / "CLAUDE.md"
+        if claude_md.exists():
+            (root / "CLAUDE.md").symlink_to(claude_md.resolve())
+        return root
+
+    @staticmethod
+    def _teardown(executor: ProcessPoolExecutor, base: Path) -> None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(base, ignore_errors=True)
+
+    def close(self) -> None:
+        self._cleanup()
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+DURATIONS_PATH = Path.home() / ".cache" / "skill-creator" / "query_durations.json"
+
+
+class QueryDurations:
+    """Sidecar store of how long each query historically takes to decide.
+
+    Keyed by a hash of the query text; values are an exponential moving
+    average of decision time in seconds. Used to submit the slowest queries
+    first so they don't end up as stragglers at the tail of a run.
+    """
+
+    def __init__(self, path: Path = DURATIONS_PATH, smoothing: float = 0.5):
+        self.path = path
+        self.smoothing = smoothing
+        try:
+            self.seconds: dict[str, float] = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self.seconds = {}
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+
+    def estimate(self, query: str) -> float | None:
+        return self.seconds.get(self._key(query))
+
+    def record(self, query: str, seconds: float) -> None:
+        key = self._key(query)
+        previous = self.seconds.get(key)
+        if previous is None:
+            self.seconds[key] = seconds
+        else:
+            self.seconds[key] = previous + self.smoothing * (seconds - previous)
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.seconds))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not save query durations: {e}", file=sys.stderr)
+
+    def longest_first(self, items: list[dict]) -> list[dict]:
+        """Order eval items slowest-first; never-seen queries go first of all,
+        since they may well be slow. Ties keep eval-set order."""
+        def sort_key(item: dict) -> float:
+            estimate = self.estimate(item["query"])
+            return -(float("inf") if estimate is None else estimate)
+        return sorted(items, key=sort_key)
+
+
+# Sandbox root claimed by the current worker process (see _claim_sandbox).
+_worker_root: str | None = None
+
+
+def _claim_sandbox(slots) -> None:
+    """ProcessPoolExecutor initializer: take one sandbox root for this worker's lifetime."""
+    global _worker_root
+    _worker_root = slots.get()
+
+
+def _run_in_sandbox(*args, **kwargs) -> dict:
+    return run_single_query(*args, project_root=_worker_root, **kwargs)
+
+
+def _run_batch_in_sandbox(*args, **kwargs) -> dict:
+    return run_batch_query(*args, project_root=_worker_root, **kwargs)
+
+
+def _command_content(skill_name: str, skill_description: str) -> str:
+    # Use YAML block scalar to avoid breaking on quotes in description
+    indented_desc = "\n  ".join(skill_description.split("\n"))
+    return (
+        f"---\n"
+        f"description: |\n"
+        f"  {indented_desc}\n"
+        f"---\n\n"
+        f"# {skill_name}\n\n"
+        f"This skill handles: {skill_description}\n"
+    )
+
+
 def run_single_query(
     query: str,
     skill_name: str,
@@ -39,7 +197,7 @@ def run_single_query(
     timeout: int,
     project_root: str,
     model: str | None = None,
-) -> bool:
+) -> dict:
     """Run a single query and return whether the skill was triggered.
 
     Creates a command file in .claude/commands/ so it appears in Claude's
@@ -47,28 +205,62 @@ def run_single_query(
     Uses --include-partial-messages to detect triggering early from
     stream events (content_block_start) rather than waiting for the
     full assistant message, which only arrives after tool execution.
+
+    Returns a dict with "triggered" plus per-query telemetry: spawn latency,
+    time to first byte, time to decision (all in seconds), bytes read, and
+    the decision source ("stream_event", "assistant", "result", "exit" or
+    "timeout") so callers can tell a genuine non-trigger from a timeout.
     """
+    run = _run_query(query, [(skill_name, skill_description)], timeout, project_root, model)
+    triggered = run.pop("invoked") is not None
+    return {"triggered": triggered, **run}
+
+
+def run_batch_query(
+    query: str,
+    skills: list[tuple[str, str]],
+    timeout: int,
+    project_root: str,
+    model: str | None = None,
+) -> dict:
+    """Run a query with every (name, description) in skills registered at once.
+
+    Returns the same telemetry as run_single_query, with "invoked" set to
+    the name of the skill Claude reached for (or None).
+    """
+    return _run_query(query, skills, timeout, project_root, model)
+
+
+def _run_query(
+    query: str,
+    skills: list[tuple[str, str]],
+    timeout: int,
+    project_root: str,
+    model: str | None,
+) -> dict:
+    """Register skills as temporary commands, run `claude -p`, and report
+    which of them (if any) was invoked, plus telemetry."""
     unique_id = uuid.uuid4().hex[:8]
-    clean_name = f"{skill_name}-skill-{unique_id}"
+    # clean_name -> skill name; the shared suffix keeps names unique per run
+    clean_names = {f"{name}-skill-{unique_id}": name for name, _ in skills}
     project_commands_dir = Path(project_root) / ".claude" / "commands"
-    command_file = project_commands_dir / f"{clean_name}.md"
+    command_files = [project_commands_dir / f"{name}-skill-{unique_id}.md" for name, _ in skills]
+    # Longest first, so "only-skill-<id>" never matches inside "prompt-only-skill-<id>"
+    match_order = sorted(clean_names, key=len, reverse=True)
+
+    def invoked_in(text: str) -> str | None:
+        for clean_name in match_order:
+            if clean_name in text:
+                return clean_names[clean_name]
+        return None
 
     try:
         project_commands_dir.mkdir(parents=True, exist_ok=True)
-        # Use YAML block scalar to avoid breaking on quotes in description
-        indented_desc = "\n  ".join(skill_description.split("\n"))
-        command_content = (
-            f"---\n"
-            f"description: |\n"
-            f"  {indented_desc}\n"
-            f"---\n\n"
-            f"# {skill_name}\n\n"
-            f"This skill handles: {skill_description}\n"
-        )
-        command_file.write_text(command_content)
+        for command_file, (name, description) in zip(command_files, skills):
+            command_file.write_text(_command_content(name, description))
 
         cmd = [
-            "claude",
+            claude_executable(),
             "-p", query,
             "--output-format", "stream-json",
             "--verbose",
@@ -82,6 +274,7 @@ def run_single_query(
         # programmatic subprocess usage is safe.
         env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
 
+        spawn_start = time.perf_counter()
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
@@ -89,8 +282,25 @@ def run_single_query(
             cwd=project_root,
             env=env,
         )
-
-        triggered = False
+        telemetry = {
+            "spawn_seconds": time.perf_counter() - spawn_start,
+            "first_byte_seconds": None,
+            "decision_seconds": None,
+            "bytes_read": 0,
+            "decision_source": None,
+        }
+
+        def decide(invoked: str | None, source: str) -> dict:
+            telemetry["decision_seconds"] = time.perf_counter() - spawn_start
+            telemetry["decision_source"] = source
+            return {"invoked": invoked, **telemetry}
+
+        def record_read(data: bytes) -> None:
+            if data and telemetry["first_byte_seconds"] is None:
+                telemetry["first_byte_seconds"] = time.perf_counter() - spawn_start
+            telemetry["bytes_read"] += len(data)
+
+        invoked = None
         start_time = time.time()
         buffer = ""
         # Track state for stream event detection
@@ -102,6 +312,7 @@ def run_single_query(
                 if process.poll() is not None:
                     remaining = process.stdout.read()
                     if remaining:
+                        record_read(remaining)
                         buffer += remaining.decode("utf-8", errors="replace")
                     break
 
@@ -112,6 +323,7 @@ def run_single_query(
                 chunk = os.read(process.stdout.fileno(), 8192)
                 if not chunk:
                     break
+                record_read(chunk)
                 buffer += chunk.decode("utf-8", errors="replace")
 
                 while "\n" in buffer:
@@ -138,20 +350,21 @@ def run_single_query(
                                     pending_tool_name = tool_name
                                     accumulated_json = ""
                                 else:
-                                    return False
+                                    return decide(None, "stream_event")
 
                         elif se_type == "content_block_delta" and pending_tool_name:
                             delta = se.get("delta", {})
                             if delta.get("type") == "input_json_delta":
                                 accumulated_json += delta.get("partial_json", "")
-                                if clean_name in accumulated_json:
-                                    return True
+                                invoked = invoked_in(accumulated_json)
+                                if invoked:
+                                    return decide(invoked, "stream_event")
 
                         elif se_type in ("content_block_stop", "message_stop"):
                             if pending_tool_name:
-                                return clean_name in accumulated_json
+                                return decide(invoked_in(accumulated_json), "stream_event")
                             if se_type == "message_stop":
-                                return False
+                                return decide(None, "stream_event")
 
                     # Fallback: full assistant message
                     elif event.get("type") == "assistant":
@@ -161,84 +374,107 @@ def run_single_query(
                                 continue
                             tool_name = content_item.get("name", "")
                             tool_input = content_item.get("input", {})
-                            if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
-                                triggered = True
-                            elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
-                                triggered = True
-                            return triggered
+                            if tool_name == "Skill":
+                                invoked = invoked_in(tool_input.get("skill", ""))
+                            elif tool_name == "Read":
+                                invoked = invoked_in(tool_input.get("file_path", ""))
+                            return decide(invoked, "assistant")
 
                     elif event.get("type") == "result":
-                        return triggered
+                        return decide(invoked, "result")
         finally:
             # Clean up process on any exit path (return, exception, timeout)
             if process.poll() is None:
                 process.kill()
                 process.wait()
 
-        return triggered
+        timed_out = time.time() - start_time >= timeout
+        return decide(invoked, "timeout" if timed_out else "exit")
     finally:
-        if command_file.exists():
-            command_file.unlink()
+        for command_file in command_files:
+            if command_file.exists():
+                command_file.unlink()
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Linear-interpolated percentile (pct in 0-100), or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def summarize_telemetry(runs: list[dict]) -> dict:
+    """Aggregate per-run telemetry into p50/p95/max plus decision-source counts."""
+    timing: dict = {}
+    for key in ("spawn_seconds", "first_byte_seconds", "decision_seconds", "bytes_read"):
+        values = [r[key] for r in runs if r.get(key) is not None]
+        timing[key] = {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": max(values) if values else None,
+        }
+    sources: dict[str, int] = {}
+    for r in runs:
+        source = r.get("decision_source") or "unknown"
+        sources[source] = sources.get(source, 0) + 1
+    timing["decision_sources"] = sources
+    timing["timeouts"] = sources.get("timeout", 0)
+    return timing
+
+
+def format_timing(timing: dict) -> str:
+    """One-line human summary of summarize_telemetry() output."""
+    def fmt(stat: dict) -> str:
+        if stat["p50"] is None:
+            return "n/a"
+        return f"p50={stat['p50']:.1f}s p95={stat['p95']:.1f}s"
+
+    sources = ", ".join(f"{k}={v}" for k, v in sorted(timing["decision_sources"].items()))
+    return (
+        f"Timing: decision {fmt(timing['decision_seconds'])}, "
+        f"first byte {fmt(timing['first_byte_seconds'])}, "
+        f"timeouts={timing['timeouts']} ({sources})"
+    )
 
 
-def run_eval(
+def _query_passes(triggers: int, runs: int, should_trigger: bool, trigger_threshold: float) -> bool:
+    trigger_rate = triggers / runs if runs else 0.0
+    if should_trigger:
+        return trigger_rate >= trigger_threshold
+    return trigger_rate < trigger_threshold
+
+
+def build_eval_output(
     eval_set: list[dict],
     skill_name: str,
     description: str,
-    num_workers: int,
-    timeout: int,
-    project_root: Path,
-    runs_per_query: int = 1,
-    trigger_threshold: float = 0.5,
-    model: str | None = None,
+    query_runs: dict[str, list[dict]],
+    trigger_threshold: float,
 ) -> dict:
-    """Run the full eval set and return results."""
-    results = []
+    """Turn per-query run telemetry into run_eval's output dict.
 
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_info = {}
-        for item in eval_set:
-            for run_idx in range(runs_per_query):
-                future = executor.submit(
-                    run_single_query,
-                    item["query"],
-                    skill_name,
-                    description,
-                    timeout,
-                    str(project_root),
-                    model,
-                )
-                future_to_info[future] = (item, run_idx)
-
-        query_triggers: dict[str, list[bool]] = {}
-        query_items: dict[str, dict] = {}
-        for future in as_completed(future_to_info):
-            item, _ = future_to_info[future]
-            query = item["query"]
-            query_items[query] = item
-            if query not in query_triggers:
-                query_triggers[query] = []
-            try:
-                query_triggers[query].append(future.result())
-            except Exception as e:
-                print(f"Warning: query failed: {e}", file=sys.stderr)
-                query_triggers[query].append(False)
-
-    for query, triggers in query_triggers.items():
-        item = query_items[query]
-        trigger_rate = sum(triggers) / len(triggers)
-        should_trigger = item["should_trigger"]
-        if should_trigger:
-            did_pass = trigger_rate >= trigger_threshold
-        else:
-            did_pass = trigger_rate < trigger_threshold
+    Queries with no finished runs (e.g. cancelled) are left out.
+    """
+    results = []
+    all_runs = []
+    for item in eval_set:
+        runs = query_runs.get(item["query"])
+        if not runs:
+            continue
+        all_runs.extend(runs)
+        triggers = sum(1 for r in runs if r["triggered"])
         results.append({
-            "query": query,
-            "should_trigger": should_trigger,
-            "trigger_rate": trigger_rate,
-            "triggers": sum(triggers),
-            "runs": len(triggers),
-            "pass": did_pass,
+            "query": item["query"],
+            "should_trigger": item["should_trigger"],
+            "trigger_rate": triggers / len(runs),
+            "triggers": triggers,
+            "runs": len(runs),
+            "pass": _query_passes(triggers, len(runs), item["should_trigger"], trigger_threshold),
+            "telemetry": [{k: v for k, v in r.items() if k != "triggered"} for r in runs],
         })
 
     passed = sum(1 for r in results if r["pass"])
@@ -252,10 +488,185 @@ def run_eval(
             "total": total,
             "passed": passed,
             "failed": total - passed,
+            "timing": summarize_telemetry(all_runs),
         },
     }
 
 
+def _pass_bounds(
+    eval_set: list[dict],
+    query_runs: dict[str, list[dict]],
+    runs_per_query: int,
+    trigger_threshold: float,
+) -> tuple[int, int]:
+    """(guaranteed, possible) number of passing queries in eval_set, given
+    the runs finished so far and runs_per_query runs per query."""
+    guaranteed = 0
+    possible = 0
+    for item in eval_set:
+        runs = query_runs.get(item["query"], [])
+        triggers = sum(1 for r in runs if r["triggered"])
+        remaining = runs_per_query - len(runs)
+        low = _query_passes(triggers, runs_per_query, item["should_trigger"], trigger_threshold)
+        high = _query_passes(triggers + remaining, runs_per_query, item["should_trigger"], trigger_threshold)
+        guaranteed += low and high
+        possible += low or high
+    return guaranteed, possible
+
+
+def run_eval_candidates(
+    eval_set: list[dict],
+    skill_name: str,
+    descriptions: list[str],
+    timeout: int,
+    sandbox_pool: SandboxPool,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    prune_queries: set[str] | None = None,
+    on_prune_queries_done=None,
+    durations: QueryDurations | None = None,
+) -> list[dict]:
+    """Evaluate several candidate descriptions at once on a shared worker pool.
+
+    Runs of prune_queries (typically the train set) are submitted first,
+    interleaved across candidates. Within each group, queries are submitted
+    longest-first according to durations (the shared sidecar store by
+    default), and every run's decision time is recorded back into it. When more than one candidate is given,
+    a candidate that can no longer match the number of prune queries
+    another candidate is already guaranteed to pass is dropped and its
+    pending runs are cancelled. Once every surviving candidate has
+    finished its prune queries, on_prune_queries_done(partial_outputs) is
+    called with {candidate index: output restricted to prune_queries} so
+    the caller can start work that only needs those results.
+
+    Returns one output dict per candidate (same shape as run_eval); dropped
+    candidates carry "pruned": True and only the runs that finished.
+    """
+    prune_queries = prune_queries or set()
+    prune_items = [item for item in eval_set if item["query"] in prune_queries]
+    other_items = [item for item in eval_set if item["query"] not in prune_queries]
+
+    query_runs: list[dict[str, list[dict]]] = [{} for _ in descriptions]
+    prune_runs_left = [len(prune_items) * runs_per_query for _ in descriptions]
+    futures_by_candidate: list[list] = [[] for _ in descriptions]
+    future_to_info = {}
+    pruned: set[int] = set()
+
+    if durations is None:
+        durations = QueryDurations()
+
+    for item in durations.longest_first(prune_items) + durations.longest_first(other_items):
+        for _ in range(runs_per_query):
+            for idx, description in enumerate(descriptions):
+                future = sandbox_pool.executor.submit(
+                    _run_in_sandbox,
+                    item["query"],
+                    skill_name,
+                    description,
+                    timeout,
+                    model=model,
+                )
+                future_to_info[future] = (idx, item)
+                futures_by_candidate[idx].append(future)
+
+    notified = False
+
+    def maybe_notify() -> None:
+        nonlocal notified
+        if notified or any(prune_runs_left[i] for i in range(len(descriptions)) if i not in pruned):
+            return
+        notified = True
+        if on_prune_queries_done is not None:
+            on_prune_queries_done({
+                idx: build_eval_output(prune_items, skill_name, descriptions[idx], query_runs[idx], trigger_threshold)
+                for idx in range(len(descriptions))
+                if idx not in pruned
+            })
+
+    maybe_notify()
+
+    for future in as_completed(future_to_info):
+        idx, item = future_to_info[future]
+        if idx in pruned or future.cancelled():
+            continue
+        try:
+            run = future.result()
+        except Exception as e:
+            print(f"Warning: query failed: {e}", file=sys.stderr)
+            run = {"triggered": False, "decision_source": "error"}
+        if run.get("decision_seconds") is not None:
+            durations.record(item["query"], run["decision_seconds"])
+        query_runs[idx].setdefault(item["query"], []).append(run)
+        if item["query"] not in prune_queries:
+            continue
+
+        prune_runs_left[idx] -= 1
+        if len(descriptions) > 1 and not notified:
+            bounds = {
+                i: _pass_bounds(prune_items, query_runs[i], runs_per_query, trigger_threshold)
+                for i in range(len(descriptions))
+                if i not in pruned
+            }
+            best_guaranteed = max(low for low, _ in bounds.values())
+            for i, (_, high) in bounds.items():
+                if high < best_guaranteed:
+                    pruned.add(i)
+                    for f in futures_by_candidate[i]:
+                        f.cancel()
+        maybe_notify()
+
+    durations.save()
+
+    outputs = []
+    for idx, description in enumerate(descriptions):
+        output = build_eval_output(eval_set, skill_name, description, query_runs[idx], trigger_threshold)
+        if idx in pruned:
+            output["pruned"] = True
+        outputs.append(output)
+    return outputs
+
+
+def run_eval(
+    eval_set: list[dict],
+    skill_name: str,
+    description: str,
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    sandbox_pool: SandboxPool | None = None,
+    durations: QueryDurations | None = None,
+) -> dict:
+    """Run the full eval set and return results.
+
+    Each worker process runs its queries in its own sandbox root from
+    sandbox_pool (a temporary pool of num_workers roots is built if none
+    is given), so results do not depend on the concurrency level.
+    durations is passed on to run_eval_candidates.
+    """
+    if sandbox_pool is not None:
+        return run_eval_candidates(
+            eval_set, skill_name, [description], timeout, sandbox_pool,
+            runs_per_query=runs_per_query,
+            trigger_threshold=trigger_threshold,
+            model=model,
+            durations=durations,
+        )[0]
+
+    with SandboxPool(project_root, num_workers) as pool:
+        return run_eval(
+            eval_set, skill_name, description, num_workers, timeout, project_root,
+            runs_per_query=runs_per_query,
+            trigger_threshold=trigger_threshold,
+            model=model,
+            sandbox_pool=pool,
+            durations=durations,
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run trigger evaluation for a skill description")
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
@@ -302,6 +713,7 @@ def main():
             status = "PASS" if r["pass"] else "FAIL"
             rate_str = f"{r['triggers']}/{r['runs']}"
             print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:70]}", file=sys.stderr)
+        print(format_timing(summary["timing"]), file=sys.stderr)
 
     print(json.dumps(output, indent=2))
 
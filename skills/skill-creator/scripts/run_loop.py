@@ -8,30 +8,36 @@ overfitting.
 
 import argparse
 import json
+import os
 import random
 import sys
 import tempfile
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from scripts.generate_report import generate_html
+from scripts.generate_report import LiveReport, generate_html
 from scripts.improve_description import improve_description
-from scripts.run_eval import find_project_root, run_eval
+from scripts.run_eval import QueryDurations, SandboxPool, find_project_root, format_timing, run_eval_candidates
 from scripts.utils import parse_skill_md
 
 
 def split_eval_set(eval_set: list[dict], holdout: float, seed: int = 42) -> tuple[list[dict], list[dict]]:
-    """Split eval set into train and test sets, stratified by should_trigger."""
-    random.seed(seed)
+    """Split eval set into train and test sets, stratified by should_trigger.
+
+    Uses a private RNG so the split depends only on the seed, not on any
+    other use of the global random module.
+    """
+    rng = random.Random(seed)
 
     # Separate by should_trigger
     trigger = [e for e in eval_set if e["should_trigger"]]
     no_trigger = [e for e in eval_set if not e["should_trigger"]]
 
     # Shuffle each group
-    random.shuffle(trigger)
-    random.shuffle(no_trigger)
+    rng.shuffle(trigger)
+    rng.shuffle(no_trigger)
 
     # Calculate split points
     n_trigger_test = max(1, int(len(trigger) * holdout))
@@ -44,6 +50,76 @@ def split_eval_set(eval_set: list[dict], holdout: float, seed: int = 42) -> tupl
     return train_set, test_set
 
 
+def build_history_entry(
+    iteration: int,
+    description: str,
+    results: list[dict],
+    train_queries: set[str],
+    has_test: bool,
+    candidate: int | None = None,
+) -> dict:
+    """Split one description's eval results into a train/test history entry."""
+    train_result_list = [r for r in results if r["query"] in train_queries]
+    test_result_list = [r for r in results if r["query"] not in train_queries]
+
+    train_passed = sum(1 for r in train_result_list if r["pass"])
+    train_total = len(train_result_list)
+
+    if has_test:
+        test_passed = sum(1 for r in test_result_list if r["pass"])
+        test_total = len(test_result_list)
+    else:
+        test_passed = test_total = None
+
+    entry = {
+        "iteration": iteration,
+        "description": description,
+        "train_passed": train_passed,
+        "train_failed": train_total - train_passed,
+        "train_total": train_total,
+        "train_results": train_result_list,
+        "test_passed": test_passed,
+        "test_failed": test_total - test_passed if has_test else None,
+        "test_total": test_total,
+        "test_results": test_result_list if has_test else None,
+        # For backward compat with report generator
+        "passed": train_passed,
+        "failed": train_total - train_passed,
+        "total": train_total,
+        "results": train_result_list,
+    }
+    if candidate is not None:
+        entry["candidate"] = candidate
+    return entry
+
+
+def print_eval_stats(label: str, results: list[dict], elapsed: float) -> None:
+    pos = [r for r in results if r["should_trigger"]]
+    neg = [r for r in results if not r["should_trigger"]]
+    tp = sum(r["triggers"] for r in pos)
+    pos_runs = sum(r["runs"] for r in pos)
+    fn = pos_runs - tp
+    fp = sum(r["triggers"] for r in neg)
+    neg_runs = sum(r["runs"] for r in neg)
+    tn = neg_runs - fp
+    total = tp + tn + fp + fn
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
+    accuracy = (tp + tn) / total if total > 0 else 0.0
+    print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
+    for r in results:
+        status = "PASS" if r["pass"] else "FAIL"
+        rate_str = f"{r['triggers']}/{r['runs']}"
+        print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
+
+
+def save_checkpoint(path: Path, state: dict) -> None:
+    """Atomically write the loop state so a crash never leaves a torn file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, path)
+
+
 def run_loop(
     eval_set: list[dict],
     skill_path: Path,
@@ -58,160 +134,239 @@ def run_loop(
     verbose: bool,
     live_report_path: Path | None = None,
     log_dir: Path | None = None,
+    candidates: int = 1,
+    checkpoint_path: Path | None = None,
+    resume_state: dict | None = None,
+    durations: QueryDurations | None = None,
 ) -> dict:
-    """Run the eval + improvement loop."""
+    """Run the eval + improvement loop.
+
+    Each iteration evaluates every candidate description at once on a
+    shared worker pool, pruning candidates that are clearly losing on the
+    train set. As soon as the train results are in, `candidates` new
+    descriptions are proposed in parallel from the best one, overlapping
+    with evaluation of the held-out test queries.
+
+    If checkpoint_path is given, the full loop state is written there after
+    every completed eval and improvement step; pass that state back as
+    resume_state to continue without re-running finished work. durations
+    defaults to the shared sidecar store of per-query decision times.
+    """
     project_root = find_project_root()
     name, original_description, content = parse_skill_md(skill_path)
-    current_description = description_override or original_description
 
-    # Split into train/test if holdout > 0
-    if holdout > 0:
-        train_set, test_set = split_eval_set(eval_set, holdout)
+    if resume_state:
+        state = resume_state
+        train_set, test_set = state["train_set"], state["test_set"]
         if verbose:
-            print(f"Split: {len(train_set)} train, {len(test_set)} test (holdout={holdout})", file=sys.stderr)
+            print(f"Resuming after iteration {state['iteration']} ({state['phase']})", file=sys.stderr)
     else:
-        train_set = eval_set
-        test_set = []
-
-    history = []
-    exit_reason = "unknown"
-
-    for iteration in range(1, max_iterations + 1):
-        if verbose:
-            print(f"\n{'='*60}", file=sys.stderr)
-            print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
-            print(f"Description: {current_description}", file=sys.stderr)
-            print(f"{'='*60}", file=sys.stderr)
-
-        # Evaluate train + test together in one batch for parallelism
-        all_queries = train_set + test_set
-        t0 = time.time()
-        all_results = run_eval(
-            eval_set=all_queries,
-            skill_name=name,
-            description=current_description,
-            num_workers=num_workers,
-            timeout=timeout,
-            project_root=project_root,
-            runs_per_query=runs_per_query,
-            trigger_threshold=trigger_threshold,
-            model=model,
-        )
-        eval_elapsed = time.time() - t0
-
-        # Split results back into train/test by matching queries
-        train_queries_set = {q["query"] for q in train_set}
-        train_result_list = [r for r in all_results["results"] if r["query"] in train_queries_set]
-        test_result_list = [r for r in all_results["results"] if r["query"] not in train_queries_set]
-
-        train_passed = sum(1 for r in train_result_list if r["pass"])
-        train_total = len(train_result_list)
-        train_summary = {"passed": train_passed, "failed": train_total - train_passed, "total": train_total}
-        train_results = {"results": train_result_list, "summary": train_summary}
-
-        if test_set:
-            test_passed = sum(1 for r in test_result_list if r["pass"])
-            test_total = len(test_result_list)
-            test_summary = {"passed": test_passed, "failed": test_total - test_passed, "total": test_total}
-            test_results = {"results": test_result_list, "summary": test_summary}
-        else:
-            test_results = None
-            test_summary = None
-
-        history.append({
-            "iteration": iteration,
-            "description": current_description,
-            "train_passed": train_summary["passed"],
-            "train_failed": train_summary["failed"],
-            "train_total": train_summary["total"],
-            "train_results": train_results["results"],
-            "test_passed": test_summary["passed"] if test_summary else None,
-            "test_failed": test_summary["failed"] if test_summary else None,
-            "test_total": test_summary["total"] if test_summary else None,
-            "test_results": test_results["results"] if test_results else None,
-            # For backward compat with report generator
-            "passed": train_summary["passed"],
-            "failed": train_summary["failed"],
-            "total": train_summary["total"],
-            "results": train_results["results"],
-        })
-
-        # Write live report if path provided
-        if live_report_path:
-            partial_output = {
-                "original_description": original_description,
-                "best_description": current_description,
-                "best_score": "in progress",
-                "iterations_run": len(history),
-                "holdout": holdout,
-                "train_size": len(train_set),
-                "test_size": len(test_set),
-                "history": history,
-            }
-            live_report_path.write_text(generate_html(partial_output, auto_refresh=True, skill_name=name))
-
-        if verbose:
-            def print_eval_stats(label, results, elapsed):
-                pos = [r for r in results if r["should_trigger"]]
-                neg = [r for r in results if not r["should_trigger"]]
-                tp = sum(r["triggers"] for r in pos)
-                pos_runs = sum(r["runs"] for r in pos)
-                fn = pos_runs - tp
-                fp = sum(r["triggers"] for r in neg)
-                neg_runs = sum(r["runs"] for r in neg)
-                tn = neg_runs - fp
-                total = tp + tn + fp + fn
-                precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
-                recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
-                accuracy = (tp + tn) / total if total > 0 else 0.0
-                print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
-                for r in results:
-                    status = "PASS" if r["pass"] else "FAIL"
-                    rate_str = f"{r['triggers']}/{r['runs']}"
-                    print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
-
-            print_eval_stats("Train", train_results["results"], eval_elapsed)
-            if test_summary:
-                print_eval_stats("Test ", test_results["results"], 0)
-
-        if train_summary["failed"] == 0:
-            exit_reason = f"all_passed (iteration {iteration})"
-            if verbose:
-                print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
-            break
-
-        if iteration == max_iterations:
-            exit_reason = f"max_iterations ({max_iterations})"
+        # Split into train/test if holdout > 0
+        seed = 42
+        if holdout > 0:
+            train_set, test_set = split_eval_set(eval_set, holdout, seed)
             if verbose:
-                print(f"\nMax iterations reached ({max_iterations}).", file=sys.stderr)
-            break
-
-        # Improve the description based on train results
-        if verbose:
-            print(f"\nImproving description...", file=sys.stderr)
-
-        t0 = time.time()
+                print(f"Split: {len(train_set)} train, {len(test_set)} test (holdout={holdout})", file=sys.stderr)
+        else:
+            train_set = eval_set
+            test_set = []
+        current_description = description_override or original_description
+        state = {
+            "original_description": original_description,
+            "split_seed": seed,
+            "holdout": holdout,
+            "train_set": train_set,
+            "test_set": test_set,
+            # Last iteration whose eval finished, and what comes next:
+            # "eval" (evaluate `descriptions`), "improve", or "done".
+            "iteration": 0,
+            "phase": "eval",
+            "descriptions": [current_description],
+            "current_description": current_description,
+            "history": [],
+            "pruned_candidates": [],
+            "exit_reason": "unknown",
+        }
+
+    def checkpoint() -> None:
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, state)
+
+    checkpoint()
+
+    # Evaluate train + test together in one batch for parallelism
+    all_queries = train_set + test_set
+    train_queries = {q["query"] for q in train_set}
+    multi = candidates > 1
+    history = state["history"]
+    pruned = state["pruned_candidates"]
+
+    def live_summary() -> dict:
+        return {
+            "original_description": state["original_description"],
+            "best_description": state["current_description"],
+            "best_score": "in progress",
+            "iterations_run": state["iteration"],
+            "holdout": state["holdout"],
+            "train_size": len(train_set),
+            "test_size": len(test_set),
+        }
+
+    # The live report only ever appends the new rows of each iteration
+    live_report = LiveReport(live_report_path, skill_name=name) if live_report_path else None
+    if live_report:
+        live_report.start(train_set, test_set, live_summary(), history)
+
+    # Build the per-worker sandbox roots once and reuse them every iteration
+    sandbox_pool = SandboxPool(project_root, num_workers)
+    if durations is None:
+        durations = QueryDurations()
+    improver = ThreadPoolExecutor(max_workers=max(1, candidates))
+
+    def propose(iteration: int, best: dict, prior_history: list[dict]) -> list:
+        """Start drafting `candidates` new descriptions from the best train results."""
         # Strip test scores from history so improvement model can't see them
         blinded_history = [
             {k: v for k, v in h.items() if not k.startswith("test_")}
-            for h in history
+            for h in prior_history
+        ]
+        return [
+            improver.submit(
+                improve_description,
+                skill_name=name,
+                skill_content=content,
+                current_description=best["description"],
+                eval_results=best,
+                history=blinded_history,
+                model=model,
+                log_dir=log_dir,
+                iteration=iteration,
+                candidate=j if multi else None,
+            )
+            for j in range(max(1, candidates))
         ]
-        new_description = improve_description(
-            skill_name=name,
-            skill_content=content,
-            current_description=current_description,
-            eval_results=train_results,
-            history=blinded_history,
-            model=model,
-            log_dir=log_dir,
-            iteration=iteration,
-        )
-        improve_elapsed = time.time() - t0
 
+    def collect(proposals: list) -> None:
+        if verbose:
+            print(f"\nImproving description...", file=sys.stderr)
+        t0 = time.time()
+        state["descriptions"] = list(dict.fromkeys(f.result() for f in proposals))
+        improve_elapsed = time.time() - t0
         if verbose:
-            print(f"Proposed ({improve_elapsed:.1f}s): {new_description}", file=sys.stderr)
+            for description in state["descriptions"]:
+                print(f"Proposed (+{improve_elapsed:.1f}s after eval): {description}", file=sys.stderr)
+        state["phase"] = "eval"
+        checkpoint()
+
+    try:
+        if state["phase"] == "improve":
+            # Interrupted between eval and improvement: redo just the improvement
+            round_entries = [h for h in history if h["iteration"] == state["iteration"]]
+            best_entry = max(round_entries, key=lambda h: h["train_passed"])
+            best = {
+                "description": best_entry["description"],
+                "results": best_entry["train_results"],
+                "summary": {
+                    "passed": best_entry["train_passed"],
+                    "failed": best_entry["train_failed"],
+                    "total": best_entry["train_total"],
+                },
+            }
+            collect(propose(state["iteration"], best, history))
 
-        current_description = new_description
+        for iteration in range(state["iteration"] + 1, max_iterations + 1):
+            if state["phase"] == "done":
+                break
+            descriptions = state["descriptions"]
+            if verbose:
+                print(f"\n{'='*60}", file=sys.stderr)
+                print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
+                for description in descriptions:
+                    print(f"Description: {description}", file=sys.stderr)
+                print(f"{'='*60}", file=sys.stderr)
+
+            proposals: list = []
+
+            def start_improving(train_outputs: dict[int, dict]) -> None:
+                # Called as soon as every surviving candidate has its train
+                # results, so improvement overlaps the remaining test queries.
+                round_entries = [
+                    build_history_entry(iteration, out["description"], out["results"], train_queries, False, j if multi else None)
+                    for j, out in train_outputs.items()
+                ]
+                best = max(train_outputs.values(), key=lambda out: out["summary"]["passed"])
+                if best["summary"]["failed"] == 0 or iteration == max_iterations:
+                    return
+                proposals.extend(propose(iteration, best, history + round_entries))
+
+            t0 = time.time()
+            outputs = run_eval_candidates(
+                eval_set=all_queries,
+                skill_name=name,
+                descriptions=descriptions,
+                timeout=timeout,
+                sandbox_pool=sandbox_pool,
+                runs_per_query=runs_per_query,
+                trigger_threshold=trigger_threshold,
+                model=model,
+                prune_queries=train_queries,
+                on_prune_queries_done=start_improving,
+                durations=durations,
+            )
+            eval_elapsed = time.time() - t0
+
+            round_entries = []
+            for j, out in enumerate(outputs):
+                if out.get("pruned"):
+                    pruned.append({"iteration": iteration, "candidate": j, "description": out["description"]})
+                    if verbose:
+                        print(f"Pruned candidate {j} early: {out['description'][:80]}", file=sys.stderr)
+                    continue
+                round_entries.append(build_history_entry(
+                    iteration, out["description"], out["results"], train_queries, bool(test_set), j if multi else None,
+                ))
+            history.extend(round_entries)
+
+            round_best = max(round_entries, key=lambda h: h["train_passed"])
+            state["iteration"] = iteration
+            state["current_description"] = round_best["description"]
+            state["phase"] = "improve"
+
+            if round_best["train_failed"] == 0:
+                state["exit_reason"] = f"all_passed (iteration {iteration})"
+                state["phase"] = "done"
+            elif iteration == max_iterations:
+                state["exit_reason"] = f"max_iterations ({max_iterations})"
+                state["phase"] = "done"
+            checkpoint()
+
+            if live_report:
+                live_report.append(round_entries, live_summary())
+
+            if verbose:
+                for entry, out in zip(round_entries, (o for o in outputs if not o.get("pruned"))):
+                    if len(round_entries) > 1:
+                        print(f"\nCandidate {entry['candidate']}: {entry['description'][:80]}", file=sys.stderr)
+                    print_eval_stats("Train", entry["train_results"], eval_elapsed)
+                    print(format_timing(out["summary"]["timing"]), file=sys.stderr)
+                    if test_set:
+                        print_eval_stats("Test ", entry["test_results"], 0)
+
+            if state["phase"] == "done":
+                if verbose and round_best["train_failed"] == 0:
+                    print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
+                elif verbose:
+                    print(f"\nMax iterations reached ({max_iterations}).", file=sys.stderr)
+                break
+
+            # Improvement was started from the train results; wait for it
+            collect(proposals)
+    finally:
+        improver.shutdown(wait=False, cancel_futures=True)
+        sandbox_pool.close()
+
+    exit_reason = state["exit_reason"]
+    current_description = state["current_description"]
 
     # Find the best iteration by TEST score (or train if no test set)
     if test_set:
@@ -225,40 +380,68 @@ def run_loop(
         print(f"\nExit reason: {exit_reason}", file=sys.stderr)
         print(f"Best score: {best_score} (iteration {best['iteration']})", file=sys.stderr)
 
-    return {
+    output = {
         "exit_reason": exit_reason,
-        "original_description": original_description,
+        "original_description": state["original_description"],
         "best_description": best["description"],
         "best_score": best_score,
         "best_train_score": f"{best['train_passed']}/{best['train_total']}",
         "best_test_score": f"{best['test_passed']}/{best['test_total']}" if test_set else None,
         "final_description": current_description,
-        "iterations_run": len(history),
-        "holdout": holdout,
+        "iterations_run": state["iteration"],
+        "candidates_per_iteration": candidates,
+        "pruned_candidates": pruned,
+        "holdout": state["holdout"],
         "train_size": len(train_set),
         "test_size": len(test_set),
         "history": history,
     }
+    if live_report:
+        live_report.finish(output)
+    return output
+
+
+# CLI options that may differ between the original run and a --resume
+RESUME_OVERRIDABLE_ARGS = {"resume", "num_workers", "verbose", "report"}
 
 
 def main():
     parser = argparse.ArgumentParser(description="Run eval + improve loop")
-    parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
-    parser.add_argument("--skill-path", required=True, help="Path to skill directory")
+    parser.add_argument("--eval-set", default=None, help="Path to eval set JSON file (required unless --resume)")
+    parser.add_argument("--skill-path", default=None, help="Path to skill directory (required unless --resume)")
     parser.add_argument("--description", default=None, help="Override starting description")
     parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout per query in seconds")
     parser.add_argument("--max-iterations", type=int, default=5, help="Max improvement iterations")
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
+    parser.add_argument("--candidates", type=int, default=1, help="Candidate descriptions to propose and evaluate in parallel per iteration (clear losers are pruned early)")
     parser.add_argument("--holdout", type=float, default=0.4, help="Fraction of eval set to hold out for testing (0 to disable)")
-    parser.add_argument("--model", required=True, help="Model for improvement")
+    parser.add_argument("--model", default=None, help="Model for improvement (required unless --resume)")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     parser.add_argument("--report", default="auto", help="Generate HTML report at this path (default: 'auto' for temp file, 'none' to disable)")
     parser.add_argument("--results-dir", default=None, help="Save all outputs (results.json, report.html, log.txt) to a timestamped subdirectory here")
+    parser.add_argument("--resume", default=None, metavar="RUN_DIR", help="Continue an interrupted run from its timestamped --results-dir subdirectory, reusing its settings, split and finished work")
     args = parser.parse_args()
 
-    eval_set = json.loads(Path(args.eval_set).read_text())
+    resume_state = None
+    if args.resume:
+        results_dir = Path(args.resume)
+        checkpoint_path = results_dir / "checkpoint.json"
+        if not checkpoint_path.exists():
+            print(f"Error: No checkpoint.json found in {results_dir}", file=sys.stderr)
+            sys.exit(1)
+        # Everything that shapes the results comes from the original run;
+        # only settings that don't change outcomes can differ on resume.
+        saved_args = json.loads((results_dir / "args.json").read_text())
+        for key, value in saved_args.items():
+            if key not in RESUME_OVERRIDABLE_ARGS:
+                setattr(args, key, value)
+        resume_state = json.loads(checkpoint_path.read_text())
+    elif not (args.eval_set and args.skill_path and args.model):
+        parser.error("--eval-set, --skill-path and --model are required (unless --resume)")
+
+    eval_set = json.loads(Path(args.eval_set).read_text()) if not resume_state else []
     skill_path = Path(args.skill_path)
 
     if not (skill_path / "SKILL.md").exists():
@@ -281,12 +464,21 @@ def main():
         live_report_path = None
 
     # Determine output directory (create before run_loop so logs can be written)
-    if args.results_dir:
+    # (a resumed run keeps writing into the directory it was resumed from)
+    if args.resume:
+        pass
+    elif args.results_dir:
         timestamp = time.strftime("%Y-%m-%d_%H%M%S")
         results_dir = Path(args.results_dir) / timestamp
         results_dir.mkdir(parents=True, exist_ok=True)
+        # Saved so --resume can restore the exact settings of this run
+        args.eval_set = str(Path(args.eval_set).resolve())
+        args.skill_path = str(skill_path.resolve())
+        (results_dir / "args.json").write_text(json.dumps(vars(args), indent=2))
+        checkpoint_path = results_dir / "checkpoint.json"
     else:
         results_dir = None
+        checkpoint_path = None
 
     log_dir = results_dir / "logs" if results_dir else None
 
@@ -304,6 +496,9 @@ def main():
         verbose=args.verbose,
         live_report_path=live_report_path,
         log_dir=log_dir,
+        candidates=args.candidates,
+        checkpoint_path=checkpoint_path,
+        resume_state=resume_state,
     )
 
     # Save JSON output
@@ -312,9 +507,8 @@ def main():
     if results_dir:
         (results_dir / "results.json").write_text(json_output)
 
-    # Write final HTML report (without auto-refresh)
+    # run_loop already replaced the live report with the final static one
     if live_report_path:
-        live_report_path.write_text(generate_html(output, auto_refresh=False, skill_name=name))
         print(f"\nReport: {live_report_path}", file=sys.stderr)
 
     if results_dir and live_report_path:
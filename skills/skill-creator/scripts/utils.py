@@ -1,47 +1,83 @@
 """Shared utilities for skill-creator scripts."""
 
+import os
+import re
 from pathlib import Path
 
+import yaml
+
+FRONTMATTER_RE = re.compile(r"^---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|$)", re.DOTALL)
+# libyaml's loader when PyYAML was built with it; several times faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class FrontmatterError(ValueError):
+    """A skill/command file whose frontmatter is missing or not a YAML mapping."""
+
+
+def claude_executable() -> str:
+    """The `claude` CLI to run. SKILL_CREATOR_CLAUDE overrides it, e.g. to
+    point the eval scripts at scripts/fake_claude.py for benchmarking."""
+    return os.environ.get("SKILL_CREATOR_CLAUDE", "claude")
 
 
 def parse_skill_md(skill_path: Path) -> tuple[str, str, str]:
     """Parse a SKILL.md file, returning (name, description, full_content)."""
-    content = (skill_path / "SKILL.md").read_text()
-    lines = content.split("\n")
-
-    if lines[0].strip() != "---":
-        raise ValueError("SKILL.md missing frontmatter (no opening ---)")
-
-    end_idx = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = i
-            break
-
-    if end_idx is None:
-        raise ValueError("SKILL.md missing frontmatter (no closing ---)")
-
-    name = ""
-    description = ""
-    frontmatter_lines = lines[1:end_idx]
-    i = 0
-    while i < len(frontmatter_lines):
-        line = frontmatter_lines[i]
-        if line.startswith("name:"):
-            name = line[len("name:"):].strip().strip('"').strip("'")
-        elif line.startswith("description:"):
-            value = line[len("description:"):].strip()
-            # Handle YAML multiline indicators (>, |, >-, |-)
-            if value in (">", "|", ">-", "|-"):
-                continuation_lines: list[str] = []
-                i += 1
-                while i < len(frontmatter_lines) and (frontmatter_lines[i].startswith("  ") or frontmatter_lines[i].startswith("\t")):
-                    continuation_lines.append(frontmatter_lines[i].strip())
-                    i += 1
-                description = " ".join(continuation_lines)
-                continue
-            else:
-                description = value.strip('"').strip("'")
-        i += 1
-
-    return name, description, content
+    return parse_skill_file(skill_path / "SKILL.md")
+
+
+def parse_frontmatter(content: str) -> dict:
+    """Parse the YAML frontmatter at the top of a skill/command file.
+
+    This is the one frontmatter parser the scripts share; raises
+    FrontmatterError with quick_validate's messages.
+    """
+    if not content.startswith("---"):
+        raise FrontmatterError("No YAML frontmatter found")
+    match = FRONTMATTER_RE.match(content)
+    if not match:
+        raise FrontmatterError("Invalid frontmatter format")
+    try:
+        frontmatter = yaml.load(match.group(1), Loader=_YAML_LOADER)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"Invalid YAML in frontmatter: {e}") from e
+    if not isinstance(frontmatter, dict):
+        raise FrontmatterError("Frontmatter must be a YAML dictionary")
+    return frontmatter
+
+
+def parse_skill_file(md_path: Path) -> tuple[str, str, str]:
+    """Parse any skill/command .md with frontmatter, returning (name, description, full_content)."""
+    content = md_path.read_text()
+    try:
+        frontmatter = parse_frontmatter(content)
+    except FrontmatterError as e:
+        raise FrontmatterError(f"{md_path.name}: {e}") from e
+    name = frontmatter.get("name")
+    description = frontmatter.get("description")
+    return (
+        "" if name is None else str(name).strip(),
+        "" if description is None else str(description).strip(),
+        content,
+    )
+
+
+def discover_skills(root: Path) -> list[Path]:
+    """Find skill files under root: <dir>/SKILL.md and flat <name>.md commands.
+
+    Flat .md files count only if they start with frontmatter, so READMEs
+    and reference docs are skipped. Workspace and hidden directories are
+    not searched.
+    """
+    found: list[Path] = []
+    for entry in sorted(Path(root).iterdir()):
+        if entry.name.startswith(".") or entry.name.endswith("-workspace"):
+            continue
+        if entry.is_dir():
+            if (entry / "SKILL.md").is_file():
+                found.append(entry / "SKILL.md")
+        elif entry.suffix == ".md" and entry.name != "SKILL.md":
+            with open(entry) as f:
+                if f.readline().strip() == "---":
+                    found.append(entry)
+    return found